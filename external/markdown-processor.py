@@ -19,13 +19,28 @@
         some code
         [/sourcecode]
 
+    All code blocks of a document are highlighted together, with one lexer
+    per language and one formatter.  The output is cached, so code blocks
+    that don't change are only highlighted once if the same extension
+    instance is used for several renders.  Documents with many code blocks
+    can be highlighted in a pool of worker processes::
+
+        extension = CodeBlockExtension(workers=4)
+
+    Call ``extension.highlighter.close()`` to stop the worker processes.
+
+    The highlighting doesn't depend on Markdown, so `CodeBlockHighlighter`
+    can also be used on its own.
+
     .. _Markdown: https://pypi.python.org/pypi/Markdown
 
     :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
     :license: BSD, see LICENSE for details.
 """
 
+import hashlib
 import re
+from collections import OrderedDict
 
 from markdown.preprocessors import Preprocessor
 from markdown.extensions import Extension
@@ -33,6 +48,7 @@ from markdown.extensions import Extension
 from pygments import highlight
 from pygments.formatters import HtmlFormatter
 from pygments.lexers import get_lexer_by_name, TextLexer
+from pygments.util import ClassNotFound
 
 
 # Options
@@ -41,26 +57,141 @@ from pygments.lexers import get_lexer_by_name, TextLexer
 # Set to True if you want inline CSS styles instead of classes
 INLINESTYLES = False
 
+# Number of highlighted code blocks to keep
+CACHE_SIZE = 1000
+
+# Minimal number of code blocks to be highlighted for the worker processes
+# to be used; starting them and sending them the code costs time too
+PARALLEL_THRESHOLD = 50
+
+
+def get_lexer(lang):
+    try:
+        return get_lexer_by_name(lang)
+    except ClassNotFound:
+        return TextLexer()
+
+
+def render_block(code, lexer, formatter):
+    code = highlight(code, lexer, formatter)
+    code = code.replace('\n\n', '\n&nbsp;\n').replace('\n', '<br />')
+    return f'\n\n<div class="code">{code}</div>\n\n'
+
+
+def render_group(lang, codes, formatter_options):
+    """Render code blocks of the same language in a worker process."""
+    lexer = get_lexer(lang)
+    formatter = HtmlFormatter(**formatter_options)
+    return [render_block(code, lexer, formatter) for code in codes]
+
+
+class CodeBlockHighlighter:
+    """
+    Render code blocks to HTML, grouped by language, and cache the results
+    by a hash of the language and the code.
+    """
+
+    def __init__(self, formatter_options=None, workers=0,
+                 cache_size=CACHE_SIZE):
+        if formatter_options is None:
+            formatter_options = {'noclasses': INLINESTYLES}
+        self.formatter_options = formatter_options
+        self.formatter = HtmlFormatter(**formatter_options)
+        self.workers = workers
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lexers = {}
+        self.executor = None
+
+    def render(self, blocks):
+        """
+        Render a list of ``(lang, code)`` pairs and return the list of the
+        HTML fragments.
+        """
+        results = [None] * len(blocks)
+        # code blocks to render, by language, and then by hash
+        groups = {}
+        for i, (lang, code) in enumerate(blocks):
+            key = hashlib.sha256(f'{lang}\0{code}'.encode('utf-8', 'surrogatepass')).digest()
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                results[i] = self.cache[key]
+            else:
+                group = groups.setdefault(lang, {})
+                group.setdefault(key, (code, []))[1].append(i)
+
+        for group, rendered in self._render_groups(groups):
+            for (key, (_, indices)), html in zip(group.items(), rendered):
+                for i in indices:
+                    results[i] = html
+                self.cache[key] = html
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return results
+
+    def _render_groups(self, groups):
+        """Yield ``(group, rendered)`` for each group of code blocks."""
+        if (self.workers > 1 and
+                sum(map(len, groups.values())) >= PARALLEL_THRESHOLD):
+            if self.executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self.executor = ProcessPoolExecutor(self.workers)
+            futures = [(group, self.executor.submit(
+                            render_group, lang, [code for code, _ in group.values()],
+                            self.formatter_options))
+                       for lang, group in groups.items()]
+            for group, future in futures:
+                yield group, future.result()
+            return
+        for lang, group in groups.items():
+            if lang not in self.lexers:
+                self.lexers[lang] = get_lexer(lang)
+            lexer = self.lexers[lang]
+            yield group, [render_block(code, lexer, self.formatter)
+                          for code, _ in group.values()]
+
+    def close(self):
+        """Stop the worker processes, if any were started."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
 
 class CodeBlockPreprocessor(Preprocessor):
 
     pattern = re.compile(r'\[sourcecode:(.+?)\](.+?)\[/sourcecode\]', re.S)
 
-    formatter = HtmlFormatter(noclasses=INLINESTYLES)
+    def __init__(self, md=None, highlighter=None):
+        super().__init__(md)
+        self.highlighter = highlighter or CodeBlockHighlighter()
 
     def run(self, lines):
-        def repl(m):
-            try:
-                lexer = get_lexer_by_name(m.group(1))
-            except ValueError:
-                lexer = TextLexer()
-            code = highlight(m.group(2), lexer, self.formatter)
-            code = code.replace('\n\n', '\n&nbsp;\n').replace('\n', '<br />')
-            return f'\n\n<div class="code">{code}</div>\n\n'
-        joined_lines = "\n".join(lines)
-        joined_lines = self.pattern.sub(repl, joined_lines)
-        return joined_lines.split("\n")
+        text = "\n".join(lines)
+        matches = list(self.pattern.finditer(text))
+        if not matches:
+            return lines
+        rendered = self.highlighter.render([m.groups() for m in matches])
+        parts = []
+        pos = 0
+        for match, html in zip(matches, rendered):
+            parts.append(text[pos:match.start()])
+            parts.append(html)
+            pos = match.end()
+        parts.append(text[pos:])
+        return "".join(parts).split("\n")
 
 class CodeBlockExtension(Extension):
-    def extendMarkdown(self, md, md_globals):
-        md.preprocessors.add('CodeBlockPreprocessor', CodeBlockPreprocessor(), '_begin')
+    def __init__(self, **kwargs):
+        self.config = {
+            'workers': [0, 'Number of worker processes for large documents'],
+            'cache_size': [CACHE_SIZE, 'Number of highlighted code blocks to keep'],
+        }
+        super().__init__(**kwargs)
+        self.highlighter = CodeBlockHighlighter(
+            workers=self.getConfig('workers'),
+            cache_size=self.getConfig('cache_size'))
+
+    def extendMarkdown(self, md):
+        # run before all other preprocessors
+        md.preprocessors.register(
+            CodeBlockPreprocessor(md, self.highlighter), 'pygments_codeblock', 100)
@@ -0,0 +1,163 @@
+"""
+    pygments.aio
+    ~~~~~~~~~~~~
+
+    Highlighting from asyncio code without blocking the event loop.
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO, BytesIO
+
+from pygments import highlight, lex
+
+__all__ = ['highlight_async', 'highlight_stream']
+
+#: Default number of tokens after which `highlight_stream` hands the
+#: output formatted so far to the event loop.
+DEFAULT_CHUNK_TOKENS = 1000
+
+
+class _Cancelled(Exception):
+    """Raised in the worker thread to abandon highlighting."""
+
+
+def _checked(tokens, cancelled, every=100):
+    """Yield from `tokens`, stopping if the `cancelled` event is set."""
+    for i, token in enumerate(tokens):
+        if i % every == 0 and cancelled.is_set():
+            raise _Cancelled
+        yield token
+
+
+def _highlight_checked(code, lexer, formatter, cancelled):
+    realoutfile = getattr(formatter, 'encoding', None) and BytesIO() or StringIO()
+    formatter.format(_checked(lex(code, lexer), cancelled), realoutfile)
+    return realoutfile.getvalue()
+
+
+async def highlight_async(code, lexer, formatter, *, executor=None,
+                          timeout=None):
+    """
+    Like :func:`pygments.highlight` without `outfile`, but run lexing and
+    formatting in `executor` (by default, the event loop's default
+    executor) and return the result asynchronously.
+
+    If `timeout` is given and highlighting takes longer than that many
+    seconds, :exc:`asyncio.TimeoutError` is raised.  When the task is
+    cancelled or times out, highlighting in a thread stops at the next
+    check of the token stream.  With a
+    :class:`~concurrent.futures.ProcessPoolExecutor`, `lexer` and
+    `formatter` must be picklable, and the worker process can't be stopped
+    early.
+
+    .. versionadded:: 2.20
+    """
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        future = loop.run_in_executor(executor, highlight, code, lexer,
+                                      formatter)
+        return await asyncio.wait_for(future, timeout)
+
+    cancelled = threading.Event()
+    future = loop.run_in_executor(executor, _highlight_checked, code, lexer,
+                                  formatter, cancelled)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        cancelled.set()
+        raise
+
+
+class _ChunkWriter:
+    """File-like object collecting output until `send_chunk` is called."""
+
+    def __init__(self, send):
+        self._send = send
+        self._parts = []
+
+    def write(self, text):
+        self._parts.append(text)
+
+    def flush(self):
+        pass
+
+    def send_chunk(self):
+        if self._parts:
+            parts, self._parts = self._parts, []
+            self._send(parts[0][:0].join(parts))
+
+
+async def highlight_stream(code, lexer, formatter, *, executor=None,
+                           chunk_tokens=DEFAULT_CHUNK_TOKENS, max_pending=4):
+    """
+    Asynchronously iterate over the output of highlighting `code` with
+    `lexer` and `formatter`, e.g. to stream it to a client::
+
+        async for chunk in highlight_stream(code, lexer, formatter):
+            await response.write(chunk)
+
+    Lexing and formatting run in a thread of `executor` (by default, the
+    event loop's default executor).  The output formatted so far is handed
+    to the event loop every `chunk_tokens` tokens; since formatters may
+    buffer output, chunks can be of very different sizes.  At most
+    `max_pending` chunks are queued; if the consumer is slower, the worker
+    waits.  When the iteration is stopped early, the worker stops as well.
+
+    The chunks are strings, or bytes if the formatter has an encoding set.
+    Process pool executors are not supported.
+
+    .. versionadded:: 2.20
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        raise TypeError('highlight_stream() needs a thread-based executor')
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(max_pending)
+    cancelled = threading.Event()
+    done = object()
+
+    def send(item):
+        if cancelled.is_set():
+            raise _Cancelled
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def worker():
+        writer = _ChunkWriter(send)
+
+        def tokens():
+            for i, token in enumerate(lex(code, lexer), 1):
+                yield token
+                if i % chunk_tokens == 0:
+                    writer.send_chunk()
+
+        try:
+            formatter.format(tokens(), writer)
+            writer.send_chunk()
+            send(done)
+        except _Cancelled:
+            pass
+        except BaseException as err:
+            try:
+                send(err)
+            except _Cancelled:
+                pass
+
+    future = loop.run_in_executor(executor, worker)
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+        # make room for a chunk the worker may be waiting to queue
+        while not queue.empty():
+            queue.get_nowait()
+        await future
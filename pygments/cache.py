@@ -0,0 +1,181 @@
+"""
+    pygments.cache
+    ~~~~~~~~~~~~~~
+
+    On-disk cache for highlighted output.
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+import hashlib
+import tempfile
+from io import StringIO, BytesIO
+
+from pygments import __version__, highlight
+
+__all__ = ['HighlightCache']
+
+#: Default upper bound for the total size of a cache directory, in bytes.
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+_SUFFIX = '.out'
+
+
+def _qualname(cls):
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+class HighlightCache:
+    """
+    Cache the output of :func:`pygments.highlight` in the directory
+    `directory`, which is created if necessary.
+
+    Entries are keyed by a hash of the input, the lexer class and its
+    options fingerprint (see :meth:`.Lexer.get_options_fingerprint`), the
+    formatter class and its options fingerprint (see
+    :meth:`.Formatter.get_options_fingerprint`), the style class and the
+    output encoding.  The Pygments version is part of the key as well, so
+    upgrading Pygments never returns stale output.
+
+    Once the total size of the cached files exceeds `max_size` bytes, the
+    least recently used entries are removed.  Several processes may share
+    the same directory.
+
+    .. versionadded:: 2.20
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self._size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, code, lexer, formatter):
+        """
+        Return the cache key for highlighting `code` with `lexer` and
+        `formatter`, or ``None`` if the output of this combination can't be
+        cached.
+        """
+        formatter_fp = formatter.get_options_fingerprint()
+        lexer_fp = lexer.get_options_fingerprint()
+        if formatter_fp is None or lexer_fp is None:
+            return None
+        if isinstance(code, str):
+            code_hash = hashlib.sha256(code.encode('utf-8', 'surrogatepass'))
+            kind = 'str'
+        else:
+            code_hash = hashlib.sha256(code)
+            kind = 'bytes'
+        style = getattr(formatter, 'style', None)
+        if isinstance(style, type):
+            style = _qualname(style)
+        key = (__version__, kind, code_hash.hexdigest(),
+               _qualname(type(lexer)), lexer_fp,
+               _qualname(type(formatter)), formatter_fp, style,
+               getattr(formatter, 'encoding', None))
+        return hashlib.sha256(repr(key).encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key):
+        """
+        Return the cached output bytes for `key`, or ``None`` if there is
+        no such entry.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fp:
+                data = fp.read()
+        except OSError:
+            return None
+        try:
+            # mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def set(self, key, data):
+        """Store the output bytes `data` under `key`."""
+        fd, tmpname = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmpname, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+            raise
+        if self._size is not None:
+            self._size += len(data)
+        if self._size is None or self._size > self.max_size:
+            self._evict()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for entry in self._entries():
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+        self._size = 0
+
+    def _entries(self):
+        with os.scandir(self.directory) as it:
+            return [entry for entry in it if entry.name.endswith(_SUFFIX)]
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits."""
+        files = []
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, entry.path))
+        size = sum(item[1] for item in files)
+        if size > self.max_size:
+            files.sort()
+            for _, filesize, path in files:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                size -= filesize
+                if size <= self.max_size:
+                    break
+        self._size = size
+
+    def highlight(self, code, lexer, formatter, outfile=None):
+        """
+        Like :func:`pygments.highlight`, but return the output from the
+        cache if possible, and store it otherwise.
+        """
+        key = self.get_key(code, lexer, formatter)
+        if key is None:
+            return highlight(code, lexer, formatter, outfile)
+
+        encoding = getattr(formatter, 'encoding', None)
+        data = self.get(key)
+        if data is None:
+            realoutfile = encoding and BytesIO() or StringIO()
+            highlight(code, lexer, formatter, realoutfile)
+            result = realoutfile.getvalue()
+            if encoding:
+                data = result
+            else:
+                data = result.encode('utf-8', 'surrogatepass')
+            self.set(key, data)
+        elif encoding:
+            result = data
+        else:
+            result = data.decode('utf-8', 'surrogatepass')
+
+        if not outfile:
+            return result
+        outfile.write(result)
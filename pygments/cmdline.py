@@ -14,19 +14,17 @@ import shutil
 import argparse
 from textwrap import dedent
 
-from pygments import __version__, highlight
+from pygments import __version__, highlight, format
 from pygments.util import ClassNotFound, OptionError, docstring_headline, \
-    guess_decode, guess_decode_from_terminal, terminal_encoding, \
-    UnclosingTextIOWrapper
+    guess_decode, guess_decode_from_terminal, guess_encoding, \
+    terminal_encoding, UnclosingTextIOWrapper
+# These packages only load their lexers, formatters and styles on demand.
+# Everything else, e.g. the builtin filters or the terminal formatters, is
+# imported where it is needed, so that pygmentize starts quickly.
 from pygments.lexers import get_all_lexers, get_lexer_by_name, guess_lexer, \
     load_lexer_from_file, get_lexer_for_filename, find_lexer_class_for_filename
-from pygments.lexers.special import TextLexer
-from pygments.formatters.latex import LatexEmbeddedLexer, LatexFormatter
 from pygments.formatters import get_all_formatters, get_formatter_by_name, \
     load_formatter_from_file, get_formatter_for_filename, find_formatter_class
-from pygments.formatters.terminal import TerminalFormatter
-from pygments.formatters.terminal256 import Terminal256Formatter, TerminalTrueColorFormatter
-from pygments.filters import get_all_filters, find_filter_class
 from pygments.styles import get_all_styles, get_style_by_name
 
 
@@ -65,6 +63,7 @@ def _parse_filters(f_strs):
 
 
 def _print_help(what, name):
+    from pygments.filters import find_filter_class
     try:
         if what == 'lexer':
             cls = get_lexer_by_name(name)
@@ -119,6 +118,7 @@ def _print_list(what):
         print("Filters:")
         print("~~~~~~~~")
 
+        from pygments.filters import get_all_filters, find_filter_class
         for name in get_all_filters():
             cls = find_filter_class(name)
             print("* " + name + ':')
@@ -160,6 +160,7 @@ def _print_list_as_json(requested_items):
         result['formatters'] = info
 
     if 'filter' in requested_items:
+        from pygments.filters import get_all_filters, find_filter_class
         info = {}
         for name in get_all_filters():
             cls = find_filter_class(name)
@@ -254,6 +255,7 @@ def main_inner(parser, argns):
     if argns.N:
         lexer = find_lexer_class_for_filename(argns.N)
         if lexer is None:
+            from pygments.lexers.special import TextLexer
             lexer = TextLexer
 
         print(lexer.aliases[0])
@@ -265,6 +267,7 @@ def main_inner(parser, argns):
         try:
             lexer = guess_lexer(inp, inencoding=inencoding)
         except ClassNotFound:
+            from pygments.lexers.special import TextLexer
             lexer = TextLexer
 
         print(lexer.aliases[0])
@@ -347,14 +350,29 @@ def main_inner(parser, argns):
             return 2
 
         infn = argns.INPUTFILE
-        try:
-            with open(infn, 'rb') as infp:
-                code = infp.read()
-        except Exception as err:
-            print('Error: cannot read infile:', err, file=sys.stderr)
-            return 1
-        if not inencoding:
-            code, inencoding = guess_decode(code)
+        if lexer and lexer.linewise and not argns.cache_dir and \
+           not parsed_opts.get('escapeinside'):
+            # the lexer reads the file in chunks while highlighting, so
+            # that it doesn't have to fit into memory
+            try:
+                if not inencoding:
+                    with open(infn, 'rb') as infp:
+                        inencoding = guess_encoding(infp)
+                    lexer.encoding = inencoding
+                elif not os.access(infn, os.R_OK):
+                    raise OSError(f'{infn} is not readable')
+            except Exception as err:
+                print('Error: cannot read infile:', err, file=sys.stderr)
+                return 1
+        else:
+            try:
+                with open(infn, 'rb') as infp:
+                    code = infp.read()
+            except Exception as err:
+                print('Error: cannot read infile:', err, file=sys.stderr)
+                return 1
+            if not inencoding:
+                code, inencoding = guess_decode(code)
 
         # do we have to guess the lexer?
         if not lexer:
@@ -365,6 +383,7 @@ def main_inner(parser, argns):
                     try:
                         lexer = guess_lexer(code, **parsed_opts)
                     except ClassNotFound:
+                        from pygments.lexers.special import TextLexer
                         lexer = TextLexer(**parsed_opts)
                 else:
                     print('Error:', err, file=sys.stderr)
@@ -384,6 +403,7 @@ def main_inner(parser, argns):
             try:
                 lexer = guess_lexer(code, **parsed_opts)
             except ClassNotFound:
+                from pygments.lexers.special import TextLexer
                 lexer = TextLexer(**parsed_opts)
 
     else:  # -s option needs a lexer with -l
@@ -446,10 +466,15 @@ def main_inner(parser, argns):
     else:
         if not fmter:
             if os.environ.get('COLORTERM','') in ('truecolor', '24bit'):
+                from pygments.formatters.terminal256 import \
+                    TerminalTrueColorFormatter
                 fmter = TerminalTrueColorFormatter(**parsed_opts)
             elif '256' in os.environ.get('TERM', ''):
+                from pygments.formatters.terminal256 import \
+                    Terminal256Formatter
                 fmter = Terminal256Formatter(**parsed_opts)
             else:
+                from pygments.formatters.terminal import TerminalFormatter
                 fmter = TerminalFormatter(**parsed_opts)
         outfile = sys.stdout.buffer
 
@@ -480,16 +505,27 @@ def main_inner(parser, argns):
     # specified, we need a special lexer which collects escaped text
     # before running the chosen language lexer.
     escapeinside = parsed_opts.get('escapeinside', '')
-    if len(escapeinside) == 2 and isinstance(fmter, LatexFormatter):
-        left = escapeinside[0]
-        right = escapeinside[1]
-        lexer = LatexEmbeddedLexer(left, right, lexer)
+    if len(escapeinside) == 2:
+        from pygments.formatters.latex import LatexEmbeddedLexer, \
+            LatexFormatter
+        if isinstance(fmter, LatexFormatter):
+            left = escapeinside[0]
+            right = escapeinside[1]
+            lexer = LatexEmbeddedLexer(left, right, lexer)
 
     # ... and do it!
     if not argns.s:
         # process whole input as per normal...
         try:
-            highlight(code, lexer, fmter, outfile)
+            if code is None:
+                format(lexer.get_tokens_from_file(argns.INPUTFILE), fmter,
+                       outfile)
+            elif argns.cache_dir:
+                from pygments.cache import HighlightCache
+                cache = HighlightCache(argns.cache_dir)
+                cache.highlight(code, lexer, fmter, outfile)
+            else:
+                highlight(code, lexer, fmter, outfile)
         finally:
             if outfn:
                 outfile.close()
@@ -592,6 +628,11 @@ def main(args=sys.argv):
         'specify your own class name with a colon (`-l ./lexer.py:MyLexer`). '
         'Users should be very careful not to use this option with untrusted '
         'files, because it will import and run them.')
+    flags.add_argument(
+        '--cache-dir', metavar='DIRECTORY',
+        help='Cache the highlighted output in the given directory and reuse '
+        'it when the same input is highlighted again with the same lexer, '
+        'formatter and options.  Not used together with -s.')
     flags.add_argument('--json', help='Output as JSON. This can '
         'be only used in conjunction with -L.',
         default=False,
@@ -8,6 +8,8 @@
     :license: BSD, see LICENSE for details.
 """
 
+import re
+
 
 def apply_filters(stream, filters, lexer=None):
     """
@@ -17,11 +19,38 @@ def apply_filters(stream, filters, lexer=None):
     """
     def _apply(filter_, stream):
         yield from filter_.filter(lexer, stream)
-    for filter_ in filters:
+    for filter_ in _merge_split_filters(filters):
         stream = _apply(filter_, stream)
     return stream
 
 
+def _merge_split_filters(filters):
+    """
+    Return a list of `filters` where runs of consecutive split filters are
+    replaced by a single filter that handles them in one pass.
+    """
+    result = []
+    run = []
+    for filter_ in filters:
+        if isinstance(filter_, SplitFilter) and filter_.mergeable:
+            # the combined expression is matched against the whole token
+            # value, but the filters after the first one only see the parts
+            # that the earlier ones left, so an expression that looks at the
+            # surrounding text has to start a new run
+            if run and _depends_on_context(filter_.regex):
+                result.append(_MergedSplitFilter(run))
+                run = []
+            run.append(filter_)
+            continue
+        if run:
+            result.append(_MergedSplitFilter(run))
+            run = []
+        result.append(filter_)
+    if run:
+        result.append(_MergedSplitFilter(run))
+    return result
+
+
 def simplefilter(f):
     """
     Decorator that converts a function into a filter::
@@ -68,3 +97,148 @@ class FunctionFilter(Filter):
     def filter(self, lexer, stream):
         # pylint: disable=not-callable
         yield from self.function(lexer, stream, self.options)
+
+
+class SplitFilter(Filter):
+    """
+    Abstract class for filters that split token values at the matches of
+    the regular expression `regex` and give the matched text a new token
+    type and value.  Subclasses set `regex` and implement `replace`, and
+    `applies_to` if not all token types are filtered.
+
+    Consecutive split filters of a lexer are merged and scan each value
+    only once, with a single expression combining theirs.  This gives the
+    same result as applying them one after the other as long as the
+    expressions of the merged filters can't match overlapping text; a
+    filter that can't guarantee this sets `mergeable` to false.  An
+    expression with anchors, word boundaries or lookaround assertions
+    depends on the text around its matches, which differs once earlier
+    filters have split the value, so such a filter is only merged with the
+    ones after it.  `regex` must not contain numbered backreferences.
+
+    .. versionadded:: 2.20
+    """
+    regex = None
+    mergeable = True
+
+    def applies_to(self, ttype):
+        """Return whether tokens of type `ttype` are filtered."""
+        return True
+
+    def replace(self, ttype, text):
+        """
+        Return the ``(ttype, text)`` token that replaces the match `text`
+        in a token of type `ttype`.  The result is reused for further
+        matches of the same text in tokens of the same type.
+        """
+        raise NotImplementedError()
+
+    def filter(self, lexer, stream):
+        return _MergedSplitFilter([self]).filter(lexer, stream)
+
+
+_pattern_token_re = re.compile(
+    r'\\.|\[\^?\]?(?:\\.|[^\]\\])*\]|\(\?<?[=!]|.', re.DOTALL)
+_context_tokens = {'\\b', '\\B', '\\A', '\\Z', '^', '$',
+                   '(?=', '(?!', '(?<=', '(?<!'}
+
+
+def _depends_on_context(regex):
+    """
+    Return whether `regex` contains anchors, word boundaries or lookaround
+    assertions, whose matches depend on the text around them.
+    """
+    return any(token in _context_tokens
+               for token in _pattern_token_re.findall(regex.pattern))
+
+
+def _scoped_pattern(regex):
+    flags = ''.join(flag for flag, value in (('i', re.IGNORECASE),
+                                             ('m', re.MULTILINE),
+                                             ('s', re.DOTALL),
+                                             ('x', re.VERBOSE))
+                    if regex.flags & value)
+    if flags:
+        return f'(?{flags}:{regex.pattern})'
+    return regex.pattern
+
+
+class _MergedSplitFilter(Filter):
+    """
+    Apply a list of split filters with one combined regular expression
+    per token type.  Which of the filters apply to a token type is only
+    checked once, and tokens that none of them applies to are passed on
+    unchanged.
+
+    The text of a match is handed on to the filters after the one that
+    matched, as if they had been applied one after the other.
+    """
+
+    def __init__(self, filters, **options):
+        Filter.__init__(self, **options)
+        self.filters = list(filters)
+        # one cache per filter index: token type -> ``(finditer, handlers,
+        # single)`` for the filters from that index on, or None if none of them
+        # applies to the token type
+        self._plans = [{} for _ in self.filters]
+
+    def _get_plan(self, start, ttype):
+        filters = self.filters
+        active = [i for i in range(start, len(filters))
+                  if filters[i].applies_to(ttype)]
+        if not active:
+            plan = None
+        else:
+            regex = re.compile('|'.join(
+                f'(?P<_{i}>{_scoped_pattern(filters[i].regex)})'
+                for i in active))
+            # group name -> (matched text -> replacement token, replace
+            # method, index of the next filter)
+            handlers = {f'_{i}': ({}, filters[i].replace,
+                                  i + 1 if i + 1 < len(filters) else None)
+                        for i in active}
+            # with a single filter, there's no need to look at the groups
+            single = handlers.popitem()[1] if len(handlers) == 1 else None
+            plan = regex.finditer, handlers, single
+        self._plans[start][ttype] = plan
+        return plan
+
+    def _split(self, ttype, value, plan):
+        finditer, handlers, single = plan
+        last = 0
+        for match in finditer(value):
+            begin, end = match.span()
+            if begin != last:
+                yield ttype, value[last:begin]
+            replaced, replace, following = single or handlers[match.lastgroup]
+            text = value[begin:end]
+            token = replaced.get(text)
+            if token is None:
+                token = replaced[text] = replace(ttype, text)
+            if following is None:
+                yield token
+            else:
+                newtype, text = token
+                newplan = self._plans[following].get(newtype, False)
+                if newplan is False:
+                    newplan = self._get_plan(following, newtype)
+                if newplan is None:
+                    yield token
+                else:
+                    yield from self._split(newtype, text, newplan)
+            last = end
+        if last != len(value):
+            yield ttype, value[last:]
+
+    def filter(self, lexer, stream):
+        plans = self._plans[0]
+        get_plan = self._get_plan
+        split = self._split
+        for ttype, value in stream:
+            plan = plans.get(ttype, False)
+            if plan is False:
+                plan = get_plan(0, ttype)
+            if plan is None:
+                yield ttype, value
+            else:
+                yield from split(ttype, value, plan)
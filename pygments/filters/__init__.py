@@ -13,7 +13,7 @@ import re
 
 from pygments.token import String, Comment, Keyword, Name, Error, Whitespace, \
     string_to_tokentype
-from pygments.filter import Filter
+from pygments.filter import Filter, SplitFilter
 from pygments.util import get_list_opt, get_int_opt, get_bool_opt, \
     get_choice_opt, ClassNotFound, OptionError
 from pygments.plugin import find_plugin_filters
@@ -49,20 +49,7 @@ def get_all_filters():
         yield name
 
 
-def _replace_special(ttype, value, regex, specialttype,
-                     replacefunc=lambda x: x):
-    last = 0
-    for match in regex.finditer(value):
-        start, end = match.start(), match.end()
-        if start != last:
-            yield ttype, value[last:start]
-        yield specialttype, replacefunc(value[start:end])
-        last = end
-    if last != len(value):
-        yield ttype, value[last:]
-
-
-class CodeTagFilter(Filter):
+class CodeTagFilter(SplitFilter):
     """Highlight special code tags in comments and docstrings.
 
     Options accepted:
@@ -79,19 +66,20 @@ class CodeTagFilter(Filter):
         Filter.__init__(self, **options)
         tags = get_list_opt(options, 'codetags',
                             ['XXX', 'TODO', 'FIXME', 'BUG', 'NOTE'])
-        self.tag_re = re.compile(r'\b({})\b'.format('|'.join([
+        self.tag_re = self.regex = re.compile(r'\b({})\b'.format('|'.join([
             re.escape(tag) for tag in tags if tag
         ])))
+        # tags containing whitespace could overlap matches of other filters,
+        # e.g. the `VisibleWhitespaceFilter`
+        self.mergeable = not any(char.isspace() for tag in tags
+                                 for char in tag)
 
-    def filter(self, lexer, stream):
-        regex = self.tag_re
-        for ttype, value in stream:
-            if ttype in String.Doc or \
-               ttype in Comment and \
-               ttype not in Comment.Preproc:
-                yield from _replace_special(ttype, value, regex, Comment.Special)
-            else:
-                yield ttype, value
+    def applies_to(self, ttype):
+        return ttype in String.Doc or \
+            ttype in Comment and ttype not in Comment.Preproc
+
+    def replace(self, ttype, text):
+        return Comment.Special, text
 
 
 class SymbolFilter(Filter):
@@ -786,7 +774,7 @@ class RaiseOnErrorTokenFilter(Filter):
             yield ttype, value
 
 
-class VisibleWhitespaceFilter(Filter):
+class VisibleWhitespaceFilter(SplitFilter):
     """Convert tabs, newlines and/or spaces to visible characters.
 
     Options accepted:
@@ -816,6 +804,8 @@ class VisibleWhitespaceFilter(Filter):
     .. versionadded:: 0.8
     """
 
+    regex = re.compile(r'\s')
+
     def __init__(self, **options):
         Filter.__init__(self, **options)
         for name, default in [('spaces',   '·'),
@@ -832,26 +822,18 @@ class VisibleWhitespaceFilter(Filter):
         if self.newlines:
             self.newlines += '\n'
         self.wstt = get_bool_opt(options, 'wstokentype', True)
+        # in wstokentype mode, whitespace is split off into separate tokens
+        self.mergeable = self.wstt
+        self._replacements = {' ': self.spaces or ' ',
+                              '\t': self.tabs or '\t',
+                              '\n': self.newlines or '\n'}
+
+    def replace(self, ttype, text):
+        return Whitespace, self._replacements.get(text, text)
 
     def filter(self, lexer, stream):
         if self.wstt:
-            spaces = self.spaces or ' '
-            tabs = self.tabs or '\t'
-            newlines = self.newlines or '\n'
-            regex = re.compile(r'\s')
-
-            def replacefunc(wschar):
-                if wschar == ' ':
-                    return spaces
-                elif wschar == '\t':
-                    return tabs
-                elif wschar == '\n':
-                    return newlines
-                return wschar
-
-            for ttype, value in stream:
-                yield from _replace_special(ttype, value, regex, Whitespace,
-                                            replacefunc)
+            yield from SplitFilter.filter(self, lexer, stream)
         else:
             spaces, tabs, newlines = self.spaces, self.tabs, self.newlines
             # simpler processing
@@ -893,6 +875,14 @@ class GobbleFilter(Filter):
         n = self.n
         left = n  # How many characters left to gobble.
         for ttype, value in stream:
+            if '\n' not in value:
+                # no line starts in this token, so only gobble what is left
+                # of the current line
+                if left:
+                    value, left = self.gobble(value, left)
+                if value != '':
+                    yield ttype, value
+                continue
             # Remove ``left`` tokens from first line, ``n`` from all others.
             parts = value.split('\n')
             (parts[0], left) = self.gobble(parts[0], left)
@@ -916,15 +906,26 @@ class TokenMergeFilter(Filter):
     def filter(self, lexer, stream):
         current_type = None
         current_value = None
+        # all values of the current run once it has more than one, joined
+        # when it ends
+        current_values = None
         for ttype, value in stream:
             if ttype is current_type:
-                current_value += value
+                if current_values is None:
+                    current_values = [current_value, value]
+                else:
+                    current_values.append(value)
             else:
                 if current_type is not None:
+                    if current_values is not None:
+                        current_value = ''.join(current_values)
                     yield current_type, current_value
                 current_type = ttype
                 current_value = value
+                current_values = None
         if current_type is not None:
+            if current_values is not None:
+                current_value = ''.join(current_values)
             yield current_type, current_value
 
 
@@ -9,11 +9,22 @@
 """
 
 import codecs
+import itertools
+import threading
 
-from pygments.util import get_bool_opt
+from pygments.util import get_bool_opt, options_fingerprint
 from pygments.styles import get_style_by_name
 
-__all__ = ['Formatter']
+__all__ = ['Formatter', 'EscapeCache']
+
+#: Number of tokens after which the text collected from a formatter with an
+#: output encoding is encoded and written.
+ENCODE_CHUNK_TOKENS = 4096
+
+#: Maximum number of compiled style tables kept in `_compiled_styles`.
+_COMPILED_STYLES_MAX = 256
+_compiled_styles = {}
+_compiled_styles_lock = threading.Lock()
 
 
 def _lookup_style(style):
@@ -22,6 +33,120 @@ def _lookup_style(style):
     return style
 
 
+class EscapeCache(dict):
+    """
+    Cache for the escaped forms of the token values of one formatting run:
+    ``cache[value]`` returns ``escape(value)``.
+
+    Values that were escaped before are found with a plain dict lookup.
+    Values longer than `max_length` characters are escaped but not stored,
+    and at most `max_size` values are stored, so that the cache stays small
+    for input without many repeated lexemes.
+
+    `misses` counts the calls of `escape`.  Formatters add the number of
+    lookups to `lookups` at the end of a run, which gives `hits` and
+    `hit_rate`; they keep the cache of the last run in their
+    ``escape_cache`` attribute.
+
+    .. versionadded:: 2.20
+    """
+
+    def __init__(self, escape, max_length=64, max_size=8192):
+        dict.__init__(self)
+        self.escape = escape
+        self.max_length = max_length
+        self.max_size = max_size
+        self.lookups = 0
+        self.misses = 0
+
+    def __missing__(self, value):
+        self.misses += 1
+        result = self.escape(value)
+        if len(value) <= self.max_length and len(self) < self.max_size:
+            self[value] = result
+        return result
+
+    @property
+    def hits(self):
+        return self.lookups - self.misses
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups that were answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class _EncodingWriter:
+    """
+    Wrapper for a binary file that encodes the text written to it.
+
+    Writing only collects the text (`write` is the ``append`` method of a
+    list, so it's as cheap as possible); it is encoded and written in chunks
+    by `write_pending`, which is much faster than encoding each of the
+    usually small pieces formatters write separately.  Other attributes are
+    taken from the wrapped file.
+    """
+
+    def __init__(self, stream, encoding):
+        self.stream = stream
+        self._encode = codecs.getincrementalencoder(encoding)().encode
+        self._parts = []
+        self.write = self._parts.append
+        self.writelines = self._parts.extend
+
+    def write_pending(self, final=False):
+        if self._parts or final:
+            text = ''.join(self._parts)
+            # clear first, so that text that can't be encoded isn't retried
+            self._parts.clear()
+            data = self._encode(text, final)
+            if data:
+                self.stream.write(data)
+
+    def chunked(self, tokensource):
+        """
+        Return an iterator over `tokensource` that writes the collected text
+        every `ENCODE_CHUNK_TOKENS` tokens.
+        """
+        return itertools.chain.from_iterable(self._chunks(iter(tokensource)))
+
+    def _chunks(self, tokens):
+        while True:
+            chunk = list(itertools.islice(tokens, ENCODE_CHUNK_TOKENS))
+            if not chunk:
+                return
+            yield chunk
+            # the formatter has consumed the chunk
+            self.write_pending()
+
+    def flush(self):
+        self.write_pending()
+        if hasattr(self.stream, 'flush'):
+            self.stream.flush()
+
+    def close(self):
+        """Write the remaining text, without closing the wrapped file."""
+        self.write_pending(final=True)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class _ChunkedTokenList(list):
+    """
+    Copy of a token list whose iterators write the text collected by an
+    `_EncodingWriter` in chunks, like `_EncodingWriter.chunked`.  It is
+    still a list, for the formatters that need to know that.
+    """
+
+    def __init__(self, tokens, writer):
+        super().__init__(tokens)
+        self._writer = writer
+
+    def __iter__(self):
+        return self._writer.chunked(list.__iter__(self))
+
+
 class Formatter:
     """
     Converts a token stream to text.
@@ -111,6 +236,58 @@ class Formatter:
         """
         return ''
 
+    def get_options_fingerprint(self):
+        """
+        Return a hashable value that identifies all options affecting the
+        output of this formatter.  Two instances of the same formatter class
+        with the same style, encoding and fingerprint must produce identical
+        output for identical input; this is used by :mod:`pygments.cache`.
+
+        The default implementation fingerprints the options given to the
+        constructor.  Formatters that accept several spellings of the same
+        option should override this and normalize them.  If the output can't
+        be cached at all (e.g. because formatting has side effects), return
+        ``None``.
+
+        .. versionadded:: 2.20
+        """
+        return options_fingerprint(self.options)
+
+    def _get_style_key(self):
+        """
+        Return a tuple of the option values that, together with the
+        formatter class and the style, determine the result of
+        :meth:`_compile_style`.
+        """
+        return ()
+
+    def _compile_style(self):
+        """
+        Build and return the tables this formatter derives from its style.
+        The result is shared between formatter instances and must not be
+        modified.
+        """
+        return None
+
+    def _get_compiled_style(self):
+        """
+        Return the result of :meth:`_compile_style`.  It is only computed
+        once per process for each formatter class, style and style key.
+        """
+        key = (type(self), self.style) + self._get_style_key()
+        try:
+            return _compiled_styles[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable option value
+            return self._compile_style()
+        compiled = self._compile_style()
+        with _compiled_styles_lock:
+            if len(_compiled_styles) >= _COMPILED_STYLES_MAX:
+                del _compiled_styles[next(iter(_compiled_styles))]
+            return _compiled_styles.setdefault(key, compiled)
+
     def format(self, tokensource, outfile):
         """
         This method must format the tokens from the `tokensource` iterable and
@@ -119,8 +296,17 @@ class Formatter:
         Formatter options can control how exactly the tokens are converted.
         """
         if self.encoding:
-            # wrap the outfile in a StreamWriter
-            outfile = codecs.lookup(self.encoding)[3](outfile)
+            writer = _EncodingWriter(outfile, self.encoding)
+            if isinstance(tokensource, (list, tuple)):
+                # some formatters need to know that the tokens are a list
+                tokensource = _ChunkedTokenList(tokensource, writer)
+            else:
+                tokensource = writer.chunked(tokensource)
+            try:
+                return self.format_unencoded(tokensource, writer)
+            finally:
+                # also write what was formatted before an error
+                writer.close()
         return self.format_unencoded(tokensource, outfile)
 
     # Allow writing Formatter[str] or Formatter[bytes]. That's equivalent to
@@ -14,12 +14,14 @@ import types
 import fnmatch
 from os.path import basename
 
-from pygments.formatters._mapping import FORMATTERS
 from pygments.plugin import find_plugin_formatters
 from pygments.util import ClassNotFound
 
-__all__ = ['get_formatter_by_name', 'get_formatter_for_filename',
-           'get_all_formatters', 'load_formatter_from_file'] + list(FORMATTERS)
+# __all__ is completed with the names of all formatters on first access;
+# the mapping of builtin formatters is only loaded when it is needed
+_all = ['get_formatter_by_name', 'get_formatter_for_filename',
+        'get_all_formatters', 'load_formatter_from_file',
+        'precompile_styles']
 
 _formatter_cache = {}  # classes by name
 _pattern_cache = {}
@@ -41,9 +43,43 @@ def _load_formatters(module_name):
         _formatter_cache[cls.name] = cls
 
 
+def _get_builtin_class(key):
+    """Return the builtin formatter class listed under `key` in the mapping."""
+    from pygments.formatters._mapping import FORMATTERS
+    module_name, name = FORMATTERS[key][:2]
+    if name not in _formatter_cache:
+        _load_formatters(module_name)
+    return _formatter_cache[name]
+
+
+def _find_builtin_filename_match(fn):
+    """
+    Return the key of the first builtin formatter with a filename pattern
+    that matches the base name `fn`, or None.
+    """
+    from pygments.formatters._mapping import (FORMATTERS, FORMATTER_SUFFIXES,
+                                              FORMATTER_PATTERNS)
+    matches = []
+    start = fn.find('.')
+    while start != -1:
+        key = FORMATTER_SUFFIXES.get(fn[start:])
+        if key is not None:
+            matches.append(key)
+        start = fn.find('.', start + 1)
+    for pattern, key in FORMATTER_PATTERNS:
+        if _fn_matches(fn, pattern):
+            matches.append(key)
+    if len(matches) > 1:
+        # keep the precedence of the order in the mapping
+        order = list(FORMATTERS)
+        return min(matches, key=order.index)
+    return matches[0] if matches else None
+
+
 def get_all_formatters():
     """Return a generator for all formatter classes."""
     # NB: this returns formatter classes, not info like get_all_lexers().
+    from pygments.formatters._mapping import FORMATTERS
     for info in FORMATTERS.values():
         if info[1] not in _formatter_cache:
             _load_formatters(info[0])
@@ -57,11 +93,10 @@ def find_formatter_class(alias):
 
     Returns None if not found.
     """
-    for module_name, name, aliases, _, _ in FORMATTERS.values():
-        if alias in aliases:
-            if name not in _formatter_cache:
-                _load_formatters(module_name)
-            return _formatter_cache[name]
+    from pygments.formatters._mapping import FORMATTER_ALIASES
+    key = FORMATTER_ALIASES.get(alias)
+    if key is not None:
+        return _get_builtin_class(key)
     for _, cls in find_plugin_formatters():
         if alias in cls.aliases:
             return cls
@@ -124,12 +159,9 @@ def get_formatter_for_filename(fn, **options):
     is found.
     """
     fn = basename(fn)
-    for modname, name, _, filenames, _ in FORMATTERS.values():
-        for filename in filenames:
-            if _fn_matches(fn, filename):
-                if name not in _formatter_cache:
-                    _load_formatters(modname)
-                return _formatter_cache[name](**options)
+    key = _find_builtin_filename_match(fn)
+    if key is not None:
+        return _get_builtin_class(key)(**options)
     for _name, cls in find_plugin_formatters():
         for filename in cls.filenames:
             if _fn_matches(fn, filename):
@@ -137,17 +169,50 @@ def get_formatter_for_filename(fn, **options):
     raise ClassNotFound(f"no formatter found for file name {fn!r}")
 
 
+def precompile_styles(aliases, styles=None, **options):
+    """
+    Build the style tables of the formatters with the given `aliases` for
+    each of the `styles` (style names or classes; by default, all styles
+    known to Pygments) and `options`.
+
+    Formatters compile their style into lookup tables that are shared by
+    all instances with the same class, style and style-related options.
+    Calling this function at startup, e.g. in a server process that creates
+    a formatter per request, moves that work out of the first requests.
+
+    Will raise :exc:`pygments.util.ClassNotFound` if no formatter with one
+    of the aliases is found.
+
+    .. versionadded:: 2.20
+    """
+    if styles is None:
+        from pygments.styles import get_all_styles
+        styles = list(get_all_styles())
+    for alias in aliases:
+        cls = find_formatter_class(alias)
+        if cls is None:
+            raise ClassNotFound(f"no formatter found for name {alias!r}")
+        for style in styles:
+            cls(style=style, **options)
+
+
 class _automodule(types.ModuleType):
     """Automatically import formatters."""
 
     def __getattr__(self, name):
-        info = FORMATTERS.get(name)
-        if info:
-            _load_formatters(info[0])
-            cls = _formatter_cache[info[1]]
-            setattr(self, name, cls)
-            return cls
-        raise AttributeError(name)
+        if name.startswith('__') and name != '__all__':
+            raise AttributeError(name)
+        from pygments.formatters._mapping import FORMATTERS
+        if name == '__all__':
+            value = _all + list(FORMATTERS)
+        elif name == 'FORMATTERS':
+            value = FORMATTERS
+        elif name in FORMATTERS:
+            value = _get_builtin_class(name)
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
 
 
 oldmod = sys.modules[__name__]
@@ -3,6 +3,7 @@
 
 FORMATTERS = {
     'BBCodeFormatter': ('pygments.formatters.bbcode', 'BBCode', ('bbcode', 'bb'), (), 'Format tokens with BBcodes. These formatting codes are used by many bulletin boards, so you can highlight your sourcecode with pygments before posting it there.'),
+    'BinaryTokenFormatter': ('pygments.formatters.other', 'Binary tokens', ('binarytokens', 'btokens'), ('*.ptok',), 'Format tokens in a compact binary representation for storing token streams.  This is much smaller and faster to read back than the output of the `RawTokenFormatter`; the output can be converted to a token stream with the `BinaryTokenLexer`, described in the :doc:`lexer list <lexers>`.'),
     'BmpImageFormatter': ('pygments.formatters.img', 'img_bmp', ('bmp', 'bitmap'), ('*.bmp',), 'Create a bitmap image from source code. This uses the Python Imaging Library to generate a pixmap from the source code.'),
     'GifImageFormatter': ('pygments.formatters.img', 'img_gif', ('gif',), ('*.gif',), 'Create a GIF image from source code. This uses the Python Imaging Library to generate a pixmap from the source code.'),
     'GroffFormatter': ('pygments.formatters.groff', 'groff', ('groff', 'troff', 'roff'), (), 'Format tokens with groff escapes to change their color and font style.'),
@@ -21,3 +22,66 @@ FORMATTERS = {
     'TerminalTrueColorFormatter': ('pygments.formatters.terminal256', 'TerminalTrueColor', ('terminal16m', 'console16m', '16m'), (), 'Format tokens with ANSI color sequences, for output in a true-color terminal or console.  Like in `TerminalFormatter` color sequences are terminated at newlines, so that paging the output works correctly.'),
     'TestcaseFormatter': ('pygments.formatters.other', 'Testcase', ('testcase',), (), 'Format tokens as appropriate for a new testcase.'),
 }
+
+# Lookup indices, generated from FORMATTERS.  Where several formatters share
+# a key, the first one in FORMATTERS is used.
+
+FORMATTER_ALIASES = {
+    '16m': 'TerminalTrueColorFormatter',
+    '256': 'Terminal256Formatter',
+    'IMG': 'ImageFormatter',
+    'IRC': 'IRCFormatter',
+    'bb': 'BBCodeFormatter',
+    'bbcode': 'BBCodeFormatter',
+    'binarytokens': 'BinaryTokenFormatter',
+    'bitmap': 'BmpImageFormatter',
+    'bmp': 'BmpImageFormatter',
+    'btokens': 'BinaryTokenFormatter',
+    'console': 'TerminalFormatter',
+    'console16m': 'TerminalTrueColorFormatter',
+    'console256': 'Terminal256Formatter',
+    'gif': 'GifImageFormatter',
+    'groff': 'GroffFormatter',
+    'html': 'HtmlFormatter',
+    'img': 'ImageFormatter',
+    'irc': 'IRCFormatter',
+    'jpeg': 'JpgImageFormatter',
+    'jpg': 'JpgImageFormatter',
+    'latex': 'LatexFormatter',
+    'null': 'NullFormatter',
+    'pango': 'PangoMarkupFormatter',
+    'pangomarkup': 'PangoMarkupFormatter',
+    'png': 'ImageFormatter',
+    'raw': 'RawTokenFormatter',
+    'roff': 'GroffFormatter',
+    'rtf': 'RtfFormatter',
+    'svg': 'SvgFormatter',
+    'terminal': 'TerminalFormatter',
+    'terminal16m': 'TerminalTrueColorFormatter',
+    'terminal256': 'Terminal256Formatter',
+    'testcase': 'TestcaseFormatter',
+    'tex': 'LatexFormatter',
+    'text': 'NullFormatter',
+    'tokens': 'RawTokenFormatter',
+    'troff': 'GroffFormatter',
+}
+
+# Formatters by the extension of their ``*.ext`` filename patterns.
+FORMATTER_SUFFIXES = {
+    '.bmp': 'BmpImageFormatter',
+    '.gif': 'GifImageFormatter',
+    '.htm': 'HtmlFormatter',
+    '.html': 'HtmlFormatter',
+    '.jpg': 'JpgImageFormatter',
+    '.png': 'ImageFormatter',
+    '.ptok': 'BinaryTokenFormatter',
+    '.raw': 'RawTokenFormatter',
+    '.rtf': 'RtfFormatter',
+    '.svg': 'SvgFormatter',
+    '.tex': 'LatexFormatter',
+    '.txt': 'NullFormatter',
+}
+
+# All other filename patterns, with the formatter they belong to.
+FORMATTER_PATTERNS = (
+)
@@ -8,6 +8,7 @@
     :license: BSD, see LICENSE for details.
 """
 
+from types import MappingProxyType
 
 from pygments.formatter import Formatter
 from pygments.util import get_bool_opt
@@ -53,8 +54,12 @@ class BBCodeFormatter(Formatter):
         self._code = get_bool_opt(options, 'codetag', False)
         self._mono = get_bool_opt(options, 'monofont', False)
 
+        self.styles = self._get_compiled_style()
+
+    def _compile_style(self):
         self.styles = {}
         self._make_styles()
+        return MappingProxyType(self.styles)
 
     def _make_styles(self):
         for ttype, ndef in self.style:
@@ -9,6 +9,7 @@
 """
 
 import math
+from types import MappingProxyType
 from pygments.formatter import Formatter
 from pygments.util import get_bool_opt, get_int_opt
 
@@ -51,9 +52,15 @@ class GroffFormatter(Formatter):
         self.wrap = get_int_opt(options, 'wrap', 0)
         self._linelen = 0
 
+        self.styles = self._get_compiled_style()
+
+    def _get_style_key(self):
+        return (self.monospaced,)
+
+    def _compile_style(self):
         self.styles = {}
         self._make_styles()
-
+        return MappingProxyType(self.styles)
 
     def _make_styles(self):
         regular = '\\f[CR]' if self.monospaced else '\\f[R]'
@@ -8,15 +8,17 @@
     :license: BSD, see LICENSE for details.
 """
 
-import functools
+import itertools
+import operator
 import os
 import sys
 import os.path
-from io import StringIO
+from types import MappingProxyType
 
-from pygments.formatter import Formatter
+from pygments.formatter import Formatter, EscapeCache
 from pygments.token import Token, Text, STANDARD_TYPES
-from pygments.util import get_bool_opt, get_int_opt, get_list_opt
+from pygments.util import get_bool_opt, get_int_opt, get_list_opt, \
+    options_fingerprint
 
 try:
     import ctags
@@ -55,6 +57,11 @@ def webify(color):
             return f'#{color}'
 
 
+def _translate_parts(value):
+    """HTML-escape a value and split it by newlines."""
+    return value.translate(_escape_html_table).split('\n')
+
+
 def _get_ttype_class(ttype):
     fname = STANDARD_TYPES.get(ttype)
     if fname:
@@ -410,6 +417,21 @@ class HtmlFormatter(Formatter):
     After calling `wrap()`, the `format()` method also adds the "line numbers"
     and/or "full document" wrappers if the respective options are set. Then, all
     HTML yielded by the wrapped generator is output.
+
+
+    **Updating changed lines**
+
+    .. versionadded:: 2.20
+
+    Applications that show a document which changes, e.g. in a code review
+    tool, can update only the lines that changed instead of replacing all of
+    the HTML.  `get_line_fragments()` returns the HTML of the individual
+    lines as they appear in the output of `format()` (with line anchors,
+    line spans, inline line numbers and highlighted lines, but without the
+    wrappers added by `wrap()`), and `get_changed_fragments()` compares the
+    tokens of two versions of a document and returns only the HTML of the
+    lines that differ.  With `linespans`, every line is an element that can
+    be replaced in the DOM.
     """
 
     name = 'HTML'
@@ -463,7 +485,21 @@ class HtmlFormatter(Formatter):
             except ValueError:
                 pass
 
-        self._create_stylesheet()
+        self.ttype2class, self.class2style, self._span_openers = \
+            self._get_compiled_style()
+
+    def get_options_fingerprint(self):
+        if self.tagsfile or (self.full and self.cssfile):
+            # the output depends on the tags file, or formatting has the side
+            # effect of writing the external CSS file
+            return None
+        options = dict(self.options, linenos=self.linenos,
+                       hl_lines=sorted(self.hl_lines),
+                       cssclass=self.cssclass,
+                       linenostart=self.linenostart,
+                       linenostep=self.linenostep,
+                       linenospecial=self.linenospecial)
+        return options_fingerprint(options)
 
     def _get_css_class(self, ttype):
         """Return the css class of this token type prefixed with
@@ -513,6 +549,31 @@ class HtmlFormatter(Formatter):
                 # hierarchy (necessary for CSS cascading rules!)
                 c2s[name] = (style[:-2], ttype, len(ttype))
 
+    def _get_span_opener(self, ttype):
+        """Return the opening ``<span>`` tag for tokens of type `ttype`."""
+        title = ' title="{}"'.format('.'.join(ttype)) if self.debug_token_types else ''
+        if self.noclasses:
+            css_style = self._get_css_inline_styles(ttype)
+            if css_style:
+                css_style = self.class2style[css_style][0]
+                return f'<span style="{css_style}"{title}>'
+        else:
+            css_class = self._get_css_classes(ttype)
+            if css_class:
+                return f'<span class="{css_class}"{title}>'
+        return ''
+
+    def _get_style_key(self):
+        return (self.classprefix, self.noclasses, self.debug_token_types)
+
+    def _compile_style(self):
+        self._create_stylesheet()
+        span_openers = {ttype: self._get_span_opener(ttype)
+                        for ttype, _ in self.style}
+        return (MappingProxyType(self.ttype2class),
+                MappingProxyType(self.class2style),
+                MappingProxyType(span_openers))
+
     def get_style_defs(self, arg=None):
         """
         Return CSS style definitions for the classes produced by the current
@@ -660,13 +721,34 @@ class HtmlFormatter(Formatter):
         yield from inner
         yield 0, DOC_FOOTER
 
-    def _wrap_tablelinenos(self, inner):
-        dummyoutfile = StringIO()
+    def _count_lines(self, tokensource):
+        """
+        Return the number of lines `_format_lines` yields for the tokens in
+        `tokensource`, without formatting them.
+        """
         lncount = 0
-        for t, line in inner:
-            if t:
-                lncount += 1
-            dummyoutfile.write(line)
+        partial = False
+        for _, value in tokensource:
+            newlines = value.count('\n')
+            if newlines:
+                lncount += newlines
+                partial = not value.endswith('\n')
+            elif value:
+                partial = True
+        return lncount + partial
+
+    def _wrap_tablelinenos(self, inner, lncount=None):
+        if lncount is None:
+            # the line numbers come before the code, so we need to collect
+            # the code lines first to count them
+            body = []
+            lncount = 0
+            for t, line in inner:
+                if t:
+                    lncount += 1
+                body.append(line)
+        else:
+            body = (line for _, line in inner)
 
         fl = self.linenostart
         mw = len(str(lncount + fl - 1))
@@ -676,7 +758,17 @@ class HtmlFormatter(Formatter):
         aln = self.anchorlinenos
         nocls = self.noclasses
 
-        lines = []
+        # If a filename was specified, we can't put it into the code table as it
+        # would misalign the line numbers. Hence we emit a separate row for it.
+        filename_tr = ""
+        if self.filename:
+            filename_tr = (
+                '<tr><th colspan="2" class="filename">'
+                '<span class="filename">' + self.filename + '</span>'
+                '</th></tr>')
+
+        yield 0, (f'<table class="{self.cssclass}table">' + filename_tr +
+            '<tr><td class="linenos"><div class="linenodiv"><pre>')
 
         for i in range(fl, fl+lncount):
             print_line = i % st == 0
@@ -703,43 +795,35 @@ class HtmlFormatter(Formatter):
             if style:
                 line = f'<span{style}>{line}</span>'
 
-            lines.append(line)
-
-        ls = '\n'.join(lines)
-
-        # If a filename was specified, we can't put it into the code table as it
-        # would misalign the line numbers. Hence we emit a separate row for it.
-        filename_tr = ""
-        if self.filename:
-            filename_tr = (
-                '<tr><th colspan="2" class="filename">'
-                '<span class="filename">' + self.filename + '</span>'
-                '</th></tr>')
+            if i != fl:
+                line = '\n' + line
+            yield 0, line
 
         # in case you wonder about the seemingly redundant <div> here: since the
         # content in the other cell also is wrapped in a div, some browsers in
         # some configurations seem to mess up the formatting...
-        yield 0, (f'<table class="{self.cssclass}table">' + filename_tr +
-            '<tr><td class="linenos"><div class="linenodiv"><pre>' +
-            ls + '</pre></div></td><td class="code">')
+        yield 0, '</pre></div></td><td class="code">'
         yield 0, '<div>'
-        yield 0, dummyoutfile.getvalue()
+        for line in body:
+            yield 0, line
         yield 0, '</div>'
         yield 0, '</td></tr></table>'
 
 
-    def _wrap_inlinelinenos(self, inner):
-        # need a list of lines since we need the width of a single number :(
-        inner_lines = list(inner)
+    def _wrap_inlinelinenos(self, inner, lncount=None, offset=0):
+        if lncount is None:
+            # need a list of lines since we need the width of a single number :(
+            inner = list(inner)
+            lncount = len(inner)
         sp = self.linenospecial
         st = self.linenostep
-        num = self.linenostart
-        mw = len(str(len(inner_lines) + num - 1))
+        mw = len(str(lncount + self.linenostart - 1))
+        num = self.linenostart + offset
         anchor_name = self.lineanchors or self.linespans
         aln = self.anchorlinenos
         nocls = self.noclasses
 
-        for _, inner_line in inner_lines:
+        for _, inner_line in inner:
             print_line = num % st == 0
             special_line = sp and num % sp == 0
 
@@ -771,10 +855,10 @@ class HtmlFormatter(Formatter):
                 yield 1, linenos + inner_line
             num += 1
 
-    def _wrap_lineanchors(self, inner):
+    def _wrap_lineanchors(self, inner, offset=0):
         s = self.lineanchors
         # subtract 1 since we have to increment i *before* yielding
-        i = self.linenostart - 1
+        i = self.linenostart + offset - 1
         for t, line in inner:
             if t:
                 i += 1
@@ -783,9 +867,9 @@ class HtmlFormatter(Formatter):
             else:
                 yield 0, line
 
-    def _wrap_linespans(self, inner):
+    def _wrap_linespans(self, inner, offset=0):
         s = self.linespans
-        i = self.linenostart - 1
+        i = self.linenostart + offset - 1
         for t, line in inner:
             if t:
                 i += 1
@@ -829,47 +913,36 @@ class HtmlFormatter(Formatter):
         yield from inner
         yield 0, '</code>'
 
-    @functools.lru_cache(maxsize=100)
-    def _translate_parts(self, value):
-        """HTML-escape a value and split it by newlines."""
-        return value.translate(_escape_html_table).split('\n')
-
     def _format_lines(self, tokensource):
         """
         Just format the tokens, without any wrapping tags.
         Yield individual lines.
         """
-        nocls = self.noclasses
         lsep = self.lineseparator
         tagsfile = self.tagsfile
+        span_openers = self._span_openers
+
+        # the escaped values are shared and must not be modified
+        self.escape_cache = escape_cache = EscapeCache(_translate_parts)
 
         lspan = ''
         line = []
-        for ttype, value in tokensource:
-            try:
-                cspan = self.span_element_openers[ttype]
-            except KeyError:
-                title = ' title="{}"'.format('.'.join(ttype)) if self.debug_token_types else ''
-                if nocls:
-                    css_style = self._get_css_inline_styles(ttype)
-                    if css_style:
-                        css_style = self.class2style[css_style][0]
-                        cspan = f'<span style="{css_style}"{title}>'
-                    else:
-                        cspan = ''
-                else:
-                    css_class = self._get_css_classes(ttype)
-                    if css_class:
-                        cspan = f'<span class="{css_class}"{title}>'
-                    else:
-                        cspan = ''
-                self.span_element_openers[ttype] = cspan
+        lookups = 0
+        for lookups, (ttype, value) in enumerate(tokensource, 1):
+            cspan = span_openers.get(ttype)
+            if cspan is None:
+                try:
+                    cspan = self.span_element_openers[ttype]
+                except KeyError:
+                    cspan = self._get_span_opener(ttype)
+                    self.span_element_openers[ttype] = cspan
 
-            parts = self._translate_parts(value)
+            parts = escape_cache[value]
 
             if tagsfile and ttype in Token.Name:
                 filename, linenumber = self._lookup_ctag(value)
                 if linenumber:
+                    parts = list(parts)
                     base, filename = os.path.split(filename)
                     if base:
                         base += '/'
@@ -908,6 +981,8 @@ class HtmlFormatter(Formatter):
                 lspan = cspan
             # else we neither have to open a new span nor set lspan
 
+        escape_cache.lookups += lookups
+
         if line:
             line.extend(((lspan and '</span>'), lsep))
             yield 1, ''.join(line)
@@ -919,14 +994,14 @@ class HtmlFormatter(Formatter):
         else:
             return None, None
 
-    def _highlight_lines(self, tokensource):
+    def _highlight_lines(self, tokensource, offset=0):
         """
         Highlighted the lines specified in the `hl_lines` option by
         post-processing the token stream coming from `_format_lines`.
         """
         hls = self.hl_lines
 
-        for i, (t, value) in enumerate(tokensource):
+        for i, (t, value) in enumerate(tokensource, offset):
             if t != 1:
                 yield t, value
             if i + 1 in hls:  # i + 1 because Python indexes start at 0
@@ -940,6 +1015,169 @@ class HtmlFormatter(Formatter):
             else:
                 yield 1, value
 
+    def _wrap_lines(self, source, lncount=None, offset=0):
+        """
+        Apply the wrappers that work on individual lines to `source`, whose
+        first line is line number `offset` (counted from 0) of a document
+        with `lncount` lines.
+        """
+        # As a special case, we wrap line numbers before line highlighting
+        # so the line numbers get wrapped in the highlighting tag.
+        if not self.nowrap and self.linenos == 2:
+            source = self._wrap_inlinelinenos(source, lncount, offset)
+
+        if self.hl_lines:
+            source = self._highlight_lines(source, offset)
+
+        if not self.nowrap:
+            if self.lineanchors:
+                source = self._wrap_lineanchors(source, offset)
+            if self.linespans:
+                source = self._wrap_linespans(source, offset)
+        return source
+
+    def _iter_lines(self, tokensource):
+        """
+        Yield a tuple of ``(tokentype, text)`` pairs for every line of
+        `tokensource`, leaving out the newlines.  Lines with equal tuples are
+        formatted the same.
+        """
+        line = []
+        for ttype, value in tokensource:
+            if '\n' in value:
+                parts = value.split('\n')
+                for part in parts[:-1]:
+                    if part:
+                        line.append((ttype, part))
+                    yield tuple(line)
+                    line = []
+                value = parts[-1]
+            if value:
+                line.append((ttype, value))
+        if line:
+            yield tuple(line)
+
+    def _tokens_from_line(self, tokens, first):
+        """
+        Return an iterator over the token list `tokens`, starting at the
+        beginning of the line that contains the start of token `first`.
+        """
+        while first > 0 and '\n' not in tokens[first - 1][1]:
+            first -= 1
+        if not first:
+            return iter(tokens)
+        ttype, value = tokens[first - 1]
+        tail = value[value.rindex('\n') + 1:]
+        return itertools.chain([(ttype, tail)] if tail else [],
+                               itertools.islice(tokens, first, None))
+
+    def _format_line_range(self, lines, offset, lncount):
+        tokens = []
+        for line in lines:
+            tokens.extend(line)
+            tokens.append((Text, '\n'))
+        source = self._wrap_lines(self._format_lines(tokens), lncount, offset)
+        return [line for _, line in source]
+
+    def get_line_fragments(self, tokensource):
+        """
+        Return a list with the HTML of every line of `tokensource`, as it
+        appears in the output of `format()`.  See "Updating changed lines"
+        above.
+
+        .. versionadded:: 2.20
+        """
+        lines = list(self._iter_lines(tokensource))
+        return self._format_line_range(lines, 0, len(lines))
+
+    def get_changed_fragments(self, old_tokens, new_tokens, renumber=True):
+        """
+        Compare the token streams `old_tokens` and `new_tokens` of two
+        versions of a document and return a tuple ``(start, stop,
+        fragments)``: replacing the HTML of the old lines ``start`` up to,
+        but not including, ``stop`` with the list `fragments` gives the HTML
+        of the new version, as returned by `get_line_fragments()`.  The line
+        numbers count from the `linenostart` option, like line anchors and
+        line numbers do.
+
+        The changed lines are found by comparing the tokens, so lines after
+        an edit whose highlighting changes (e.g. because a string was
+        opened) are included as well.
+
+        If the number of lines changes and the HTML of a line depends on its
+        number (because of the `lineanchors`, `linespans` or `hl_lines`
+        options or inline line numbers), all lines up to the end are
+        returned.  Pass ``renumber=False`` to get only the changed lines and
+        update the numbers of the following lines yourself.  Line numbers in
+        a separate table column are never included.
+
+        .. versionadded:: 2.20
+        """
+        old = list(old_tokens)
+        new = list(new_tokens)
+        old_values = [value for _, value in old]
+        new_values = [value for _, value in new]
+        old_text = ''.join(old_values)
+        new_text = ''.join(new_values)
+        old_count = old_text.count('\n') + (not old_text.endswith('\n')
+                                             and bool(old_text))
+        new_count = new_text.count('\n') + (not new_text.endswith('\n')
+                                             and bool(new_text))
+
+        # compare the tokens first: lines before the first and after the
+        # last changed token are unchanged
+        limit = min(len(old), len(new))
+        first = next(itertools.compress(itertools.count(),
+                                        map(operator.ne, old, new)), limit)
+        suffix = next(itertools.compress(
+            itertools.count(), map(operator.ne, reversed(old), reversed(new))),
+            limit)
+        suffix = min(suffix, limit - first)
+        start = ''.join(new_values[:first]).count('\n')
+        suffix_lines = ''.join(old_values[len(old) - suffix:]).count('\n')
+        old_stop = min(old_count, old_count - suffix_lines + 1)
+        new_stop = min(new_count, new_count - suffix_lines + 1)
+
+        if old_count != new_count:
+            inline_linenos = not self.nowrap and self.linenos == 2
+            last_old = old_count + self.linenostart - 1
+            last_new = new_count + self.linenostart - 1
+            if inline_linenos and len(str(last_old)) != len(str(last_new)):
+                # the line numbers of all lines get a different width
+                return (self.linenostart, old_count + self.linenostart,
+                        self.get_line_fragments(new))
+            if renumber and (self.hl_lines or inline_linenos or
+                             not self.nowrap and (self.lineanchors or
+                                                  self.linespans)):
+                source = self._format_lines(self._tokens_from_line(new, first))
+                fragments = [line for _, line in
+                             self._wrap_lines(source, new_count, start)]
+                return (start + self.linenostart,
+                        old_count + self.linenostart, fragments)
+
+        old_lines = list(itertools.islice(
+            self._iter_lines(self._tokens_from_line(old, first)),
+            old_stop - start))
+        new_lines = list(itertools.islice(
+            self._iter_lines(self._tokens_from_line(new, first)),
+            new_stop - start))
+        # lines containing changed tokens can still be equal, if the tokens
+        # span several lines
+        head = 0
+        limit = min(len(old_lines), len(new_lines))
+        while head < limit and old_lines[head] == new_lines[head]:
+            head += 1
+        tail = 0
+        while (tail < limit - head
+               and old_lines[-tail - 1] == new_lines[-tail - 1]):
+            tail += 1
+        start += head
+        fragments = self._format_line_range(
+            new_lines[head:len(new_lines) - tail], start, new_count)
+        return (start + self.linenostart,
+                start + len(old_lines) - head - tail + self.linenostart,
+                fragments)
+
     def wrap(self, source):
         """
         Wrap the ``source``, which is a generator yielding
@@ -969,24 +1207,23 @@ class HtmlFormatter(Formatter):
         use several different wrappers that process the original source
         linewise, e.g. line number generators.
         """
-        source = self._format_lines(tokensource)
-
-        # As a special case, we wrap line numbers before line highlighting
-        # so the line numbers get wrapped in the highlighting tag.
-        if not self.nowrap and self.linenos == 2:
-            source = self._wrap_inlinelinenos(source)
+        lncount = None
+        if (self.linenos and not self.nowrap
+                and isinstance(tokensource, (list, tuple))):
+            # line numbers need the number of lines in advance; count them
+            # here so that the formatted lines needn't be collected
+            lncount = self._count_lines(tokensource)
 
-        if self.hl_lines:
-            source = self._highlight_lines(source)
+        source = self._wrap_lines(self._format_lines(tokensource), lncount)
 
         if not self.nowrap:
-            if self.lineanchors:
-                source = self._wrap_lineanchors(source)
-            if self.linespans:
-                source = self._wrap_linespans(source)
             source = self.wrap(source)
             if self.linenos == 1:
-                source = self._wrap_tablelinenos(source)
+                if type(self).wrap is not HtmlFormatter.wrap:
+                    # the table numbers the lines wrap() yields, and an
+                    # overridden wrap() may add some
+                    lncount = None
+                source = self._wrap_tablelinenos(source, lncount)
             source = self._wrap_div(source)
             if self.full:
                 source = self._wrap_full(source, outfile)
@@ -9,6 +9,11 @@
 """
 import os
 import sys
+import json
+import math
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 from pygments.formatter import Formatter
 from pygments.util import get_bool_opt, get_int_opt, get_list_opt, \
@@ -48,6 +53,63 @@ DEFAULT_FONT_NAME_NIX = 'DejaVu Sans Mono'
 DEFAULT_FONT_NAME_WIN = 'Courier New'
 DEFAULT_FONT_NAME_MAC = 'Menlo'
 
+# Characters compared to find out whether a font is fixed-width
+_FIXED_WIDTH_PROBE = 'iMW0 .'
+
+# Number of rendered text runs kept by an ImageFormatter
+TEXT_MASK_CACHE_SIZE = 4096
+
+# Number of lines drawn by each thread if `render_threads` is given
+TILE_LINES = 256
+
+# Directories whose modification time changes when fontconfig updates its
+# cache; resolved font paths are forgotten when one of them changes
+FONTCONFIG_CACHE_DIRS = ['/var/cache/fontconfig', '~/.cache/fontconfig',
+                         '~/.fontconfig']
+
+# Process-wide caches shared by all FontManagers: font paths by
+# (font name, style name) as found by fc-list, and loaded fonts by
+# (path, size)
+_font_paths = {}
+_loaded_fonts = {}
+_font_cache_stamp = None
+
+
+def _get_fontconfig_stamp():
+    dirs = list(FONTCONFIG_CACHE_DIRS)
+    if os.environ.get('XDG_CACHE_HOME'):
+        dirs.append(os.path.join(os.environ['XDG_CACHE_HOME'], 'fontconfig'))
+    stamp = []
+    for path in dirs:
+        try:
+            stamp.append([path, os.stat(os.path.expanduser(path)).st_mtime_ns])
+        except OSError:
+            pass
+    return stamp
+
+
+def _check_font_cache():
+    """Forget cached fonts if the fontconfig cache has changed."""
+    global _font_cache_stamp
+    stamp = _get_fontconfig_stamp()
+    if stamp != _font_cache_stamp:
+        _font_paths.clear()
+        _loaded_fonts.clear()
+        _font_cache_stamp = stamp
+
+
+def clear_font_cache():
+    """
+    Forget all font paths and fonts cached by `FontManager` instances in
+    this process, e.g. after installing fonts.
+
+    .. versionadded:: 2.20
+    """
+    global _font_cache_stamp
+    _font_paths.clear()
+    _loaded_fonts.clear()
+    _font_cache_stamp = None
+
 
 class PilNotAvailable(ImportError):
     """When Python imaging library is not available"""
@@ -60,11 +122,16 @@ class FontNotFound(Exception):
 class FontManager:
     """
     Manages a set of fonts: normal, italic, bold, etc...
+
+    Font paths found with ``fc-list`` and loaded fonts are cached for the
+    whole process.  If `cache_file` is given, the font paths are also kept
+    in that file, so other processes don't have to look them up again.
     """
 
-    def __init__(self, font_name, font_size=14):
+    def __init__(self, font_name, font_size=14, cache_file=None):
         self.font_name = font_name
         self.font_size = font_size
+        self.cache_file = cache_file
         self.fonts = {}
         self.encoding = None
         self.variable = False
@@ -89,7 +156,55 @@ class FontManager:
                 self.font_name = DEFAULT_FONT_NAME_NIX
             self._create_nix()
 
+    def _load_font(self, path):
+        key = (path, self.font_size)
+        font = _loaded_fonts.get(key)
+        if font is None:
+            font = _loaded_fonts[key] = ImageFont.truetype(path, self.font_size)
+        return font
+
+    def _read_cache_file(self):
+        try:
+            with open(self.cache_file, encoding='utf-8') as fp:
+                data = json.load(fp)
+            if data['stamp'] != _font_cache_stamp:
+                return
+            for name, style, path in data['paths']:
+                _font_paths.setdefault((name, style), path)
+        except (OSError, ValueError, KeyError, TypeError):
+            # a missing or broken cache file is simply ignored
+            pass
+
+    def _write_cache_file(self):
+        data = {
+            'stamp': _font_cache_stamp,
+            'paths': [[name, style, path]
+                      for (name, style), path in _font_paths.items()],
+        }
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        try:
+            fd, tmpname = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+                json.dump(data, fp)
+            os.replace(tmpname, self.cache_file)
+        except OSError:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+
     def _get_nix_font_path(self, name, style):
+        key = (name, style)
+        if key in _font_paths:
+            return _font_paths[key]
+        self._font_paths_changed = True
+        path = _font_paths[key] = self._query_fc_list(name, style)
+        return path
+
+    def _query_fc_list(self, name, style):
         proc = subprocess.Popen(['fc-list', f"{name}:style={style}", 'file'],
                                 stdout=subprocess.PIPE, stderr=None)
         stdout, _ = proc.communicate()
@@ -104,10 +219,21 @@ class FontManager:
             return None
 
     def _create_nix(self):
+        _check_font_cache()
+        if self.cache_file:
+            self._read_cache_file()
+        self._font_paths_changed = False
+        try:
+            self._create_nix_fonts()
+        finally:
+            if self.cache_file and self._font_paths_changed:
+                self._write_cache_file()
+
+    def _create_nix_fonts(self):
         for name in STYLES['NORMAL']:
             path = self._get_nix_font_path(self.font_name, name)
             if path is not None:
-                self.fonts['NORMAL'] = ImageFont.truetype(path, self.font_size)
+                self.fonts['NORMAL'] = self._load_font(path)
                 break
         else:
             raise FontNotFound(f'No usable fonts named: "{self.font_name}"')
@@ -115,7 +241,7 @@ class FontManager:
             for stylename in STYLES[style]:
                 path = self._get_nix_font_path(self.font_name, stylename)
                 if path is not None:
-                    self.fonts[style] = ImageFont.truetype(path, self.font_size)
+                    self.fonts[style] = self._load_font(path)
                     break
             else:
                 if style == 'BOLDITALIC':
@@ -139,7 +265,7 @@ class FontManager:
         for name in STYLES['NORMAL']:
             path = self._get_mac_font_path(font_map, self.font_name, name)
             if path is not None:
-                self.fonts['NORMAL'] = ImageFont.truetype(path, self.font_size)
+                self.fonts['NORMAL'] = self._load_font(path)
                 break
         else:
             raise FontNotFound(f'No usable fonts named: "{self.font_name}"')
@@ -147,7 +273,7 @@ class FontManager:
             for stylename in STYLES[style]:
                 path = self._get_mac_font_path(font_map, self.font_name, stylename)
                 if path is not None:
-                    self.fonts[style] = ImageFont.truetype(path, self.font_size)
+                    self.fonts[style] = self._load_font(path)
                     break
             else:
                 if style == 'BOLDITALIC':
@@ -180,11 +306,11 @@ class FontManager:
                 key = _winreg.OpenKey(*keyname)
                 try:
                     path = self._lookup_win(key, self.font_name, STYLES['NORMAL'], True)
-                    self.fonts['NORMAL'] = ImageFont.truetype(path, self.font_size)
+                    self.fonts['NORMAL'] = self._load_font(path)
                     for style in ('ITALIC', 'BOLD', 'BOLDITALIC'):
                         path = self._lookup_win(key, self.font_name, STYLES[style])
                         if path:
-                            self.fonts[style] = ImageFont.truetype(path, self.font_size)
+                            self.fonts[style] = self._load_font(path)
                         else:
                             if style == 'BOLDITALIC':
                                 self.fonts[style] = self.fonts['BOLD']
@@ -224,6 +350,19 @@ class FontManager:
         else:
             return font.getsize(text)
 
+    def get_fixed_width(self):
+        """
+        Get the advance width of every character of the normal font if it
+        is a fixed-width font, else None.
+        """
+        font = self.fonts['NORMAL']
+        if not hasattr(font, 'getlength'):  # Pillow < 8.0.0
+            return None
+        widths = {font.getlength(char) for char in _FIXED_WIDTH_PROBE}
+        if len(widths) == 1:
+            return widths.pop()
+        return None
+
     def get_font(self, bold, oblique):
         """
         Get the font based on bold and italic flags.
@@ -376,6 +515,25 @@ class ImageFormatter(Formatter):
         .. versionadded:: 1.2
 
         Default: highlight color of the selected style
+
+    `font_cache`
+        The name of a file in which the paths of the fonts found with
+        ``fc-list`` are kept, so that other processes creating image
+        formatters don't have to look them up again.  The file is
+        ignored once the fontconfig cache changes.  Only used on \\*nix.
+
+        .. versionadded:: 2.20
+
+        Default: None
+
+    `render_threads`
+        The number of threads drawing the text of tall images.  If greater
+        than 1, images with more than 256 lines are drawn in horizontal
+        tiles in parallel.
+
+        .. versionadded:: 2.20
+
+        Default: 1
     """
 
     # Required by the pygments mapper
@@ -410,7 +568,8 @@ class ImageFormatter(Formatter):
         self.line_pad = get_int_opt(options, 'line_pad', 2)
         # The fonts
         fontsize = get_int_opt(options, 'font_size', 14)
-        self.fonts = FontManager(options.get('font_name', ''), fontsize)
+        self.fonts = FontManager(options.get('font_name', ''), fontsize,
+                                 options.get('font_cache'))
         self.fontw, self.fonth = self.fonts.get_char_size()
         # Line number options
         self.line_number_fg = options.get('line_number_fg', '#886')
@@ -441,7 +600,15 @@ class ImageFormatter(Formatter):
                 pass
         self.hl_color = options.get('hl_color',
                                     self.style.highlight_color) or '#f90'
+        self.render_threads = get_int_opt(options, 'render_threads', 1)
         self.drawables = []
+        self._fixed_width = self.fonts.get_fixed_width()
+        self._get_text_width = functools.lru_cache(TEXT_MASK_CACHE_SIZE)(
+            lambda text: self.fonts.get_text_size(text)[0])
+        self._get_text_mask = functools.lru_cache(TEXT_MASK_CACHE_SIZE)(
+            self._render_text_mask)
+        self._get_glyph_bounds = functools.lru_cache(None)(
+            self._measure_glyph_bounds)
 
     def get_style_defs(self, arg=''):
         raise NotImplementedError('The -S option is meaningless for the image '
@@ -538,13 +705,30 @@ class ImageFormatter(Formatter):
     def _create_drawables(self, tokensource):
         """
         Create drawables for the token content.
+
+        Consecutive tokens on a line that are drawn the same way are merged
+        into one drawable.
         """
+        fixed_width = self._fixed_width
+        get_text_width = self._get_text_width
+        token_styles = {}
+        # the drawable being built: start position, style and text parts
+        run_pos = run_style = None
+        run_parts = []
         lineno = charno = maxcharno = 0
         maxlinelength = linelength = 0
         for ttype, value in tokensource:
-            while ttype not in self.styles:
-                ttype = ttype.parent
-            style = self.styles[ttype]
+            style = token_styles.get(ttype)
+            if style is None:
+                styletype = ttype
+                while styletype not in self.styles:
+                    styletype = styletype.parent
+                ndef = self.styles[styletype]
+                style = token_styles[ttype] = (
+                    self._get_style_font(ndef),
+                    self._get_text_color(ndef),
+                    self._get_text_bg_color(ndef),
+                )
             # TODO: make sure tab expansion happens earlier in the chain.  It
             # really ought to be done on the input, as to do it right here is
             # quite complex.
@@ -554,24 +738,47 @@ class ImageFormatter(Formatter):
             for i, line in enumerate(lines):
                 temp = line.rstrip('\n')
                 if temp:
-                    self._draw_text(
-                        self._get_text_pos(linelength, lineno),
-                        temp,
-                        font = self._get_style_font(style),
-                        text_fg = self._get_text_color(style),
-                        text_bg = self._get_text_bg_color(style),
-                    )
-                    temp_width, _ = self.fonts.get_text_size(temp)
-                    linelength += temp_width
+                    if style != run_style:
+                        if style[2] is None and temp.isspace():
+                            # invisible, can be added to any drawable that
+                            # doesn't paint its background
+                            if run_style is None:
+                                pass
+                            elif run_style[2] is None:
+                                run_parts.append(temp)
+                            else:
+                                self._draw_text(run_pos, ''.join(run_parts),
+                                                *run_style)
+                                run_style = None
+                        else:
+                            if run_style is not None:
+                                self._draw_text(run_pos, ''.join(run_parts),
+                                                *run_style)
+                            run_pos = self._get_text_pos(round(linelength),
+                                                         lineno)
+                            run_style = style
+                            run_parts = [temp]
+                    else:
+                        run_parts.append(temp)
+                    if fixed_width is not None and temp.isascii():
+                        linelength += len(temp) * fixed_width
+                    else:
+                        linelength += get_text_width(temp)
                     maxlinelength = max(maxlinelength, linelength)
                     charno += len(temp)
                     maxcharno = max(maxcharno, charno)
                 if line.endswith('\n'):
+                    if run_style is not None:
+                        self._draw_text(run_pos, ''.join(run_parts),
+                                        *run_style)
+                        run_style = None
                     # add a line for each extra line in the value
                     linelength = 0
                     charno = 0
                     lineno += 1
-        self.maxlinelength = maxlinelength
+        if run_style is not None:
+            self._draw_text(run_pos, ''.join(run_parts), *run_style)
+        self.maxlinelength = math.ceil(maxlinelength)
         self.maxcharno = maxcharno
         self.maxlineno = lineno
 
@@ -611,6 +818,7 @@ class ImageFormatter(Formatter):
         This implementation calculates where it should draw each token on the
         pixmap, then calculates the required pixmap size and draws the items.
         """
+        self.drawables = []
         self._create_drawables(tokensource)
         self._draw_line_numbers()
         im = Image.new(
@@ -629,16 +837,107 @@ class ImageFormatter(Formatter):
                 y = self._get_line_y(linenumber - 1)
                 draw.rectangle([(x, y), (x + rectw, y + recth)],
                                fill=self.hl_color)
-        for pos, value, font, text_fg, text_bg in self.drawables:
+        del draw
+        if self.render_threads > 1 and self.maxlineno > TILE_LINES:
+            self._paint_tiles(im)
+        else:
+            self._paint_drawables(im, self.drawables)
+        im.save(outfile, self.image_format.upper())
+
+    def _measure_glyph_bounds(self, font):
+        """
+        Return the bounding box that contains the printable ASCII glyphs of
+        `font` when drawn at the text position.
+        """
+        boxes = [font.getbbox(chr(i)) for i in range(32, 127)]
+        ascent, descent = font.getmetrics()
+        return (min(0, *(box[0] for box in boxes)),
+                min(0, *(box[1] for box in boxes)),
+                max(box[2] for box in boxes),
+                max(ascent + descent, *(box[3] for box in boxes)))
+
+    def _render_text_mask(self, font, text):
+        """
+        Render `text` into a grayscale mask.  Return the mask and its offset
+        from the text position.
+        """
+        if (self._fixed_width is not None and text.isascii() and
+                text.isprintable()):
+            # compute the bounding box from the glyph bounds instead of
+            # laying out the text once more; every glyph is drawn at a
+            # multiple of the fixed width, italic ones may overhang it
+            left, top, right, bottom = self._get_glyph_bounds(font)
+            right += math.ceil((len(text) - 1) * self._fixed_width) + 1
+        else:
+            left, top, right, bottom = font.getbbox(text)
+        mask = Image.new('L', (max(right - left, 1), max(bottom - top, 1)))
+        ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+        return mask, left, top
+
+    def _paint_drawables(self, im, drawables, yoffset=0):
+        """
+        Paint `drawables` on the image, shifted up by `yoffset` pixels.
+        """
+        draw = ImageDraw.Draw(im)
+        # variable fonts render differently depending on the last variation
+        # set, so their text can't be cached
+        cached = not self.fonts.variable
+        for (x, y), value, font, text_fg, text_bg in drawables:
+            y -= yoffset
             if text_bg:
                 # see deprecations https://pillow.readthedocs.io/en/stable/releasenotes/9.2.0.html#font-size-and-offset-methods
                 if hasattr(draw, 'textsize'):
                     text_size = draw.textsize(text=value, font=font)
                 else:
                     text_size = font.getbbox(value)[2:]
-                draw.rectangle([pos[0], pos[1], pos[0] + text_size[0], pos[1] + text_size[1]], fill=text_bg)
-            draw.text(pos, value, font=font, fill=text_fg)
-        im.save(outfile, self.image_format.upper())
+                draw.rectangle([x, y, x + text_size[0], y + text_size[1]], fill=text_bg)
+            if not cached:
+                draw.text((x, y), value, font=font, fill=text_fg)
+            elif not value.isspace():
+                mask, left, top = self._get_text_mask(font, value)
+                im.paste(text_fg, (x + left, y + top), mask)
+
+    def _paint_tiles(self, im):
+        """
+        Paint the drawables on the image in tiles of `TILE_LINES` lines,
+        using `render_threads` threads.
+
+        Text may extend into the neighbouring lines, so each tile is drawn
+        with a margin of one line above and below, containing the drawables
+        of these lines as well, and only its inner part is used.
+        """
+        width, height = im.size
+        line_height = self._get_line_height()
+        tiles = []
+        for first in range(0, self.maxlineno, TILE_LINES):
+            top = self._get_line_y(first) if first else 0
+            bottom = self._get_line_y(first + TILE_LINES)
+            if first + TILE_LINES >= self.maxlineno:
+                bottom = height
+            tiles.append((top, bottom, []))
+        for drawable in self.drawables:
+            lineno = (drawable[0][1] - self.image_pad) // line_height
+            index, offset = divmod(lineno, TILE_LINES)
+            tiles[index][2].append(drawable)
+            # add the first and last line of a tile to the margin of the
+            # neighbouring tile
+            if offset == 0 and index > 0:
+                tiles[index - 1][2].append(drawable)
+            elif offset == TILE_LINES - 1 and index + 1 < len(tiles):
+                tiles[index + 1][2].append(drawable)
+
+        def paint(tile):
+            top, bottom, drawables = tile
+            margin_top = top - line_height
+            image = im.crop((0, margin_top, width, bottom + line_height))
+            self._paint_drawables(image, drawables, margin_top)
+            return image.crop((0, line_height, width,
+                               line_height + bottom - top))
+
+        with ThreadPoolExecutor(self.render_threads) as executor:
+            images = list(executor.map(paint, tiles))
+        for (top, _, _), image in zip(tiles, images):
+            im.paste(image, (0, top))
 
 
 # Add one formatter per format, so that the "-f gif" option gives the correct result
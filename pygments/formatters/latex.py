@@ -9,8 +9,9 @@
 """
 
 from io import StringIO
+from types import MappingProxyType
 
-from pygments.formatter import Formatter
+from pygments.formatter import Formatter, EscapeCache
 from pygments.lexer import Lexer, do_insertions
 from pygments.token import Token, STANDARD_TYPES
 from pygments.util import get_bool_opt, get_int_opt
@@ -19,25 +20,44 @@ from pygments.util import get_bool_opt, get_int_opt
 __all__ = ['LatexFormatter']
 
 
+#: Names of the commands replacing characters that are special to TeX.
+_TEX_ESCAPES = {
+    '\\': 'Zbs',
+    '{': 'Zob',
+    '}': 'Zcb',
+    '^': 'Zca',
+    '_': 'Zus',
+    '&': 'Zam',
+    '<': 'Zlt',
+    '>': 'Zgt',
+    '#': 'Zsh',
+    '%': 'Zpc',
+    '$': 'Zdl',
+    '-': 'Zhy',
+    "'": 'Zsq',
+    '"': 'Zdq',
+    '~': 'Zti',
+}
+
+_escape_tex_tables = {}
+
+
+def _get_escape_tex_table(commandprefix):
+    """Return the `str.translate` table for `escape_tex`."""
+    try:
+        return _escape_tex_tables[commandprefix]
+    except KeyError:
+        table = {ord(char): rf'\{commandprefix}{name}{{}}'
+                 for char, name in _TEX_ESCAPES.items()}
+        return _escape_tex_tables.setdefault(commandprefix, table)
+
+
 def escape_tex(text, commandprefix):
-    return text.replace('\\', '\x00'). \
-                replace('{', '\x01'). \
-                replace('}', '\x02'). \
-                replace('\x00', rf'\{commandprefix}Zbs{{}}'). \
-                replace('\x01', rf'\{commandprefix}Zob{{}}'). \
-                replace('\x02', rf'\{commandprefix}Zcb{{}}'). \
-                replace('^', rf'\{commandprefix}Zca{{}}'). \
-                replace('_', rf'\{commandprefix}Zus{{}}'). \
-                replace('&', rf'\{commandprefix}Zam{{}}'). \
-                replace('<', rf'\{commandprefix}Zlt{{}}'). \
-                replace('>', rf'\{commandprefix}Zgt{{}}'). \
-                replace('#', rf'\{commandprefix}Zsh{{}}'). \
-                replace('%', rf'\{commandprefix}Zpc{{}}'). \
-                replace('$', rf'\{commandprefix}Zdl{{}}'). \
-                replace('-', rf'\{commandprefix}Zhy{{}}'). \
-                replace("'", rf'\{commandprefix}Zsq{{}}'). \
-                replace('"', rf'\{commandprefix}Zdq{{}}'). \
-                replace('~', rf'\{commandprefix}Zti{{}}')
+    return text.translate(_get_escape_tex_table(commandprefix))
+
+
+# how the text of a token is escaped
+_TEXT, _COMMENT, _ESCAPE = range(3)
 
 
 DOC_TEMPLATE = r'''
@@ -273,8 +293,47 @@ class LatexFormatter(Formatter):
         else:
             self.escapeinside = ''
         self.envname = options.get('envname', 'Verbatim')
+        self._token_info_misses = {}
 
+        self.ttype2name, self.cmd2def, self._token_info = \
+            self._get_compiled_style()
+
+    def _get_style_key(self):
+        return (self.commandprefix,)
+
+    def _compile_style(self):
         self._create_stylesheet()
+        token_info = {ttype: self._get_token_info(ttype)
+                      for ttype, _ in self.style}
+        return (MappingProxyType(self.ttype2name),
+                MappingProxyType(self.cmd2def),
+                MappingProxyType(token_info))
+
+    def _get_token_info(self, ttype):
+        """
+        Return ``(start, kind)`` for tokens of type `ttype`, where `start`
+        is the ``\\PY{...}{`` command they are wrapped in (or ``''``), and
+        `kind` tells how their text is escaped.
+        """
+        if ttype in Token.Comment:
+            kind = _COMMENT
+        elif ttype in Token.Escape:
+            kind = _ESCAPE
+        else:
+            kind = _TEXT
+        t2n = self.ttype2name
+        styles = []
+        while ttype is not Token:
+            try:
+                styles.append(t2n[ttype])
+            except KeyError:
+                # not in current style
+                styles.append(_get_ttype_name(ttype))
+            ttype = ttype.parent
+        styleval = '+'.join(reversed(styles))
+        if styleval:
+            return f'\\{self.commandprefix}{{{styleval}}}{{', kind
+        return '', kind
 
     def _create_stylesheet(self):
         t2n = self.ttype2name = {Token: ''}
@@ -332,7 +391,6 @@ class LatexFormatter(Formatter):
 
     def format_unencoded(self, tokensource, outfile):
         # TODO: add support for background colors
-        t2n = self.ttype2name
         cp = self.commandprefix
 
         if self.full:
@@ -353,28 +411,43 @@ class LatexFormatter(Formatter):
                 outfile.write(',' + self.verboptions)
             outfile.write(']\n')
 
+        table = _get_escape_tex_table(cp)
+        self.escape_cache = escape_cache = EscapeCache(
+            lambda value: value.translate(table))
+        token_info = self._token_info
+        lookups = 0
         for ttype, value in tokensource:
-            if ttype in Token.Comment:
+            info = token_info.get(ttype)
+            if info is None:
+                info = self._token_info_misses.get(ttype)
+                if info is None:
+                    info = self._get_token_info(ttype)
+                    self._token_info_misses[ttype] = info
+            start, kind = info
+            if kind == _TEXT:
+                value = escape_cache[value]
+                lookups += 1
+            elif kind == _COMMENT:
                 if self.texcomments:
                     # Try to guess comment starting lexeme and escape it ...
-                    start = value[0:1]
+                    start_lexeme = value[0:1]
                     for i in range(1, len(value)):
-                        if start[0] != value[i]:
+                        if start_lexeme[0] != value[i]:
                             break
-                        start += value[i]
+                        start_lexeme += value[i]
 
-                    value = value[len(start):]
-                    start = escape_tex(start, cp)
+                    value = value[len(start_lexeme):]
+                    start_lexeme = start_lexeme.translate(table)
 
                     # ... but do not escape inside comment.
-                    value = start + value
+                    value = start_lexeme + value
                 elif self.mathescape:
                     # Only escape parts not inside a math environment.
                     parts = value.split('$')
                     in_math = False
                     for i, part in enumerate(parts):
                         if not in_math:
-                            parts[i] = escape_tex(part, cp)
+                            parts[i] = part.translate(table)
                         in_math = not in_math
                     value = '$'.join(parts)
                 elif self.escapeinside:
@@ -385,34 +458,27 @@ class LatexFormatter(Formatter):
                         if sep1:
                             b, sep2, text = text.partition(self.right)
                             if sep2:
-                                value += escape_tex(a, cp) + b
+                                value += a.translate(table) + b
                             else:
-                                value += escape_tex(a + sep1 + b, cp)
+                                value += (a + sep1 + b).translate(table)
                         else:
-                            value += escape_tex(a, cp)
+                            value += a.translate(table)
                 else:
-                    value = escape_tex(value, cp)
-            elif ttype not in Token.Escape:
-                value = escape_tex(value, cp)
-            styles = []
-            while ttype is not Token:
-                try:
-                    styles.append(t2n[ttype])
-                except KeyError:
-                    # not in current style
-                    styles.append(_get_ttype_name(ttype))
-                ttype = ttype.parent
-            styleval = '+'.join(reversed(styles))
-            if styleval:
-                spl = value.split('\n')
-                for line in spl[:-1]:
-                    if line:
-                        outfile.write(f"\\{cp}{{{styleval}}}{{{line}}}")
-                    outfile.write('\n')
-                if spl[-1]:
-                    outfile.write(f"\\{cp}{{{styleval}}}{{{spl[-1]}}}")
+                    value = escape_cache[value]
+                    lookups += 1
+            if start:
+                if '\n' in value:
+                    spl = value.split('\n')
+                    for line in spl[:-1]:
+                        if line:
+                            outfile.write(f"{start}{line}}}")
+                        outfile.write('\n')
+                    value = spl[-1]
+                if value:
+                    outfile.write(f"{start}{value}}}")
             else:
                 outfile.write(value)
+        escape_cache.lookups += lookups
 
         if not self.nowrap:
             outfile.write('\\end{' + self.envname + '}\n')
@@ -451,6 +517,15 @@ class LatexEmbeddedLexer(Lexer):
         self.lang = lang
         Lexer.__init__(self, **options)
 
+    def get_options_fingerprint(self):
+        own = Lexer.get_options_fingerprint(self)
+        lang_fp = self.lang.get_options_fingerprint()
+        if own is None or lang_fp is None:
+            return None
+        lang = type(self.lang)
+        return (own, self.left, self.right,
+                f'{lang.__module__}.{lang.__qualname__}', lang_fp)
+
     def get_tokens_unprocessed(self, text):
         # find and remove all the escape tokens (replace with an empty string)
         # this is very similar to DelegatingLexer.get_tokens_unprocessed.
@@ -2,7 +2,7 @@
     pygments.formatters.other
     ~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    Other formatters: NullFormatter, RawTokenFormatter.
+    Other formatters: NullFormatter, RawTokenFormatter, BinaryTokenFormatter.
 
     :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
     :license: BSD, see LICENSE for details.
@@ -13,7 +13,8 @@ from pygments.util import get_choice_opt
 from pygments.token import Token
 from pygments.console import colorize
 
-__all__ = ['NullFormatter', 'RawTokenFormatter', 'TestcaseFormatter']
+__all__ = ['NullFormatter', 'RawTokenFormatter', 'BinaryTokenFormatter',
+           'TestcaseFormatter']
 
 
 class NullFormatter(Formatter):
@@ -24,13 +25,9 @@ class NullFormatter(Formatter):
     aliases = ['text', 'null']
     filenames = ['*.txt']
 
-    def format(self, tokensource, outfile):
-        enc = self.encoding
+    def format_unencoded(self, tokensource, outfile):
         for ttype, value in tokensource:
-            if enc:
-                outfile.write(value.encode(enc))
-            else:
-                outfile.write(value)
+            outfile.write(value)
 
 
 class RawTokenFormatter(Formatter):
@@ -115,6 +112,108 @@ class RawTokenFormatter(Formatter):
         flush()
 
 
+# header of the binary token format, followed by one byte giving the
+# compression of the rest of the data; see BinaryTokenLexer for the reader
+BINARY_TOKENS_MAGIC = b'\x89PYGTOK\x01'
+BINARY_TOKENS_COMPRESSION = {'': 0, 'none': 0, 'gz': 1, 'bz2': 2, 'zstd': 3}
+
+
+def _write_varint(buf, value):
+    """Append `value` to the bytearray `buf` as an unsigned LEB128 number."""
+    while value > 0x7f:
+        buf.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+class BinaryTokenFormatter(Formatter):
+    r"""
+    Format tokens in a compact binary representation for storing token
+    streams.  This is much smaller and faster to read back than the output
+    of the `RawTokenFormatter`; the output can be converted to a token stream
+    with the `BinaryTokenLexer`, described in the :doc:`lexer list <lexers>`.
+
+    The format consists of a header, a table of the token type names used,
+    the type index and UTF-8 length of every token, all as unsigned LEB128
+    varints, and finally the UTF-8 encoded text of all tokens.
+
+    Options accepted:
+
+    `compress`
+        If set to ``'gz'``, ``'bz2'`` or ``'zstd'``, compress everything after
+        the header with the given compression algorithm (default: ``''``).
+        ``'zstd'`` requires Python 3.14 or later.  Compressed streams can't
+        be memory-mapped by the `BinaryTokenLexer`.
+
+    .. versionadded:: 2.20
+    """
+    name = 'Binary tokens'
+    aliases = ['binarytokens', 'btokens']
+    filenames = ['*.ptok']
+
+    unicodeoutput = False
+
+    def __init__(self, **options):
+        Formatter.__init__(self, **options)
+        # The token text is always stored as UTF-8, see RawTokenFormatter.
+        self.encoding = 'utf-8'  # let pygments.format() do the right thing
+        self.compress = get_choice_opt(options, 'compress',
+                                       list(BINARY_TOKENS_COMPRESSION), '')
+        if self.compress == 'none':
+            self.compress = ''
+
+    def format(self, tokensource, outfile):
+        try:
+            outfile.write(b'')
+        except TypeError:
+            raise TypeError('The binary tokens formatter needs a binary '
+                            'output file')
+        type_ids = {}
+        type_names = []
+        records = bytearray()
+        texts = []
+        for ttype, value in tokensource:
+            try:
+                type_id = type_ids[ttype]
+            except KeyError:
+                type_id = type_ids[ttype] = len(type_names)
+                type_names.append('.'.join(ttype))
+            value = value.encode('utf-8', 'surrogatepass')
+            _write_varint(records, type_id)
+            _write_varint(records, len(value))
+            texts.append(value)
+
+        body = bytearray()
+        _write_varint(body, len(type_names))
+        for type_name in type_names:
+            type_name = type_name.encode('utf-8')
+            _write_varint(body, len(type_name))
+            body += type_name
+        _write_varint(body, len(texts))
+        _write_varint(body, len(records))
+        body += records
+        body += b''.join(texts)
+
+        if self.compress == 'gz':
+            import gzip
+            body = gzip.compress(body, 9)
+        elif self.compress == 'bz2':
+            import bz2
+            body = bz2.compress(body, 9)
+        elif self.compress == 'zstd':
+            try:
+                from compression import zstd
+            except ImportError as e:
+                raise ImportError('zstd compression of binary tokens '
+                                  'requires Python 3.14 or later') from e
+            body = zstd.compress(body)
+
+        outfile.write(BINARY_TOKENS_MAGIC +
+                      bytes((BINARY_TOKENS_COMPRESSION[self.compress],)))
+        outfile.write(body)
+        outfile.flush()
+
+
 TESTCASE_BEFORE = '''\
     def testNeedsName(lexer):
         fragment = %r
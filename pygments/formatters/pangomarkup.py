@@ -8,7 +8,7 @@
     :license: BSD, see LICENSE for details.
 """
 
-from pygments.formatter import Formatter
+from pygments.formatter import Formatter, EscapeCache
 
 
 __all__ = ['PangoMarkupFormatter']
@@ -64,17 +64,20 @@ class PangoMarkupFormatter(Formatter):
 
         outfile.write('<tt>')
 
-        for ttype, value in tokensource:
+        self.escape_cache = escape_cache = EscapeCache(escape_special_chars)
+        lookups = 0
+        for lookups, (ttype, value) in enumerate(tokensource, 1):
             while ttype not in self.styles:
                 ttype = ttype.parent
             if ttype == lasttype:
-                lastval += escape_special_chars(value)
+                lastval += escape_cache[value]
             else:
                 if lastval:
                     stylebegin, styleend = self.styles[lasttype]
                     outfile.write(stylebegin + lastval + styleend)
-                lastval = escape_special_chars(value)
+                lastval = escape_cache[value]
                 lasttype = ttype
+        escape_cache.lookups += lookups
 
         if lastval:
             stylebegin, styleend = self.styles[lasttype]
@@ -9,6 +9,7 @@
 """
 
 from collections import OrderedDict
+from types import MappingProxyType
 from pygments.formatter import Formatter
 from pygments.style import _ansimap
 from pygments.util import get_bool_opt, get_int_opt, get_list_opt, surrogatepair
@@ -150,7 +151,7 @@ class RtfFormatter(Formatter):
                 # colors in pygments/style.py
                 self.lineno_color = self.style.line_number_color
 
-        self.color_mapping = self._create_color_mapping()
+        self.color_mapping, self._token_starts = self._get_compiled_style()
 
     def _escape(self, text):
         return text.replace('\\', '\\\\') \
@@ -210,6 +211,32 @@ class RtfFormatter(Formatter):
             else:
                 yield (ttype, value)
 
+    def _get_style_key(self):
+        return (self.linenos, self.lineno_color, bool(self.hl_lines),
+                self.hl_color)
+
+    def _compile_style(self):
+        color_mapping = self._create_color_mapping()
+        token_starts = {}
+        for ttype, style in self.style:
+            buf = []
+            if style['bgcolor']:
+                buf.append('\\cb%d' % color_mapping[style['bgcolor']])
+            if style['color']:
+                buf.append('\\cf%d' % color_mapping[style['color']])
+            if style['bold']:
+                buf.append('\\b')
+            if style['italic']:
+                buf.append('\\i')
+            if style['underline']:
+                buf.append('\\ul')
+            if style['border']:
+                buf.append('\\chbrdr\\chcfpat%d' %
+                           color_mapping[style['border']])
+            start = ''.join(buf)
+            token_starts[ttype] = start and f'{{{start} '
+        return MappingProxyType(color_mapping), MappingProxyType(token_starts)
+
     def _create_color_mapping(self):
         """
         Create a mapping of style hex colors to index/offset in
@@ -275,75 +302,82 @@ class RtfFormatter(Formatter):
 
         return lines
 
+    def _format_lines(self, tokensource):
+        """
+        Yield ``(complete, markup)`` for each line of the token stream,
+        where `complete` tells whether the line ends with a newline.
+        Consecutive tokens with the same style share one RTF group.
+        """
+        token_starts = self._token_starts
+        escape_text = self._escape_text
+        line = []
+        run_start = ''
+        for ttype, value in self._split_tokens_on_newlines(tokensource):
+            start = token_starts.get(ttype)
+            while start is None:
+                ttype = ttype.parent
+                start = token_starts.get(ttype)
+            if start != run_start:
+                if run_start:
+                    line.append('}')
+                line.append(start)
+                run_start = start
+            line.append(escape_text(value))
+            if value.endswith('\n'):
+                if run_start:
+                    line.append('}')
+                    run_start = ''
+                yield True, ''.join(line)
+                line = []
+        if line:
+            if run_start:
+                line.append('}')
+            yield False, ''.join(line)
+
     def format_unencoded(self, tokensource, outfile):
         for line in self._rtf_header:
             outfile.write(line + "\n")
 
-        tokensource = self._split_tokens_on_newlines(tokensource)
+        lines = self._format_lines(tokensource)
 
-        # first pass of tokens to count lines, needed for line numbering
+        # first pass to count lines, needed for line numbering; only the
+        # markup of each line is kept, not the tokens
         if self.linenos:
-            line_count = 0
-            tokens = [] # for copying the token source generator
-            for ttype, value in tokensource:
-                tokens.append((ttype, value))
-                if value.endswith("\n"):
-                    line_count += 1
+            lines = list(lines)
+            line_count = sum(complete for complete, _ in lines)
 
             # width of line number strings (for padding with spaces)
             linenos_width = len(str(line_count+self.linenostart-1))
+            lineno_template = self._lineno_template
 
-            tokensource = tokens
+        hl_lines = set(self.hl_lines)
+        if hl_lines:
+            hl_open_str = self._hl_open_str
 
         # highlight stream
         lineno = 1
-        start_new_line = True
-        for ttype, value in tokensource:
-            if start_new_line and lineno in self.hl_lines:
-                outfile.write(self._hl_open_str)
+        for complete, markup in lines:
+            if lineno in hl_lines:
+                outfile.write(hl_open_str)
 
-            if start_new_line and self.linenos:
+            if self.linenos:
                 if (lineno-self.linenostart+1)%self.linenostep == 0:
                     current_lineno = lineno + self.linenostart - 1
                     lineno_str = str(current_lineno).rjust(linenos_width)
                 else:
                     lineno_str = "".rjust(linenos_width)
-                outfile.write(self._lineno_template % lineno_str)
+                outfile.write(lineno_template % lineno_str)
 
-            while not self.style.styles_token(ttype) and ttype.parent:
-                ttype = ttype.parent
-            style = self.style.style_for_token(ttype)
-            buf = []
-            if style['bgcolor']:
-                buf.append('\\cb%d' % self.color_mapping[style['bgcolor']])
-            if style['color']:
-                buf.append('\\cf%d' % self.color_mapping[style['color']])
-            if style['bold']:
-                buf.append('\\b')
-            if style['italic']:
-                buf.append('\\i')
-            if style['underline']:
-                buf.append('\\ul')
-            if style['border']:
-                buf.append('\\chbrdr\\chcfpat%d' %
-                           self.color_mapping[style['border']])
-            start = ''.join(buf)
-            if start:
-                outfile.write(f'{{{start} ')
-            outfile.write(self._escape_text(value))
-            if start:
-                outfile.write('}')
-            start_new_line = False
+            outfile.write(markup)
 
             # complete line of input
-            if value.endswith("\n"):
+            if complete:
                 # close line highlighting
-                if lineno in self.hl_lines:
+                if lineno in hl_lines:
                     outfile.write('}')
                 # newline in RTF file after closing }
                 outfile.write("\n")
 
-                start_new_line = True
                 lineno += 1
 
         outfile.write('}\n')
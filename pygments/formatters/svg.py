@@ -8,7 +8,10 @@
     :license: BSD, see LICENSE for details.
 """
 
-from pygments.formatter import Formatter
+from types import MappingProxyType
+
+from pygments.formatter import Formatter, EscapeCache
+from pygments.formatters.html import _get_ttype_class
 from pygments.token import Comment
 from pygments.util import get_bool_opt, get_int_opt
 
@@ -24,6 +27,11 @@ def escape_html(text):
                 replace("'", '&#39;')
 
 
+def _escape_spaces(text):
+    """Like `escape_html`, and convert spaces to non-breaking spaces."""
+    return escape_html(text).replace(' ', '&#160;')
+
+
 class2style = {}
 
 class SvgFormatter(Formatter):
@@ -85,6 +93,25 @@ class SvgFormatter(Formatter):
         could be used to keep all whitespace as-is.  However, many current SVG
         viewers don't obey that rule, so this option is provided as a workaround
         and defaults to ``True``.
+
+    `classes`
+        If ``True``, give the ``<tspan>`` elements CSS classes named like
+        those of the `HtmlFormatter` instead of presentation attributes, and
+        add a ``<style>`` element with the definitions of the classes to the
+        document (if `nowrap` is true, get them with `get_style_defs()`).
+        This makes the output of larger files considerably smaller.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.20
+
+    `classprefix`
+        A string to prepend to all class names if `classes` is true
+        (default: ``''``).
+
+        .. versionadded:: 2.20
+
+    Consecutive tokens that are displayed the same are put into a single
+    ``<tspan>``.
     """
     name = 'SVG'
     aliases = ['svg']
@@ -110,8 +137,86 @@ class SvgFormatter(Formatter):
         self.linenostart = get_int_opt(options,'linenostart',1)
         self.linenostep = get_int_opt(options,'linenostep',1)
         self.linenowidth = get_int_opt(options,'linenowidth', 3*self.ystep)
+        self.classes = get_bool_opt(options, 'classes', False)
+        self.classprefix = options.get('classprefix', '')
+        self._token_styles = self._get_compiled_style()
         self._stylecache = {}
 
+    def _get_style_key(self):
+        return (self.classes, self.classprefix)
+
+    def _compile_style(self):
+        return MappingProxyType({ttype: self._get_token_style(ttype)
+                                 for ttype, _ in self.style})
+
+    def get_style_defs(self, arg=''):
+        """
+        Return the CSS rules for the classes used if the `classes` option
+        is true.  If `arg` is given, it is prepended as a selector to every
+        rule.
+        """
+        prefix = arg and arg + ' ' or ''
+        lines = []
+        for ttype, value in self.style:
+            css = []
+            if value['color']:
+                css.append('fill: #' + value['color'])
+            if value['bold']:
+                css.append('font-weight: bold')
+            if value['italic']:
+                css.append('font-style: italic')
+            if css:
+                lines.append(f'{prefix}.{self.classprefix}{_get_ttype_class(ttype)} '
+                             f'{{ {"; ".join(css)} }}')
+        return '\n'.join(lines)
+
+    def _get_runs(self, tokensource):
+        """
+        Yield a list of ``(opener, text)`` tuples for every line, where
+        `opener` is the ``<tspan>`` start tag for unescaped `text`, or empty.
+        Consecutive tokens with the same style form one run.  Whitespace
+        joins the current run as long as neither is bold or italic, since
+        only the fill color differs then.
+        """
+        token_styles = self._token_styles
+        stylecache = self._stylecache
+        expandtabs = self.spacehack
+        runs = []
+        parts = []
+        attrs = opener = None
+        plain = True
+        for ttype, value in tokensource:
+            style = token_styles.get(ttype) or stylecache.get(ttype)
+            if style is None:
+                style = stylecache[ttype] = self._get_token_style(ttype)
+            if expandtabs and '\t' in value:
+                value = value.expandtabs()
+            if style[0] != attrs:
+                if parts and plain and style[3] and value.isspace() \
+                        and '\n' not in value:
+                    parts.append(value)
+                    continue
+                if parts:
+                    runs.append((opener, ''.join(parts)))
+                    parts = []
+                attrs, _, opener, plain = style
+            if '\n' in value:
+                lines = value.split('\n')
+                for part in lines[:-1]:
+                    if part:
+                        parts.append(part)
+                    if parts:
+                        runs.append((opener, ''.join(parts)))
+                        parts = []
+                    yield runs
+                    runs = []
+                value = lines[-1]
+            if value:
+                parts.append(value)
+        if parts:
+            runs.append((opener, ''.join(parts)))
+        yield runs
+
     def format_unencoded(self, tokensource, outfile):
         """
         Format ``tokensource``, an iterable of ``(tokentype, tokenstring)``
@@ -130,6 +235,9 @@ class SvgFormatter(Formatter):
                           '"http://www.w3.org/TR/2001/REC-SVG-20010904/DTD/'
                           'svg10.dtd">\n')
             outfile.write('<svg xmlns="http://www.w3.org/2000/svg">\n')
+            if self.classes:
+                outfile.write('<style type="text/css">\n'
+                              f'{self.get_style_defs()}\n</style>\n')
             outfile.write(f'<g font-family="{self.fontfamily}" font-size="{self.fontsize}">\n')
 
         counter = self.linenostart
@@ -143,43 +251,56 @@ class SvgFormatter(Formatter):
             line_x += self.linenowidth + self.ystep
             counter += 1
 
-        outfile.write(f'<text x="{line_x}" y="{y}" xml:space="preserve">')
-        for ttype, value in tokensource:
-            style = self._get_style(ttype)
-            tspan = style and '<tspan' + style + '>' or ''
-            tspanend = tspan and '</tspan>' or ''
-            value = escape_html(value)
-            if self.spacehack:
-                value = value.expandtabs().replace(' ', '&#160;')
-            parts = value.split('\n')
-            for part in parts[:-1]:
-                outfile.write(tspan + part + tspanend)
+        self.escape_cache = escape_cache = EscapeCache(
+            self.spacehack and _escape_spaces or escape_html)
+        lookups = 0
+        for i, runs in enumerate(self._get_runs(tokensource)):
+            if i:
                 y += self.ystep
                 outfile.write('</text>\n')
                 if self.linenos and counter % counter_step == 0:
                     outfile.write(f'<text x="{x+self.linenowidth}" y="{y}" text-anchor="end" {counter_style}>{counter}</text>')
-
                 counter += 1
-                outfile.write(f'<text x="{line_x}" y="{y}" ' 'xml:space="preserve">')
-            outfile.write(tspan + parts[-1] + tspanend)
+            line = [f'<text x="{line_x}" y="{y}" xml:space="preserve">']
+            lookups += len(runs)
+            for opener, text in runs:
+                text = escape_cache[text]
+                if opener:
+                    line.append(opener + text + '</tspan>')
+                else:
+                    line.append(text)
+            outfile.write(''.join(line))
         outfile.write('</text>')
+        escape_cache.lookups += lookups
 
         if not self.nowrap:
             outfile.write('</g></svg>\n')
 
     def _get_style(self, tokentype):
-        if tokentype in self._stylecache:
-            return self._stylecache[tokentype]
-        otokentype = tokentype
+        return self._get_token_style(tokentype)[1]
+
+    def _get_token_style(self, tokentype):
+        """
+        Return ``(attrs, tagattrs, opener, plain)`` for `tokentype`: the
+        presentation attributes of the style, the attributes to put on an
+        element (attributes or class), the ``<tspan>`` start tag or ``''``,
+        and whether the style is neither bold nor italic.
+        """
         while not self.style.styles_token(tokentype):
             tokentype = tokentype.parent
         value = self.style.style_for_token(tokentype)
-        result = ''
+        attrs = ''
         if value['color']:
-            result = ' fill="#' + value['color'] + '"'
+            attrs = ' fill="#' + value['color'] + '"'
         if value['bold']:
-            result += ' font-weight="bold"'
+            attrs += ' font-weight="bold"'
         if value['italic']:
-            result += ' font-style="italic"'
-        self._stylecache[otokentype] = result
-        return result
+            attrs += ' font-style="italic"'
+        if not attrs:
+            return ('', '', '', True)
+        if self.classes:
+            tagattrs = f' class="{self.classprefix}{_get_ttype_class(tokentype)}"'
+        else:
+            tagattrs = attrs
+        return (attrs, tagattrs, '<tspan' + tagattrs + '>',
+                not (value['bold'] or value['italic']))
@@ -23,6 +23,8 @@
 #    black-on-while, so colors like "white background" need to be converted
 #    to "white background, black foreground", etc...
 
+from types import MappingProxyType
+
 from pygments.formatter import Formatter
 from pygments.console import codes
 from pygments.style import ansicolors
@@ -143,12 +145,19 @@ class Terminal256Formatter(Formatter):
         self.useunderline = 'nounderline' not in options
         self.useitalic = 'noitalic' not in options
 
-        self._build_color_table()  # build an RGB-to-256 color conversion table
-        self._setup_styles()  # convert selected style's colors to term. colors
+        self.xterm_colors, self.style_string = self._get_compiled_style()
 
         self.linenos = options.get('linenos', False)
         self._lineno = 0
 
+    def _get_style_key(self):
+        return (self.usebold, self.useunderline, self.useitalic)
+
+    def _compile_style(self):
+        self._build_color_table()  # build an RGB-to-256 color conversion table
+        self._setup_styles()  # convert selected style's colors to term. colors
+        return tuple(self.xterm_colors), MappingProxyType(self.style_string)
+
     def _build_color_table(self):
         # colors 0..15: 16 basic colors
 
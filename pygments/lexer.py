@@ -10,18 +10,20 @@
 
 import re
 import sys
+import mmap
 import time
+import codecs
+from io import BytesIO
 
 from pygments.filter import apply_filters, Filter
-from pygments.filters import get_filter_by_name
 from pygments.token import Error, Text, Other, Whitespace, _TokenType
 from pygments.util import get_bool_opt, get_int_opt, get_list_opt, \
-    make_analysator, Future, guess_decode
+    make_analysator, Future, guess_decode, guess_encoding, options_fingerprint
 from pygments.regexopt import regex_opt
 
 __all__ = ['Lexer', 'RegexLexer', 'ExtendedRegexLexer', 'DelegatingLexer',
            'LexerContext', 'include', 'inherit', 'bygroups', 'using', 'this',
-           'default', 'words', 'line_re']
+           'default', 'words', 'wordset', 'line_re']
 
 line_re = re.compile('.*?\n')
 
@@ -66,6 +68,7 @@ class Lexer(metaclass=LexerMeta):
     .. autoattribute:: mimetypes
        :no-value:
     .. autoattribute:: priority
+    .. autoattribute:: linewise
 
     Lexers included in Pygments should have two additional attributes:
 
@@ -142,6 +145,12 @@ class Lexer(metaclass=LexerMeta):
     #: This is used by the documentation generator to show an example.
     _example = None
 
+    #: True if the lexer has no constructs spanning several lines, so that
+    #: the input can be split after any newline and the pieces lexed
+    #: independently.  Such lexers process files in constant memory, see
+    #: :meth:`get_tokens_from_file`.
+    linewise = False
+
     def __init__(self, **options):
         """
         This constructor takes arbitrary options as keyword arguments.
@@ -183,9 +192,28 @@ class Lexer(metaclass=LexerMeta):
         Add a new stream filter to this lexer.
         """
         if not isinstance(filter_, Filter):
+            # the builtin filters are only imported when they are used
+            from pygments.filters import get_filter_by_name
             filter_ = get_filter_by_name(filter_, **options)
         self.filters.append(filter_)
 
+    def get_options_fingerprint(self):
+        """
+        Return a hashable value that identifies the options and filters of
+        this lexer.  Two instances of the same lexer class with the same
+        fingerprint must produce the same token stream for the same input.
+        Return ``None`` if the options or filters can't be fingerprinted.
+
+        .. versionadded:: 2.20
+        """
+        fingerprints = [options_fingerprint(self.options)]
+        for f in self.filters:
+            fingerprints.append(f'{type(f).__module__}.{type(f).__qualname__}')
+            fingerprints.append(options_fingerprint(f.options))
+        if None in fingerprints:
+            return None
+        return tuple(fingerprints)
+
     def analyse_text(text):
         """
         A static method which is called for lexer guessing.
@@ -237,19 +265,53 @@ class Lexer(metaclass=LexerMeta):
                 text = text[len('\ufeff'):]
 
         # text now *is* a unicode string
-        text = text.replace('\r\n', '\n')
-        text = text.replace('\r', '\n')
+        if self._is_preprocessed(text):
+            # the common case: avoid copying the whole input
+            return text
+        if '\r' in text:
+            text = text.replace('\r\n', '\n')
+            text = text.replace('\r', '\n')
         if self.stripall:
             text = text.strip()
         elif self.stripnl:
             text = text.strip('\n')
-        if self.tabsize > 0:
+        if self.tabsize > 0 and '\t' in text:
             text = text.expandtabs(self.tabsize)
         if self.ensurenl and not text.endswith('\n'):
             text += '\n'
 
         return text
 
+    def _is_preprocessed(self, text):
+        """
+        Return True if `_preprocess_lexer_input()` would return the decoded
+        `text` unchanged.  Only the ends of the text are looked at, plus one
+        scan each for carriage returns and (if they are expanded) tabs.
+        """
+        if not text:
+            return False
+        first, last = text[0], text[-1]
+        # with ensurenl, a single final newline is stripped and added back
+        single_nl = last == '\n' and len(text) > 1
+        if self.stripall:
+            if first.isspace():
+                return False
+            if self.ensurenl:
+                ends_ok = single_nl and not text[-2].isspace()
+            else:
+                ends_ok = not last.isspace()
+        elif self.stripnl:
+            if first == '\n':
+                return False
+            if self.ensurenl:
+                ends_ok = single_nl and text[-2] != '\n'
+            else:
+                ends_ok = last != '\n'
+        else:
+            ends_ok = not self.ensurenl or last == '\n'
+        return ends_ok and '\r' not in text and \
+            not (self.tabsize > 0 and '\t' in text)
+
     def get_tokens(self, text, unfiltered=False):
         """
         This method is the basic interface of a lexer. It is called by
@@ -274,6 +336,137 @@ class Lexer(metaclass=LexerMeta):
             stream = apply_filters(stream, self.filters, self)
         return stream
 
+    def get_tokens_from_file(self, filename, unfiltered=False,
+                             chunksize=1 << 20):
+        """
+        Like `get_tokens()`, but read the input from the file `filename`.
+
+        For `linewise` lexers, the file is memory-mapped, decoded
+        incrementally and lexed in pieces of about `chunksize` bytes that
+        end at line boundaries, so that memory use does not depend on the
+        size of the file.  Other lexers read the whole file.
+
+        .. versionadded:: 2.20
+        """
+        if not self.linewise:
+            with open(filename, 'rb') as fp:
+                text = fp.read()
+            return self.get_tokens(text, unfiltered)
+
+        def streamer():
+            with open(filename, 'rb') as fp:
+                try:
+                    data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # empty files can't be mapped
+                    data = b''
+                try:
+                    for text in self._iter_preprocessed_chunks(data, chunksize):
+                        for _, t, v in self.get_tokens_unprocessed(text):
+                            yield t, v
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+        stream = streamer()
+        if not unfiltered:
+            stream = apply_filters(stream, self.filters, self)
+        return stream
+
+    def _get_buffer_encoding(self, data, chunksize):
+        """
+        Determine how to decode the bytes-like `data` without decoding it
+        all at once.  Return the encoding, error handler and the length of
+        a byte order mark to skip.
+        """
+        if self.encoding == 'guess':
+            fp = data if isinstance(data, mmap.mmap) else BytesIO(data)
+            encoding = guess_encoding(fp, chunksize)
+            fp.seek(0)
+            return encoding, 'strict', 0
+        elif self.encoding == 'chardet':
+            try:
+                import chardet
+            except ImportError as e:
+                raise ImportError('To enable chardet encoding guessing, '
+                                  'please install the chardet library '
+                                  'from http://chardet.feedparser.org/') from e
+            for bom, encoding in _encoding_map:
+                if data[:len(bom)] == bom:
+                    return encoding, 'replace', len(bom)
+            enc = chardet.detect(data[:1024])  # Guess using first 1KB
+            return enc.get('encoding') or 'utf-8', 'replace', 0
+        return self.encoding, 'strict', 0
+
+    def _iter_preprocessed_chunks(self, data, chunksize):
+        """
+        Decode the bytes-like `data` and yield it in pieces that end at line
+        boundaries, preprocessed like `_preprocess_lexer_input()` would
+        preprocess the whole text.
+        """
+        encoding, errors, start = self._get_buffer_encoding(data, chunksize)
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+
+        def decoded():
+            for pos in range(start, len(data), chunksize):
+                yield decoder.decode(data[pos:pos + chunksize]), False
+            yield decoder.decode(b'', final=True), True
+
+        if self.stripall:
+            lstrip, rstrip = str.lstrip, str.rstrip
+        elif self.stripnl:
+            def lstrip(text):
+                return text.lstrip('\n')
+
+            def rstrip(text):
+                return text.rstrip('\n')
+        else:
+            lstrip = rstrip = None
+
+        # like _preprocess_lexer_input(), remove a BOM that survived decoding
+        # unless the encoding was guessed
+        strip_bom = self.encoding not in ('guess', 'chardet')
+        buf = ''
+        at_start = True
+        # pieces that have to be stripped if they are at the end of input
+        held = ''
+        # the last piece is held back to be able to strip it
+        pending = ''
+        for text, final in decoded():
+            buf += text
+            if strip_bom and buf:
+                if buf.startswith('\ufeff'):
+                    buf = buf[1:]
+                strip_bom = False
+            if final:
+                end = len(buf)
+            else:
+                # a final '\r' might be followed by '\n' in the next piece
+                end = max(buf.rfind('\n'), buf.rfind('\r', 0, len(buf) - 1)) + 1
+            if not end:
+                continue
+            text, buf = buf[:end], buf[end:]
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+            if at_start:
+                if lstrip:
+                    text = lstrip(text)
+                    if not text:
+                        continue
+                at_start = False
+            if self.tabsize > 0:
+                text = text.expandtabs(self.tabsize)
+            if rstrip and not rstrip(text):
+                held += text
+                continue
+            if pending:
+                yield pending
+            pending, held = held + text, ''
+        if rstrip:
+            pending = rstrip(pending)
+        if self.ensurenl and not pending.endswith('\n'):
+            pending += '\n'
+        if pending:
+            yield pending
+
     def get_tokens_unprocessed(self, text):
         """
         This method should process the text and return an iterable of
@@ -495,6 +688,54 @@ class words(Future):
         return regex_opt(self.words, prefix=self.prefix, suffix=self.suffix)
 
 
+class wordset(words):
+    r"""
+    Like `words`, but instead of building a regex that matches any of the
+    words, `pattern` is matched and the match is looked up in a set of the
+    words.  This is much faster to set up and to match for lists of
+    thousands of words.
+
+    Every word must be matched entirely by `pattern`, and where one of the
+    words could match, `pattern` must match exactly that word: for the
+    default pattern ``\w+``, the `suffix` should start with ``\b`` and the
+    `prefix` should not match word characters.  With the ``re.IGNORECASE``
+    flag, the words are compared in lowercase.
+
+    .. versionadded:: 2.20
+    """
+    def __init__(self, words, prefix='', suffix='', pattern=r'\w+'):
+        super().__init__(words, prefix, suffix)
+        self.pattern = pattern
+
+    def get(self):
+        return f'{self.prefix}(?P<_wordset>{self.pattern}){self.suffix}'
+
+    def get_match(self, rflags):
+        """Return a match function for the words and the regex flags."""
+        pattern = re.compile(self.pattern, rflags)
+        for word in self.words:
+            if not pattern.fullmatch(word):
+                raise ValueError(f'{word!r} is not matched by {self.pattern!r}')
+        compiled = re.compile(self.get(), rflags)
+        group = compiled.groupindex['_wordset']
+        rexmatch = compiled.match
+        if rflags & re.IGNORECASE:
+            lookup = frozenset(word.lower() for word in self.words)
+
+            def match(text, pos=0, endpos=sys.maxsize):
+                m = rexmatch(text, pos, endpos)
+                if m is not None and m[group].lower() in lookup:
+                    return m
+        else:
+            lookup = frozenset(self.words)
+
+            def match(text, pos=0, endpos=sys.maxsize):
+                m = rexmatch(text, pos, endpos)
+                if m is not None and m[group] in lookup:
+                    return m
+        return match
+
+
 class RegexLexerMeta(LexerMeta):
     """
     Metaclass for RegexLexer, creates the self._tokens attribute from
@@ -503,6 +744,8 @@ class RegexLexerMeta(LexerMeta):
 
     def _process_regex(cls, regex, rflags, state):
         """Preprocess the regular expression component of a token definition."""
+        if isinstance(regex, wordset):
+            return regex.get_match(rflags)
         if isinstance(regex, Future):
             regex = regex.get()
         return re.compile(regex, rflags).match
@@ -914,17 +1157,21 @@ class ProfilingRegexLexerMeta(RegexLexerMeta):
     """Metaclass for ProfilingRegexLexer, collects regex timing info."""
 
     def _process_regex(cls, regex, rflags, state):
-        if isinstance(regex, words):
-            rex = regex_opt(regex.words, prefix=regex.prefix,
-                            suffix=regex.suffix)
+        if isinstance(regex, wordset):
+            rex = regex.get()
+            rexmatch = regex.get_match(rflags)
         else:
-            rex = regex
-        compiled = re.compile(rex, rflags)
+            if isinstance(regex, words):
+                rex = regex_opt(regex.words, prefix=regex.prefix,
+                                suffix=regex.suffix)
+            else:
+                rex = regex
+            rexmatch = re.compile(rex, rflags).match
 
         def match_func(text, pos, endpos=sys.maxsize):
             info = cls._prof_data[-1].setdefault((state, rex), [0, 0.0])
             t0 = time.time()
-            res = compiled.match(text, pos, endpos)
+            res = rexmatch(text, pos, endpos)
             t1 = time.time()
             info[0] += 1
             info[1] += t1 - t0
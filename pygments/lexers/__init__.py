@@ -14,8 +14,6 @@ import types
 import fnmatch
 from os.path import basename
 
-from pygments.lexers._mapping import LEXERS
-from pygments.modeline import get_filetype_from_buffer
 from pygments.plugin import find_plugin_lexers
 from pygments.util import ClassNotFound, guess_decode
 
@@ -25,8 +23,10 @@ COMPAT = {
     'LeanLexer': 'Lean3Lexer',
 }
 
-__all__ = ['get_lexer_by_name', 'get_lexer_for_filename', 'find_lexer_class',
-           'guess_lexer', 'load_lexer_from_file'] + list(LEXERS) + list(COMPAT)
+# __all__ is completed with the names of all lexers on first access; the
+# mapping of builtin lexers is only loaded when it is needed
+_all = ['get_lexer_by_name', 'get_lexer_for_filename', 'find_lexer_class',
+        'guess_lexer', 'load_lexer_from_file']
 
 _lexer_cache = {}
 _pattern_cache = {}
@@ -48,6 +48,32 @@ def _load_lexers(module_name):
         _lexer_cache[cls.name] = cls
 
 
+def _get_builtin_class(key):
+    """Return the builtin lexer class listed under `key` in the mapping."""
+    from pygments.lexers._mapping import LEXERS
+    module_name, name = LEXERS[key][:2]
+    if name not in _lexer_cache:
+        _load_lexers(module_name)
+    return _lexer_cache[name]
+
+
+def _find_builtin_filename_matches(fn):
+    """
+    Yield ``(key, pattern)`` for each filename pattern of the builtin lexers
+    that matches the base name `fn`.
+    """
+    from pygments.lexers._mapping import LEXER_SUFFIXES, LEXER_PATTERNS
+    start = fn.find('.')
+    while start != -1:
+        suffix = fn[start:]
+        for key in LEXER_SUFFIXES.get(suffix, ()):
+            yield key, '*' + suffix
+        start = fn.find('.', start + 1)
+    for pattern, key in LEXER_PATTERNS:
+        if _fn_matches(fn, pattern):
+            yield key, pattern
+
+
 def get_all_lexers(plugins=True):
     """Return a generator of tuples in the form ``(name, aliases,
     filenames, mimetypes)`` of all know lexers.
@@ -55,6 +81,7 @@ def get_all_lexers(plugins=True):
     If *plugins* is true (the default), plugin lexers supplied by entrypoints
     are also returned.  Otherwise, only builtin ones are considered.
     """
+    from pygments.lexers._mapping import LEXERS
     for item in LEXERS.values():
         yield item[1:]
     if plugins:
@@ -70,10 +97,9 @@ def find_lexer_class(name):
     if name in _lexer_cache:
         return _lexer_cache[name]
     # lookup builtin lexers
-    for module_name, lname, aliases, _, _ in LEXERS.values():
-        if name == lname:
-            _load_lexers(module_name)
-            return _lexer_cache[name]
+    from pygments.lexers._mapping import LEXER_NAMES
+    if name in LEXER_NAMES:
+        return _get_builtin_class(LEXER_NAMES[name])
     # continue with lexers from setuptools entrypoints
     for cls in find_plugin_lexers():
         if cls.name == name:
@@ -95,11 +121,10 @@ def find_lexer_class_by_name(_alias):
     if not _alias:
         raise ClassNotFound(f'no lexer for alias {_alias!r} found')
     # lookup builtin lexers
-    for module_name, name, aliases, _, _ in LEXERS.values():
-        if _alias.lower() in aliases:
-            if name not in _lexer_cache:
-                _load_lexers(module_name)
-            return _lexer_cache[name]
+    from pygments.lexers._mapping import LEXER_ALIASES
+    key = LEXER_ALIASES.get(_alias.lower())
+    if key is not None:
+        return _get_builtin_class(key)
     # continue with lexers from setuptools entrypoints
     for cls in find_plugin_lexers():
         if _alias.lower() in cls.aliases:
@@ -120,11 +145,10 @@ def get_lexer_by_name(_alias, **options):
         raise ClassNotFound(f'no lexer for alias {_alias!r} found')
 
     # lookup builtin lexers
-    for module_name, name, aliases, _, _ in LEXERS.values():
-        if _alias.lower() in aliases:
-            if name not in _lexer_cache:
-                _load_lexers(module_name)
-            return _lexer_cache[name](**options)
+    from pygments.lexers._mapping import LEXER_ALIASES
+    key = LEXER_ALIASES.get(_alias.lower())
+    if key is not None:
+        return _get_builtin_class(key)(**options)
     # continue with lexers from setuptools entrypoints
     for cls in find_plugin_lexers():
         if _alias.lower() in cls.aliases:
@@ -176,12 +200,8 @@ def find_lexer_class_for_filename(_fn, code=None):
     """
     matches = []
     fn = basename(_fn)
-    for modname, name, _, filenames, _ in LEXERS.values():
-        for filename in filenames:
-            if _fn_matches(fn, filename):
-                if name not in _lexer_cache:
-                    _load_lexers(modname)
-                matches.append((_lexer_cache[name], filename))
+    for key, filename in _find_builtin_filename_matches(fn):
+        matches.append((_get_builtin_class(key), filename))
     for cls in find_plugin_lexers():
         for filename in cls.filenames:
             if _fn_matches(fn, filename):
@@ -236,11 +256,10 @@ def get_lexer_for_mimetype(_mime, **options):
     Will raise :exc:`pygments.util.ClassNotFound` if not lexer for that mimetype
     is found.
     """
-    for modname, name, _, _, mimetypes in LEXERS.values():
-        if _mime in mimetypes:
-            if name not in _lexer_cache:
-                _load_lexers(modname)
-            return _lexer_cache[name](**options)
+    from pygments.lexers._mapping import LEXER_MIMETYPES
+    key = LEXER_MIMETYPES.get(_mime)
+    if key is not None:
+        return _get_builtin_class(key)(**options)
     for cls in find_plugin_lexers():
         if _mime in cls.mimetypes:
             return cls(**options)
@@ -249,11 +268,9 @@ def get_lexer_for_mimetype(_mime, **options):
 
 def _iter_lexerclasses(plugins=True):
     """Return an iterator over all lexer classes."""
+    from pygments.lexers._mapping import LEXERS
     for key in sorted(LEXERS):
-        module_name, name = LEXERS[key][:2]
-        if name not in _lexer_cache:
-            _load_lexers(module_name)
-        yield _lexer_cache[name]
+        yield _get_builtin_class(key)
     if plugins:
         yield from find_plugin_lexers()
 
@@ -320,6 +337,7 @@ def guess_lexer(_text, **options):
             _text, _ = guess_decode(_text)
 
     # try to get a vim modeline first
+    from pygments.modeline import get_filetype_from_buffer
     ft = get_filetype_from_buffer(_text)
 
     if ft is not None:
@@ -344,15 +362,25 @@ class _automodule(types.ModuleType):
     """Automatically import lexers."""
 
     def __getattr__(self, name):
-        info = LEXERS.get(name)
-        if info:
-            _load_lexers(info[0])
-            cls = _lexer_cache[info[1]]
-            setattr(self, name, cls)
-            return cls
-        if name in COMPAT:
-            return getattr(self, COMPAT[name])
-        raise AttributeError(name)
+        if name.startswith('__') and name != '__all__':
+            raise AttributeError(name)
+        from pygments.lexers._mapping import LEXERS
+        if name == '__all__':
+            value = _all + list(LEXERS) + list(COMPAT)
+        elif name == 'LEXERS':
+            value = LEXERS
+        else:
+            info = LEXERS.get(name)
+            if info:
+                _load_lexers(info[0])
+                cls = _lexer_cache[info[1]]
+                setattr(self, name, cls)
+                return cls
+            if name in COMPAT:
+                return getattr(self, COMPAT[name])
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
 
 
 oldmod = sys.modules[__name__]
@@ -53,6 +53,7 @@ LEXERS = {
     'BefungeLexer': ('pygments.lexers.esoteric', 'Befunge', ('befunge',), ('*.befunge',), ('application/x-befunge',)),
     'BerryLexer': ('pygments.lexers.berry', 'Berry', ('berry', 'be'), ('*.be',), ('text/x-berry', 'application/x-berry')),
     'BibTeXLexer': ('pygments.lexers.bibtex', 'BibTeX', ('bibtex', 'bib'), ('*.bib',), ('text/x-bibtex',)),
+    'BinaryTokenLexer': ('pygments.lexers.special', 'Binary token data', (), (), ('application/x-pygments-binary-tokens',)),
     'BlitzBasicLexer': ('pygments.lexers.basic', 'BlitzBasic', ('blitzbasic', 'b3d', 'bplus'), ('*.bb', '*.decls'), ('text/x-bb',)),
     'BlitzMaxLexer': ('pygments.lexers.basic', 'BlitzMax', ('blitzmax', 'bmax'), ('*.bmx',), ('text/x-bmx',)),
     'BlueprintLexer': ('pygments.lexers.blueprint', 'Blueprint', ('blueprint',), ('*.blp',), ('text/x-blueprint',)),
@@ -600,3 +601,2898 @@ LEXERS = {
     'ZigLexer': ('pygments.lexers.zig', 'Zig', ('zig',), ('*.zig',), ('text/zig',)),
     'apdlexer': ('pygments.lexers.apdlexer', 'ANSYS parametric design language', ('ansys', 'apdl'), ('*.ans',), ()),
 }
+
+# Lookup indices, generated from LEXERS.  Where several lexers share a key,
+# the first one in LEXERS is used.
+
+LEXER_NAMES = {
+    "Cap'n Proto": 'CapnProtoLexer',
+    'ABAP': 'ABAPLexer',
+    'ABNF': 'AbnfLexer',
+    'ADL': 'AdlLexer',
+    'AMDGPU': 'AMDGPULexer',
+    'ANSYS parametric design language': 'apdlexer',
+    'ANTLR With ActionScript Target': 'AntlrActionScriptLexer',
+    'ANTLR With C# Target': 'AntlrCSharpLexer',
+    'ANTLR With CPP Target': 'AntlrCppLexer',
+    'ANTLR With Java Target': 'AntlrJavaLexer',
+    'ANTLR With ObjectiveC Target': 'AntlrObjectiveCLexer',
+    'ANTLR With Perl Target': 'AntlrPerlLexer',
+    'ANTLR With Python Target': 'AntlrPythonLexer',
+    'ANTLR With Ruby Target': 'AntlrRubyLexer',
+    'ANTLR': 'AntlrLexer',
+    'APL': 'APLLexer',
+    'ASCII armored': 'AscLexer',
+    'ASN.1': 'Asn1Lexer',
+    'ActionScript 3': 'ActionScript3Lexer',
+    'ActionScript': 'ActionScriptLexer',
+    'Ada': 'AdaLexer',
+    'Agda': 'AgdaLexer',
+    'Aheui': 'AheuiLexer',
+    'Alloy': 'AlloyLexer',
+    'AmbientTalk': 'AmbientTalkLexer',
+    'Ampl': 'AmplLexer',
+    'Angular2': 'Angular2Lexer',
+    'ApacheConf': 'ApacheConfLexer',
+    'AppleScript': 'AppleScriptLexer',
+    'Arduino': 'ArduinoLexer',
+    'Arrow': 'ArrowLexer',
+    'Arturo': 'ArturoLexer',
+    'AspectJ': 'AspectJLexer',
+    'Asymptote': 'AsymptoteLexer',
+    'Augeas': 'AugeasLexer',
+    'AutoIt': 'AutoItLexer',
+    'Awk': 'AwkLexer',
+    'BARE': 'BareLexer',
+    'BBC Basic': 'BBCBasicLexer',
+    'BBCode': 'BBCodeLexer',
+    'BC': 'BCLexer',
+    'BNF': 'BnfLexer',
+    'BQN': 'BQNLexer',
+    'BST': 'BSTLexer',
+    'BUGS': 'BugsLexer',
+    'Base Makefile': 'BaseMakefileLexer',
+    'Bash Session': 'BashSessionLexer',
+    'Bash': 'BashLexer',
+    'Batchfile': 'BatchLexer',
+    'Bdd': 'BddLexer',
+    'Befunge': 'BefungeLexer',
+    'Berry': 'BerryLexer',
+    'BibTeX': 'BibTeXLexer',
+    'Binary token data': 'BinaryTokenLexer',
+    'BlitzBasic': 'BlitzBasicLexer',
+    'BlitzMax': 'BlitzMaxLexer',
+    'Blueprint': 'BlueprintLexer',
+    'Boa': 'BoaLexer',
+    'Boo': 'BooLexer',
+    'Boogie': 'BoogieLexer',
+    'Brainfuck': 'BrainfuckLexer',
+    'C#': 'CSharpLexer',
+    'C': 'CLexer',
+    'C++': 'CppLexer',
+    'CAmkES': 'CAmkESLexer',
+    'CBM BASIC V2': 'CbmBasicV2Lexer',
+    'CDDL': 'CddlLexer',
+    'CFEngine3': 'Cfengine3Lexer',
+    'CMake': 'CMakeLexer',
+    'COBOL': 'CobolLexer',
+    'COBOLFree': 'CobolFreeformatLexer',
+    'COMAL-80': 'Comal80Lexer',
+    'CPSA': 'CPSALexer',
+    'CSS': 'CssLexer',
+    'CSS+Django/Jinja': 'CssDjangoLexer',
+    'CSS+Genshi Text': 'CssGenshiLexer',
+    'CSS+Lasso': 'LassoCssLexer',
+    'CSS+Mako': 'MakoCssLexer',
+    'CSS+Myghty': 'MyghtyCssLexer',
+    'CSS+PHP': 'CssPhpLexer',
+    'CSS+Ruby': 'CssErbLexer',
+    'CSS+Smarty': 'CssSmartyLexer',
+    'CSS+UL4': 'CSSUL4Lexer',
+    'CSS+mozpreproc': 'MozPreprocCssLexer',
+    'CUDA': 'CudaLexer',
+    'CapDL': 'CapDLLexer',
+    'Carbon': 'CarbonLexer',
+    'Ceylon': 'CeylonLexer',
+    'ChaiScript': 'ChaiscriptLexer',
+    'Chapel': 'ChapelLexer',
+    'Charmci': 'CharmciLexer',
+    'Cheetah': 'CheetahLexer',
+    'Cirru': 'CirruLexer',
+    'Clay': 'ClayLexer',
+    'Clean': 'CleanLexer',
+    'Clojure': 'ClojureLexer',
+    'ClojureScript': 'ClojureScriptLexer',
+    'CodeQL': 'CodeQLLexer',
+    'CoffeeScript': 'CoffeeScriptLexer',
+    'Coldfusion CFC': 'ColdfusionCFCLexer',
+    'Coldfusion HTML': 'ColdfusionHtmlLexer',
+    'Common Lisp': 'CommonLispLexer',
+    'Component Pascal': 'ComponentPascalLexer',
+    'Coq': 'CoqLexer',
+    'Crmsh': 'CrmshLexer',
+    'Croc': 'CrocLexer',
+    'Cryptol': 'CryptolLexer',
+    'Crystal': 'CrystalLexer',
+    'Csound Document': 'CsoundDocumentLexer',
+    'Csound Orchestra': 'CsoundOrchestraLexer',
+    'Csound Score': 'CsoundScoreLexer',
+    'Cypher': 'CypherLexer',
+    'Cython': 'CythonLexer',
+    'D': 'DLexer',
+    'DASM16': 'Dasm16Lexer',
+    'DTD': 'DtdLexer',
+    'Darcs Patch': 'DarcsPatchLexer',
+    'Dart': 'DartLexer',
+    'Dax': 'DaxLexer',
+    'Debian Control file': 'DebianControlLexer',
+    'Debian Sourcelist': 'SourcesListLexer',
+    'Debian Sources file': 'DebianSourcesLexer',
+    'Delphi': 'DelphiLexer',
+    'Desktop file': 'DesktopLexer',
+    'Devicetree': 'DevicetreeLexer',
+    'Diff': 'DiffLexer',
+    'Django/Jinja': 'DjangoLexer',
+    'Docker': 'DockerLexer',
+    'Duel': 'DuelLexer',
+    'Dylan session': 'DylanConsoleLexer',
+    'Dylan': 'DylanLexer',
+    'DylanLID': 'DylanLidLexer',
+    'E-mail': 'EmailLexer',
+    'EBNF': 'EbnfLexer',
+    'ECL': 'ECLLexer',
+    'ERB': 'ErbLexer',
+    'Earl Grey': 'EarlGreyLexer',
+    'Easytrieve': 'EasytrieveLexer',
+    'Eiffel': 'EiffelLexer',
+    'Elixir iex session': 'ElixirConsoleLexer',
+    'Elixir': 'ElixirLexer',
+    'Elm': 'ElmLexer',
+    'Elpi': 'ElpiLexer',
+    'EmacsLisp': 'EmacsLispLexer',
+    'Embedded Ragel': 'RagelEmbeddedLexer',
+    'Erlang erl session': 'ErlangShellLexer',
+    'Erlang': 'ErlangLexer',
+    'Evoque': 'EvoqueLexer',
+    'Ezhil': 'EzhilLexer',
+    'F#': 'FSharpLexer',
+    'FStar': 'FStarLexer',
+    'Factor': 'FactorLexer',
+    'Fancy': 'FancyLexer',
+    'Fantom': 'FantomLexer',
+    'Felix': 'FelixLexer',
+    'Fennel': 'FennelLexer',
+    'Fift': 'FiftLexer',
+    'Fish': 'FishShellLexer',
+    'Flatline': 'FlatlineLexer',
+    'FloScript': 'FloScriptLexer',
+    'Forth': 'ForthLexer',
+    'Fortran': 'FortranLexer',
+    'FortranFixed': 'FortranFixedLexer',
+    'FoxPro': 'FoxProLexer',
+    'Freefem': 'FreeFemLexer',
+    'FunC': 'FuncLexer',
+    'Futhark': 'FutharkLexer',
+    'GAP session': 'GAPConsoleLexer',
+    'GAP': 'GAPLexer',
+    'GAS': 'GasLexer',
+    'GDScript': 'GDScriptLexer',
+    'GLSL': 'GLShaderLexer',
+    'GSQL': 'GSQLLexer',
+    'Genshi Text': 'GenshiTextLexer',
+    'Genshi': 'GenshiLexer',
+    'Gettext Catalog': 'GettextLexer',
+    'Gherkin': 'GherkinLexer',
+    'Gleam': 'GleamLexer',
+    'Gnuplot': 'GnuplotLexer',
+    'Go': 'GoLexer',
+    'Golo': 'GoloLexer',
+    'GoodData-CL': 'GoodDataCLLexer',
+    'GoogleSQL': 'GoogleSqlLexer',
+    'Gosu Template': 'GosuTemplateLexer',
+    'Gosu': 'GosuLexer',
+    'GraphQL': 'GraphQLLexer',
+    'Graphviz': 'GraphvizLexer',
+    'Groff': 'GroffLexer',
+    'Groovy': 'GroovyLexer',
+    'HLSL': 'HLSLShaderLexer',
+    'HSAIL': 'HsailLexer',
+    'HTML + Angular2': 'Angular2HtmlLexer',
+    'HTML': 'HtmlLexer',
+    'HTML+Cheetah': 'CheetahHtmlLexer',
+    'HTML+Django/Jinja': 'HtmlDjangoLexer',
+    'HTML+Evoque': 'EvoqueHtmlLexer',
+    'HTML+Genshi': 'HtmlGenshiLexer',
+    'HTML+Handlebars': 'HandlebarsHtmlLexer',
+    'HTML+Lasso': 'LassoHtmlLexer',
+    'HTML+Mako': 'MakoHtmlLexer',
+    'HTML+Myghty': 'MyghtyHtmlLexer',
+    'HTML+PHP': 'HtmlPhpLexer',
+    'HTML+Smarty': 'HtmlSmartyLexer',
+    'HTML+Twig': 'TwigHtmlLexer',
+    'HTML+UL4': 'HTMLUL4Lexer',
+    'HTML+Velocity': 'VelocityHtmlLexer',
+    'HTTP': 'HttpLexer',
+    'Haml': 'HamlLexer',
+    'Handlebars': 'HandlebarsLexer',
+    'Hare': 'HareLexer',
+    'Haskell': 'HaskellLexer',
+    'Haxe': 'HaxeLexer',
+    'Hexdump': 'HexdumpLexer',
+    'Hspec': 'HspecLexer',
+    'Hxml': 'HxmlLexer',
+    'Hy': 'HyLexer',
+    'Hybris': 'HybrisLexer',
+    'IDL': 'IDLLexer',
+    'INI': 'IniLexer',
+    'IRC logs': 'IrcLogsLexer',
+    'Icon': 'IconLexer',
+    'Idris': 'IdrisLexer',
+    'Igor': 'IgorLexer',
+    'Inform 6 template': 'Inform6TemplateLexer',
+    'Inform 6': 'Inform6Lexer',
+    'Inform 7': 'Inform7Lexer',
+    'Io': 'IoLexer',
+    'Ioke': 'IokeLexer',
+    'Isabelle': 'IsabelleLexer',
+    'J': 'JLexer',
+    'JAGS': 'JagsLexer',
+    'JCL': 'JclLexer',
+    'JMESPath': 'JMESPathLexer',
+    'JSGF': 'JsgfLexer',
+    'JSLT': 'JSLTLexer',
+    'JSON': 'JsonLexer',
+    'JSON-LD': 'JsonLdLexer',
+    'JSON5': 'Json5Lexer',
+    'JSONBareObject': 'JsonBareObjectLexer',
+    'JSX': 'JsxLexer',
+    'Janet': 'JanetLexer',
+    'Jasmin': 'JasminLexer',
+    'Java Server Page': 'JspLexer',
+    'Java': 'JavaLexer',
+    'JavaScript': 'JavascriptLexer',
+    'JavaScript+Cheetah': 'CheetahJavascriptLexer',
+    'JavaScript+Django/Jinja': 'JavascriptDjangoLexer',
+    'JavaScript+Genshi Text': 'JavascriptGenshiLexer',
+    'JavaScript+Lasso': 'LassoJavascriptLexer',
+    'JavaScript+Mako': 'MakoJavascriptLexer',
+    'JavaScript+Myghty': 'MyghtyJavascriptLexer',
+    'JavaScript+PHP': 'JavascriptPhpLexer',
+    'JavaScript+Ruby': 'JavascriptErbLexer',
+    'JavaScript+Smarty': 'JavascriptSmartyLexer',
+    'Javascript+UL4': 'JavascriptUL4Lexer',
+    'Javascript+mozpreproc': 'MozPreprocJavascriptLexer',
+    'Jsonnet': 'JsonnetLexer',
+    'Julia console': 'JuliaConsoleLexer',
+    'Julia': 'JuliaLexer',
+    'Juttle': 'JuttleLexer',
+    'K': 'KLexer',
+    'Kal': 'KalLexer',
+    'Kconfig': 'KconfigLexer',
+    'Kernel log': 'KernelLogLexer',
+    'Koka': 'KokaLexer',
+    'Kotlin': 'KotlinLexer',
+    'Kuin': 'KuinLexer',
+    'Kusto': 'KustoLexer',
+    'LDAP configuration file': 'LdaprcLexer',
+    'LDIF': 'LdifLexer',
+    'LLVM': 'LlvmLexer',
+    'LLVM-MIR Body': 'LlvmMirBodyLexer',
+    'LLVM-MIR': 'LlvmMirLexer',
+    'LSL': 'LSLLexer',
+    'Lasso': 'LassoLexer',
+    'Lean': 'Lean3Lexer',
+    'Lean4': 'Lean4Lexer',
+    'LessCss': 'LessCssLexer',
+    'Lighttpd configuration file': 'LighttpdConfLexer',
+    'LilyPond': 'LilyPondLexer',
+    'Limbo': 'LimboLexer',
+    'Literate Agda': 'LiterateAgdaLexer',
+    'Literate Cryptol': 'LiterateCryptolLexer',
+    'Literate Haskell': 'LiterateHaskellLexer',
+    'Literate Idris': 'LiterateIdrisLexer',
+    'LiveScript': 'LiveScriptLexer',
+    'Logos': 'LogosLexer',
+    'Logtalk': 'LogtalkLexer',
+    'Lua': 'LuaLexer',
+    'Luau': 'LuauLexer',
+    'MAQL': 'MaqlLexer',
+    'MCFunction': 'MCFunctionLexer',
+    'MCSchema': 'MCSchemaLexer',
+    'MIME': 'MIMELexer',
+    'MIPS': 'MIPSLexer',
+    'MOOCode': 'MOOCodeLexer',
+    'MQL': 'MqlLexer',
+    'MSDOS Session': 'MSDOSSessionLexer',
+    'MXML': 'MxmlLexer',
+    'Macaulay2': 'Macaulay2Lexer',
+    'Makefile': 'MakefileLexer',
+    'Mako': 'MakoLexer',
+    'Maple': 'MapleLexer',
+    'Markdown': 'MarkdownLexer',
+    'Mask': 'MaskLexer',
+    'Mason': 'MasonLexer',
+    'Mathematica': 'MathematicaLexer',
+    'Matlab session': 'MatlabSessionLexer',
+    'Matlab': 'MatlabLexer',
+    'Maxima': 'MaximaLexer',
+    'Meson': 'MesonLexer',
+    'MiniD': 'MiniDLexer',
+    'MiniScript': 'MiniScriptLexer',
+    'Modelica': 'ModelicaLexer',
+    'Modula-2': 'Modula2Lexer',
+    'MoinMoin/Trac Wiki markup': 'MoinWikiLexer',
+    'Mojo': 'MojoLexer',
+    'Monkey': 'MonkeyLexer',
+    'Monte': 'MonteLexer',
+    'MoonScript': 'MoonScriptLexer',
+    'Mosel': 'MoselLexer',
+    'Mscgen': 'MscgenLexer',
+    'MuPAD': 'MuPADLexer',
+    'MySQL': 'MySqlLexer',
+    'Myghty': 'MyghtyLexer',
+    'NASM': 'NasmLexer',
+    'NCL': 'NCLLexer',
+    'NSIS': 'NSISLexer',
+    'Nemerle': 'NemerleLexer',
+    'NestedText': 'NestedTextLexer',
+    'NewLisp': 'NewLispLexer',
+    'Newspeak': 'NewspeakLexer',
+    'Nginx configuration file': 'NginxConfLexer',
+    'Nimrod': 'NimrodLexer',
+    'Nit': 'NitLexer',
+    'Nix': 'NixLexer',
+    'Node.js REPL console session': 'NodeConsoleLexer',
+    'Notmuch': 'NotmuchLexer',
+    'NuSMV': 'NuSMVLexer',
+    'NumPy': 'NumPyLexer',
+    'Numba_IR': 'NumbaIRLexer',
+    'OCaml': 'OcamlLexer',
+    'ODIN': 'OdinLexer',
+    'OMG Interface Definition Language': 'OmgIdlLexer',
+    'Objective-C': 'ObjectiveCLexer',
+    'Objective-C++': 'ObjectiveCppLexer',
+    'Objective-J': 'ObjectiveJLexer',
+    'Octave': 'OctaveLexer',
+    'Ooc': 'OocLexer',
+    'Opa': 'OpaLexer',
+    'OpenEdge ABL': 'OpenEdgeLexer',
+    'OpenSCAD': 'OpenScadLexer',
+    'Org Mode': 'OrgLexer',
+    'PDDL': 'PddlLexer',
+    'PEG': 'PegLexer',
+    'PHP': 'PhpLexer',
+    'PL/pgSQL': 'PlPgsqlLexer',
+    'POVRay': 'PovrayLexer',
+    'PRQL': 'PrqlLexer',
+    'PTX': 'PtxLexer',
+    'PacmanConf': 'PacmanConfLexer',
+    'Pan': 'PanLexer',
+    'ParaSail': 'ParaSailLexer',
+    'Pawn': 'PawnLexer',
+    'Perl': 'PerlLexer',
+    'Perl6': 'Perl6Lexer',
+    'Phix': 'PhixLexer',
+    'Pig': 'PigLexer',
+    'Pike': 'PikeLexer',
+    'PkgConfig': 'PkgConfigLexer',
+    'Pointless': 'PointlessLexer',
+    'Pony': 'PonyLexer',
+    'Portugol': 'PortugolLexer',
+    'PostScript': 'PostScriptLexer',
+    'PostgreSQL EXPLAIN dialect': 'PostgresExplainLexer',
+    'PostgreSQL SQL dialect': 'PostgresLexer',
+    'PostgreSQL console (psql)': 'PostgresConsoleLexer',
+    'PowerShell Session': 'PowerShellSessionLexer',
+    'PowerShell': 'PowerShellLexer',
+    'Praat': 'PraatLexer',
+    'Procfile': 'ProcfileLexer',
+    'Prolog': 'PrologLexer',
+    'PromQL': 'PromQLLexer',
+    'Promela': 'PromelaLexer',
+    'Properties': 'PropertiesLexer',
+    'Protocol Buffer': 'ProtoBufLexer',
+    'PsySH console session for PHP': 'PsyshConsoleLexer',
+    'Pug': 'PugLexer',
+    'Puppet': 'PuppetLexer',
+    'PyPy Log': 'PyPyLogLexer',
+    'Python 2.x Traceback': 'Python2TracebackLexer',
+    'Python 2.x': 'Python2Lexer',
+    'Python Traceback': 'PythonTracebackLexer',
+    'Python console session': 'PythonConsoleLexer',
+    'Python': 'PythonLexer',
+    'Python+UL4': 'PythonUL4Lexer',
+    'Q': 'QLexer',
+    'QBasic': 'QBasicLexer',
+    'QML': 'QmlLexer',
+    'QVTO': 'QVToLexer',
+    'Qlik': 'QlikLexer',
+    'RConsole': 'RConsoleLexer',
+    'REBOL': 'RebolLexer',
+    'RHTML': 'RhtmlLexer',
+    'RPMSpec': 'RPMSpecLexer',
+    'RQL': 'RqlLexer',
+    'RSL': 'RslLexer',
+    'Racket': 'RacketLexer',
+    'Ragel in C Host': 'RagelCLexer',
+    'Ragel in CPP Host': 'RagelCppLexer',
+    'Ragel in D Host': 'RagelDLexer',
+    'Ragel in Java Host': 'RagelJavaLexer',
+    'Ragel in Objective C Host': 'RagelObjectiveCLexer',
+    'Ragel in Ruby Host': 'RagelRubyLexer',
+    'Ragel': 'RagelLexer',
+    'Raw token data': 'RawTokenLexer',
+    'Rd': 'RdLexer',
+    'ReasonML': 'ReasonLexer',
+    'Red': 'RedLexer',
+    'Redcode': 'RedcodeLexer',
+    'Rego': 'RegoLexer',
+    'Relax-NG Compact': 'RNCCompactLexer',
+    'ResourceBundle': 'ResourceLexer',
+    'Rexx': 'RexxLexer',
+    'Ride': 'RideLexer',
+    'Rita': 'RitaLexer',
+    'Roboconf Graph': 'RoboconfGraphLexer',
+    'Roboconf Instances': 'RoboconfInstancesLexer',
+    'RobotFramework': 'RobotFrameworkLexer',
+    'Ruby irb session': 'RubyConsoleLexer',
+    'Ruby': 'RubyLexer',
+    'Rust': 'RustLexer',
+    'S': 'SLexer',
+    'SARL': 'SarlLexer',
+    'SAS': 'SASLexer',
+    'SCSS': 'ScssLexer',
+    'SNBT': 'SNBTLexer',
+    'SPARQL': 'SparqlLexer',
+    'SQL': 'SqlLexer',
+    'SQL+Jinja': 'SqlJinjaLexer',
+    'SWIG': 'SwigLexer',
+    'Sass': 'SassLexer',
+    'Savi': 'SaviLexer',
+    'Scala': 'ScalaLexer',
+    'Scalate Server Page': 'SspLexer',
+    'Scaml': 'ScamlLexer',
+    'Scheme': 'SchemeLexer',
+    'Scilab': 'ScilabLexer',
+    'Sed': 'SedLexer',
+    'ShExC': 'ShExCLexer',
+    'Shen': 'ShenLexer',
+    'Sieve': 'SieveLexer',
+    'Silver': 'SilverLexer',
+    'Singularity': 'SingularityLexer',
+    'Slash': 'SlashLexer',
+    'Slim': 'SlimLexer',
+    'Slurm': 'SlurmBashLexer',
+    'Smali': 'SmaliLexer',
+    'Smalltalk': 'SmalltalkLexer',
+    'SmartGameFormat': 'SmartGameFormatLexer',
+    'Smarty': 'SmartyLexer',
+    'Smithy': 'SmithyLexer',
+    'Snobol': 'SnobolLexer',
+    'Snowball': 'SnowballLexer',
+    'Solidity': 'SolidityLexer',
+    'Soong': 'SoongLexer',
+    'Sophia': 'SophiaLexer',
+    'SourcePawn': 'SourcePawnLexer',
+    'Spice': 'SpiceLexer',
+    'SquidConf': 'SquidConfLexer',
+    'Srcinfo': 'SrcinfoLexer',
+    'Stan': 'StanLexer',
+    'Standard ML': 'SMLLexer',
+    'Stata': 'StataLexer',
+    'SuperCollider': 'SuperColliderLexer',
+    'Swift': 'SwiftLexer',
+    'Systemd': 'SystemdLexer',
+    'TADS 3': 'Tads3Lexer',
+    'TAP': 'TAPLexer',
+    'TASM': 'TasmLexer',
+    'TLS Presentation Language': 'TlsLexer',
+    'TOML': 'TOMLLexer',
+    'TSX': 'TsxLexer',
+    'TableGen': 'TableGenLexer',
+    'Tact': 'TactLexer',
+    'Tal': 'TalLexer',
+    'Tcl': 'TclLexer',
+    'Tcsh Session': 'TcshSessionLexer',
+    'Tcsh': 'TcshLexer',
+    'TeX': 'TexLexer',
+    'Tea': 'TeaTemplateLexer',
+    'Tera Term macro': 'TeraTermLexer',
+    'Termcap': 'TermcapLexer',
+    'Terminfo': 'TerminfoLexer',
+    'Terraform': 'TerraformLexer',
+    'Text only': 'TextLexer',
+    'Text output': 'OutputLexer',
+    'ThingsDB': 'ThingsDBLexer',
+    'Thrift': 'ThriftLexer',
+    'Tl-b': 'TlbLexer',
+    'Todotxt': 'TodotxtLexer',
+    'TrafficScript': 'RtsLexer',
+    'Transact-SQL': 'TransactSqlLexer',
+    'Treetop': 'TreetopLexer',
+    'Turtle': 'TurtleLexer',
+    'Twig': 'TwigLexer',
+    'TypeScript': 'TypeScriptLexer',
+    'TypoScript': 'TypoScriptLexer',
+    'TypoScriptCssData': 'TypoScriptCssDataLexer',
+    'TypoScriptHtmlData': 'TypoScriptHtmlDataLexer',
+    'Typographic Number Theory': 'TNTLexer',
+    'Typst': 'TypstLexer',
+    'UL4': 'UL4Lexer',
+    'USD': 'UsdLexer',
+    'Unicon': 'UniconLexer',
+    'Unix/Linux config files': 'UnixConfigLexer',
+    'UrbiScript': 'UrbiscriptLexer',
+    'VB.net': 'VbNetLexer',
+    'VBScript': 'VBScriptLexer',
+    'VCL': 'VCLLexer',
+    'VCLSnippets': 'VCLSnippetLexer',
+    'VCTreeStatus': 'VCTreeStatusLexer',
+    'VGL': 'VGLLexer',
+    'Vala': 'ValaLexer',
+    'Velocity': 'VelocityLexer',
+    'Verifpal': 'VerifpalLexer',
+    'VimL': 'VimLexer',
+    'Visual Prolog Grammar': 'VisualPrologGrammarLexer',
+    'Visual Prolog': 'VisualPrologLexer',
+    'Vue': 'VueLexer',
+    'Vyper': 'VyperLexer',
+    'WDiff': 'WDiffLexer',
+    'Web IDL': 'WebIDLLexer',
+    'WebAssembly': 'WatLexer',
+    'WebGPU Shading Language': 'WgslLexer',
+    'Whiley': 'WhileyLexer',
+    'Wikitext': 'WikitextLexer',
+    'World of Warcraft TOC': 'WoWTocLexer',
+    'Wren': 'WrenLexer',
+    'X++': 'XppLexer',
+    'X10': 'X10Lexer',
+    'XML': 'XmlLexer',
+    'XML+Cheetah': 'CheetahXmlLexer',
+    'XML+Django/Jinja': 'XmlDjangoLexer',
+    'XML+Evoque': 'EvoqueXmlLexer',
+    'XML+Lasso': 'LassoXmlLexer',
+    'XML+Mako': 'MakoXmlLexer',
+    'XML+Myghty': 'MyghtyXmlLexer',
+    'XML+PHP': 'XmlPhpLexer',
+    'XML+Ruby': 'XmlErbLexer',
+    'XML+Smarty': 'XmlSmartyLexer',
+    'XML+UL4': 'XMLUL4Lexer',
+    'XML+Velocity': 'VelocityXmlLexer',
+    'XQuery': 'XQueryLexer',
+    'XSLT': 'XsltLexer',
+    'XUL+mozpreproc': 'MozPreprocXulLexer',
+    'Xorg': 'XorgLexer',
+    'Xtend': 'XtendLexer',
+    'YAML': 'YamlLexer',
+    'YAML+Jinja': 'YamlJinjaLexer',
+    'YANG': 'YangLexer',
+    'YARA': 'YaraLexer',
+    'Zeek': 'ZeekLexer',
+    'Zephir': 'ZephirLexer',
+    'Zig': 'ZigLexer',
+    'Zone': 'DnsZoneLexer',
+    'aspx-cs': 'CSharpAspxLexer',
+    'aspx-vb': 'VbNetAspxLexer',
+    'autohotkey': 'AutohotkeyLexer',
+    'c-objdump': 'CObjdumpLexer',
+    'cADL': 'CadlLexer',
+    'ca65 assembler': 'Ca65Lexer',
+    'cfstatement': 'ColdfusionLexer',
+    'cplint': 'CplintLexer',
+    'cpp-objdump': 'CppObjdumpLexer',
+    'd-objdump': 'DObjdumpLexer',
+    'dg': 'DgLexer',
+    'eC': 'ECLexer',
+    'execline': 'ExeclineLexer',
+    'g-code': 'GcodeLexer',
+    'liquid': 'LiquidLexer',
+    'mozhashpreproc': 'MozPreprocHashLexer',
+    'mozpercentpreproc': 'MozPreprocPercentLexer',
+    'nesC': 'NesCLexer',
+    'objdump': 'ObjdumpLexer',
+    'objdump-nasm': 'NasmObjdumpLexer',
+    'reStructuredText': 'RstLexer',
+    'reg': 'RegeditLexer',
+    'scdoc': 'ScdocLexer',
+    'sqlite3con': 'SqliteConsoleLexer',
+    'systemverilog': 'SystemVerilogLexer',
+    'teal': 'TealLexer',
+    'tiddler': 'TiddlyWiki5Lexer',
+    'ucode': 'UcodeLexer',
+    'urlencoded': 'UrlEncodedLexer',
+    'verilog': 'VerilogLexer',
+    'vhdl': 'VhdlLexer',
+    'xtlang': 'XtlangLexer',
+}
+
+LEXER_ALIASES = {
+    'abap': 'ABAPLexer',
+    'abl': 'OpenEdgeLexer',
+    'abnf': 'AbnfLexer',
+    'aconf': 'ApacheConfLexer',
+    'actionscript': 'ActionScriptLexer',
+    'actionscript3': 'ActionScript3Lexer',
+    'ada': 'AdaLexer',
+    'ada2005': 'AdaLexer',
+    'ada95': 'AdaLexer',
+    'adl': 'AdlLexer',
+    'agda': 'AgdaLexer',
+    'aheui': 'AheuiLexer',
+    'ahk': 'AutohotkeyLexer',
+    'alloy': 'AlloyLexer',
+    'ambienttalk': 'AmbientTalkLexer',
+    'ambienttalk/2': 'AmbientTalkLexer',
+    'amdgpu': 'AMDGPULexer',
+    'ampl': 'AmplLexer',
+    'androidbp': 'SoongLexer',
+    'ansys': 'apdlexer',
+    'antlr': 'AntlrLexer',
+    'antlr-actionscript': 'AntlrActionScriptLexer',
+    'antlr-as': 'AntlrActionScriptLexer',
+    'antlr-c#': 'AntlrCSharpLexer',
+    'antlr-cpp': 'AntlrCppLexer',
+    'antlr-csharp': 'AntlrCSharpLexer',
+    'antlr-java': 'AntlrJavaLexer',
+    'antlr-objc': 'AntlrObjectiveCLexer',
+    'antlr-perl': 'AntlrPerlLexer',
+    'antlr-python': 'AntlrPythonLexer',
+    'antlr-rb': 'AntlrRubyLexer',
+    'antlr-ruby': 'AntlrRubyLexer',
+    'apache': 'ApacheConfLexer',
+    'apacheconf': 'ApacheConfLexer',
+    'apdl': 'apdlexer',
+    'apl': 'APLLexer',
+    'applescript': 'AppleScriptLexer',
+    'arduino': 'ArduinoLexer',
+    'arexx': 'RexxLexer',
+    'arrow': 'ArrowLexer',
+    'art': 'ArturoLexer',
+    'arturo': 'ArturoLexer',
+    'as': 'ActionScriptLexer',
+    'as3': 'ActionScript3Lexer',
+    'asc': 'AscLexer',
+    'asm': 'GasLexer',
+    'asn1': 'Asn1Lexer',
+    'aspectj': 'AspectJLexer',
+    'aspx-cs': 'CSharpAspxLexer',
+    'aspx-vb': 'VbNetAspxLexer',
+    'asy': 'AsymptoteLexer',
+    'asymptote': 'AsymptoteLexer',
+    'at': 'AmbientTalkLexer',
+    'augeas': 'AugeasLexer',
+    'autohotkey': 'AutohotkeyLexer',
+    'autoit': 'AutoItLexer',
+    'awk': 'AwkLexer',
+    'b3d': 'BlitzBasicLexer',
+    'bare': 'BareLexer',
+    'basemake': 'BaseMakefileLexer',
+    'bash': 'BashLexer',
+    'basic': 'QBasicLexer',
+    'bat': 'BatchLexer',
+    'batch': 'BatchLexer',
+    'bazel': 'PythonLexer',
+    'bbcbasic': 'BBCBasicLexer',
+    'bbcode': 'BBCodeLexer',
+    'bc': 'BCLexer',
+    'bdd': 'BddLexer',
+    'be': 'BerryLexer',
+    'befunge': 'BefungeLexer',
+    'berry': 'BerryLexer',
+    'bf': 'BrainfuckLexer',
+    'bib': 'BibTeXLexer',
+    'bibtex': 'BibTeXLexer',
+    'blitzbasic': 'BlitzBasicLexer',
+    'blitzmax': 'BlitzMaxLexer',
+    'blueprint': 'BlueprintLexer',
+    'bmax': 'BlitzMaxLexer',
+    'bnf': 'BnfLexer',
+    'boa': 'BoaLexer',
+    'boo': 'BooLexer',
+    'boogie': 'BoogieLexer',
+    'bp': 'SoongLexer',
+    'bplus': 'BlitzBasicLexer',
+    'bqn': 'BQNLexer',
+    'brainfuck': 'BrainfuckLexer',
+    'bro': 'ZeekLexer',
+    'bsdmake': 'MakefileLexer',
+    'bst': 'BSTLexer',
+    'bst-pybtex': 'BSTLexer',
+    'bugs': 'BugsLexer',
+    'c#': 'CSharpLexer',
+    'c': 'CLexer',
+    'c++': 'CppLexer',
+    'c++-objdumb': 'CppObjdumpLexer',
+    'c-objdump': 'CObjdumpLexer',
+    'ca65': 'Ca65Lexer',
+    'cadl': 'CadlLexer',
+    'camkes': 'CAmkESLexer',
+    'capdl': 'CapDLLexer',
+    'capnp': 'CapnProtoLexer',
+    'carbon': 'CarbonLexer',
+    'cbmbas': 'CbmBasicV2Lexer',
+    'cddl': 'CddlLexer',
+    'ceylon': 'CeylonLexer',
+    'cf3': 'Cfengine3Lexer',
+    'cfc': 'ColdfusionCFCLexer',
+    'cfengine3': 'Cfengine3Lexer',
+    'cfg': 'IniLexer',
+    'cfm': 'ColdfusionHtmlLexer',
+    'cfs': 'ColdfusionLexer',
+    'chai': 'ChaiscriptLexer',
+    'chaiscript': 'ChaiscriptLexer',
+    'chapel': 'ChapelLexer',
+    'charmci': 'CharmciLexer',
+    'cheetah': 'CheetahLexer',
+    'chpl': 'ChapelLexer',
+    'cirru': 'CirruLexer',
+    'cl': 'CommonLispLexer',
+    'clay': 'ClayLexer',
+    'clean': 'CleanLexer',
+    'clipper': 'FoxProLexer',
+    'clj': 'ClojureLexer',
+    'cljs': 'ClojureScriptLexer',
+    'clojure': 'ClojureLexer',
+    'clojurescript': 'ClojureScriptLexer',
+    'cmake': 'CMakeLexer',
+    'cobol': 'CobolLexer',
+    'cobolfree': 'CobolFreeformatLexer',
+    'codeql': 'CodeQLLexer',
+    'coffee': 'CoffeeScriptLexer',
+    'coffee-script': 'CoffeeScriptLexer',
+    'coffeescript': 'CoffeeScriptLexer',
+    'comal': 'Comal80Lexer',
+    'comal80': 'Comal80Lexer',
+    'common-lisp': 'CommonLispLexer',
+    'componentpascal': 'ComponentPascalLexer',
+    'console': 'BashSessionLexer',
+    'control': 'DebianControlLexer',
+    'coq': 'CoqLexer',
+    'cp': 'ComponentPascalLexer',
+    'cplint': 'CplintLexer',
+    'cpp': 'CppLexer',
+    'cpp-objdump': 'CppObjdumpLexer',
+    'cpsa': 'CPSALexer',
+    'cr': 'CrystalLexer',
+    'crmsh': 'CrmshLexer',
+    'croc': 'CrocLexer',
+    'cry': 'CryptolLexer',
+    'cryptol': 'CryptolLexer',
+    'crystal': 'CrystalLexer',
+    'cs': 'CSharpLexer',
+    'csh': 'TcshLexer',
+    'csharp': 'CSharpLexer',
+    'csound': 'CsoundOrchestraLexer',
+    'csound-csd': 'CsoundDocumentLexer',
+    'csound-document': 'CsoundDocumentLexer',
+    'csound-orc': 'CsoundOrchestraLexer',
+    'csound-sco': 'CsoundScoreLexer',
+    'csound-score': 'CsoundScoreLexer',
+    'css': 'CssLexer',
+    'css+django': 'CssDjangoLexer',
+    'css+erb': 'CssErbLexer',
+    'css+genshi': 'CssGenshiLexer',
+    'css+genshitext': 'CssGenshiLexer',
+    'css+jinja': 'CssDjangoLexer',
+    'css+lasso': 'LassoCssLexer',
+    'css+mako': 'MakoCssLexer',
+    'css+mozpreproc': 'MozPreprocCssLexer',
+    'css+myghty': 'MyghtyCssLexer',
+    'css+php': 'CssPhpLexer',
+    'css+ruby': 'CssErbLexer',
+    'css+smarty': 'CssSmartyLexer',
+    'css+ul4': 'CSSUL4Lexer',
+    'cu': 'CudaLexer',
+    'cucumber': 'GherkinLexer',
+    'cuda': 'CudaLexer',
+    'cxx-objdump': 'CppObjdumpLexer',
+    'cypher': 'CypherLexer',
+    'cython': 'CythonLexer',
+    'd': 'DLexer',
+    'd-objdump': 'DObjdumpLexer',
+    'dart': 'DartLexer',
+    'dasm16': 'Dasm16Lexer',
+    'dax': 'DaxLexer',
+    'debcontrol': 'DebianControlLexer',
+    'debian.sources': 'DebianSourcesLexer',
+    'debsources': 'SourcesListLexer',
+    'delphi': 'DelphiLexer',
+    'desktop': 'DesktopLexer',
+    'devicetree': 'DevicetreeLexer',
+    'dg': 'DgLexer',
+    'diff': 'DiffLexer',
+    'django': 'DjangoLexer',
+    'dmesg': 'KernelLogLexer',
+    'do': 'StataLexer',
+    'docker': 'DockerLexer',
+    'dockerfile': 'DockerLexer',
+    'dosbatch': 'BatchLexer',
+    'doscon': 'MSDOSSessionLexer',
+    'dosini': 'IniLexer',
+    'dot': 'GraphvizLexer',
+    'dpatch': 'DarcsPatchLexer',
+    'dtd': 'DtdLexer',
+    'dts': 'DevicetreeLexer',
+    'duby': 'RubyLexer',
+    'duel': 'DuelLexer',
+    'dylan': 'DylanLexer',
+    'dylan-console': 'DylanConsoleLexer',
+    'dylan-lid': 'DylanLidLexer',
+    'dylan-repl': 'DylanConsoleLexer',
+    'earl-grey': 'EarlGreyLexer',
+    'earlgrey': 'EarlGreyLexer',
+    'easytrieve': 'EasytrieveLexer',
+    'ebnf': 'EbnfLexer',
+    'ec': 'ECLexer',
+    'ecl': 'ECLLexer',
+    'eg': 'EarlGreyLexer',
+    'eiffel': 'EiffelLexer',
+    'elisp': 'EmacsLispLexer',
+    'elixir': 'ElixirLexer',
+    'elm': 'ElmLexer',
+    'elpi': 'ElpiLexer',
+    'emacs': 'EmacsLispLexer',
+    'emacs-lisp': 'EmacsLispLexer',
+    'email': 'EmailLexer',
+    'eml': 'EmailLexer',
+    'erb': 'ErbLexer',
+    'erl': 'ErlangShellLexer',
+    'erlang': 'ErlangLexer',
+    'evoque': 'EvoqueLexer',
+    'ex': 'ElixirLexer',
+    'execline': 'ExeclineLexer',
+    'exs': 'ElixirLexer',
+    'extempore': 'XtlangLexer',
+    'ezhil': 'EzhilLexer',
+    'f#': 'FSharpLexer',
+    'f90': 'FortranLexer',
+    'factor': 'FactorLexer',
+    'fan': 'FantomLexer',
+    'fancy': 'FancyLexer',
+    'fc': 'FuncLexer',
+    'felix': 'FelixLexer',
+    'fennel': 'FennelLexer',
+    'fif': 'FiftLexer',
+    'fift': 'FiftLexer',
+    'fish': 'FishShellLexer',
+    'fishshell': 'FishShellLexer',
+    'flatline': 'FlatlineLexer',
+    'flo': 'FloScriptLexer',
+    'floscript': 'FloScriptLexer',
+    'flx': 'FelixLexer',
+    'fnl': 'FennelLexer',
+    'forth': 'ForthLexer',
+    'fortran': 'FortranLexer',
+    'fortranfixed': 'FortranFixedLexer',
+    'foxpro': 'FoxProLexer',
+    'freefem': 'FreeFemLexer',
+    'fsharp': 'FSharpLexer',
+    'fstar': 'FStarLexer',
+    'func': 'FuncLexer',
+    'futhark': 'FutharkLexer',
+    'fy': 'FancyLexer',
+    'gap': 'GAPLexer',
+    'gap-console': 'GAPConsoleLexer',
+    'gap-repl': 'GAPConsoleLexer',
+    'gas': 'GasLexer',
+    'gawk': 'AwkLexer',
+    'gcode': 'GcodeLexer',
+    'gd': 'GDScriptLexer',
+    'gdscript': 'GDScriptLexer',
+    'genshi': 'GenshiLexer',
+    'genshitext': 'GenshiTextLexer',
+    'gherkin': 'GherkinLexer',
+    'gleam': 'GleamLexer',
+    'glsl': 'GLShaderLexer',
+    'gnuplot': 'GnuplotLexer',
+    'go': 'GoLexer',
+    'golang': 'GoLexer',
+    'golo': 'GoloLexer',
+    'gooddata-cl': 'GoodDataCLLexer',
+    'googlesql': 'GoogleSqlLexer',
+    'gosu': 'GosuLexer',
+    'graphql': 'GraphQLLexer',
+    'graphviz': 'GraphvizLexer',
+    'groff': 'GroffLexer',
+    'groovy': 'GroovyLexer',
+    'gsed': 'SedLexer',
+    'gsql': 'GSQLLexer',
+    'gst': 'GosuTemplateLexer',
+    'haml': 'HamlLexer',
+    'handlebars': 'HandlebarsLexer',
+    'hare': 'HareLexer',
+    'haskell': 'HaskellLexer',
+    'haxe': 'HaxeLexer',
+    'haxeml': 'HxmlLexer',
+    'hcl': 'TerraformLexer',
+    'hexdump': 'HexdumpLexer',
+    'hlsl': 'HLSLShaderLexer',
+    'hs': 'HaskellLexer',
+    'hsa': 'HsailLexer',
+    'hsail': 'HsailLexer',
+    'hspec': 'HspecLexer',
+    'html': 'HtmlLexer',
+    'html+cheetah': 'CheetahHtmlLexer',
+    'html+django': 'HtmlDjangoLexer',
+    'html+erb': 'RhtmlLexer',
+    'html+evoque': 'EvoqueHtmlLexer',
+    'html+genshi': 'HtmlGenshiLexer',
+    'html+handlebars': 'HandlebarsHtmlLexer',
+    'html+jinja': 'HtmlDjangoLexer',
+    'html+kid': 'HtmlGenshiLexer',
+    'html+lasso': 'LassoHtmlLexer',
+    'html+mako': 'MakoHtmlLexer',
+    'html+myghty': 'MyghtyHtmlLexer',
+    'html+ng2': 'Angular2HtmlLexer',
+    'html+php': 'HtmlPhpLexer',
+    'html+ruby': 'RhtmlLexer',
+    'html+smarty': 'HtmlSmartyLexer',
+    'html+spitfire': 'CheetahHtmlLexer',
+    'html+twig': 'TwigHtmlLexer',
+    'html+ul4': 'HTMLUL4Lexer',
+    'html+velocity': 'VelocityHtmlLexer',
+    'htmlcheetah': 'CheetahHtmlLexer',
+    'htmldjango': 'HtmlDjangoLexer',
+    'http': 'HttpLexer',
+    'hx': 'HaxeLexer',
+    'hxml': 'HxmlLexer',
+    'hxsl': 'HaxeLexer',
+    'hy': 'HyLexer',
+    'hybris': 'HybrisLexer',
+    'hylang': 'HyLexer',
+    'i6': 'Inform6Lexer',
+    'i6t': 'Inform6TemplateLexer',
+    'i7': 'Inform7Lexer',
+    'icon': 'IconLexer',
+    'idl': 'IDLLexer',
+    'idl4': 'CAmkESLexer',
+    'idr': 'IdrisLexer',
+    'idris': 'IdrisLexer',
+    'iex': 'ElixirConsoleLexer',
+    'igor': 'IgorLexer',
+    'igorpro': 'IgorLexer',
+    'ik': 'IokeLexer',
+    'inform6': 'Inform6Lexer',
+    'inform7': 'Inform7Lexer',
+    'ini': 'IniLexer',
+    'io': 'IoLexer',
+    'ioke': 'IokeLexer',
+    'irb': 'RubyConsoleLexer',
+    'irc': 'IrcLogsLexer',
+    'isabelle': 'IsabelleLexer',
+    'j': 'JLexer',
+    'jade': 'PugLexer',
+    'jags': 'JagsLexer',
+    'janet': 'JanetLexer',
+    'jasmin': 'JasminLexer',
+    'jasminxt': 'JasminLexer',
+    'java': 'JavaLexer',
+    'javascript': 'JavascriptLexer',
+    'javascript+cheetah': 'CheetahJavascriptLexer',
+    'javascript+django': 'JavascriptDjangoLexer',
+    'javascript+erb': 'JavascriptErbLexer',
+    'javascript+genshi': 'JavascriptGenshiLexer',
+    'javascript+genshitext': 'JavascriptGenshiLexer',
+    'javascript+jinja': 'JavascriptDjangoLexer',
+    'javascript+lasso': 'LassoJavascriptLexer',
+    'javascript+mako': 'MakoJavascriptLexer',
+    'javascript+mozpreproc': 'MozPreprocJavascriptLexer',
+    'javascript+myghty': 'MyghtyJavascriptLexer',
+    'javascript+php': 'JavascriptPhpLexer',
+    'javascript+ruby': 'JavascriptErbLexer',
+    'javascript+smarty': 'JavascriptSmartyLexer',
+    'javascript+spitfire': 'CheetahJavascriptLexer',
+    'jbst': 'DuelLexer',
+    'jcl': 'JclLexer',
+    'jinja': 'DjangoLexer',
+    'jl': 'JuliaLexer',
+    'jlcon': 'JuliaConsoleLexer',
+    'jmespath': 'JMESPathLexer',
+    'jp': 'JMESPathLexer',
+    'jproperties': 'PropertiesLexer',
+    'js': 'JavascriptLexer',
+    'js+cheetah': 'CheetahJavascriptLexer',
+    'js+django': 'JavascriptDjangoLexer',
+    'js+erb': 'JavascriptErbLexer',
+    'js+genshi': 'JavascriptGenshiLexer',
+    'js+genshitext': 'JavascriptGenshiLexer',
+    'js+jinja': 'JavascriptDjangoLexer',
+    'js+lasso': 'LassoJavascriptLexer',
+    'js+mako': 'MakoJavascriptLexer',
+    'js+myghty': 'MyghtyJavascriptLexer',
+    'js+php': 'JavascriptPhpLexer',
+    'js+ruby': 'JavascriptErbLexer',
+    'js+smarty': 'JavascriptSmartyLexer',
+    'js+spitfire': 'CheetahJavascriptLexer',
+    'js+ul4': 'JavascriptUL4Lexer',
+    'jsgf': 'JsgfLexer',
+    'jslt': 'JSLTLexer',
+    'json': 'JsonLexer',
+    'json-ld': 'JsonLdLexer',
+    'json-object': 'JsonLexer',
+    'json5': 'Json5Lexer',
+    'jsonld': 'JsonLdLexer',
+    'jsonml+bst': 'DuelLexer',
+    'jsonnet': 'JsonnetLexer',
+    'jsp': 'JspLexer',
+    'jsx': 'JsxLexer',
+    'julia': 'JuliaLexer',
+    'julia-repl': 'JuliaConsoleLexer',
+    'juttle': 'JuttleLexer',
+    'k': 'KLexer',
+    'kal': 'KalLexer',
+    'kconfig': 'KconfigLexer',
+    'kernel-config': 'KconfigLexer',
+    'kid': 'GenshiLexer',
+    'kmsg': 'KernelLogLexer',
+    'koka': 'KokaLexer',
+    'kotlin': 'KotlinLexer',
+    'kql': 'KustoLexer',
+    'ksh': 'BashLexer',
+    'kuin': 'KuinLexer',
+    'kusto': 'KustoLexer',
+    'lagda': 'LiterateAgdaLexer',
+    'lasso': 'LassoLexer',
+    'lassoscript': 'LassoLexer',
+    'latex': 'TexLexer',
+    'lcry': 'LiterateCryptolLexer',
+    'lcryptol': 'LiterateCryptolLexer',
+    'ldapconf': 'LdaprcLexer',
+    'ldaprc': 'LdaprcLexer',
+    'ldif': 'LdifLexer',
+    'lean': 'Lean3Lexer',
+    'lean3': 'Lean3Lexer',
+    'lean4': 'Lean4Lexer',
+    'less': 'LessCssLexer',
+    'lhaskell': 'LiterateHaskellLexer',
+    'lhs': 'LiterateHaskellLexer',
+    'lid': 'DylanLidLexer',
+    'lidr': 'LiterateIdrisLexer',
+    'lidris': 'LiterateIdrisLexer',
+    'lighttpd': 'LighttpdConfLexer',
+    'lighty': 'LighttpdConfLexer',
+    'lilypond': 'LilyPondLexer',
+    'limbo': 'LimboLexer',
+    'linux-config': 'KconfigLexer',
+    'linuxconfig': 'UnixConfigLexer',
+    'liquid': 'LiquidLexer',
+    'lisp': 'CommonLispLexer',
+    'literate-agda': 'LiterateAgdaLexer',
+    'literate-cryptol': 'LiterateCryptolLexer',
+    'literate-haskell': 'LiterateHaskellLexer',
+    'literate-idris': 'LiterateIdrisLexer',
+    'live-script': 'LiveScriptLexer',
+    'livescript': 'LiveScriptLexer',
+    'llvm': 'LlvmLexer',
+    'llvm-mir': 'LlvmMirLexer',
+    'llvm-mir-body': 'LlvmMirBodyLexer',
+    'lobas': 'VbNetLexer',
+    'logos': 'LogosLexer',
+    'logtalk': 'LogtalkLexer',
+    'lsl': 'LSLLexer',
+    'lua': 'LuaLexer',
+    'luau': 'LuauLexer',
+    'm2': 'Modula2Lexer',
+    'macaulay2': 'Macaulay2Lexer',
+    'macsyma': 'MaximaLexer',
+    'make': 'MakefileLexer',
+    'makefile': 'MakefileLexer',
+    'mako': 'MakoLexer',
+    'man': 'GroffLexer',
+    'maple': 'MapleLexer',
+    'maql': 'MaqlLexer',
+    'markdown': 'MarkdownLexer',
+    'mask': 'MaskLexer',
+    'mason': 'MasonLexer',
+    'mathematica': 'MathematicaLexer',
+    'matlab': 'MatlabLexer',
+    'matlabsession': 'MatlabSessionLexer',
+    'mawk': 'AwkLexer',
+    'maxima': 'MaximaLexer',
+    'mcf': 'MCFunctionLexer',
+    'mcfunction': 'MCFunctionLexer',
+    'mcschema': 'MCSchemaLexer',
+    'md': 'MarkdownLexer',
+    'mediawiki': 'WikitextLexer',
+    'menuconfig': 'KconfigLexer',
+    'meson': 'MesonLexer',
+    'meson.build': 'MesonLexer',
+    'mf': 'MakefileLexer',
+    'mime': 'MIMELexer',
+    'minid': 'MiniDLexer',
+    'miniscript': 'MiniScriptLexer',
+    'mips': 'MIPSLexer',
+    'mma': 'MathematicaLexer',
+    'modelica': 'ModelicaLexer',
+    'modula2': 'Modula2Lexer',
+    'moin': 'MoinWikiLexer',
+    'mojo': 'MojoLexer',
+    'monkey': 'MonkeyLexer',
+    'monte': 'MonteLexer',
+    'moo': 'MOOCodeLexer',
+    'moocode': 'MOOCodeLexer',
+    'moon': 'MoonScriptLexer',
+    'moonscript': 'MoonScriptLexer',
+    'mosel': 'MoselLexer',
+    'mozhashpreproc': 'MozPreprocHashLexer',
+    'mozpercentpreproc': 'MozPreprocPercentLexer',
+    'mq4': 'MqlLexer',
+    'mq5': 'MqlLexer',
+    'mql': 'MqlLexer',
+    'mql4': 'MqlLexer',
+    'mql5': 'MqlLexer',
+    'ms': 'MiniScriptLexer',
+    'msc': 'MscgenLexer',
+    'mscgen': 'MscgenLexer',
+    'mupad': 'MuPADLexer',
+    'mxml': 'MxmlLexer',
+    'myghty': 'MyghtyLexer',
+    'mysql': 'MySqlLexer',
+    'nasm': 'NasmLexer',
+    'nawk': 'AwkLexer',
+    'nb': 'MathematicaLexer',
+    'ncl': 'NCLLexer',
+    'nemerle': 'NemerleLexer',
+    'nesc': 'NesCLexer',
+    'nestedtext': 'NestedTextLexer',
+    'newlisp': 'NewLispLexer',
+    'newspeak': 'NewspeakLexer',
+    'ng2': 'Angular2Lexer',
+    'nginx': 'NginxConfLexer',
+    'nim': 'NimrodLexer',
+    'nimrod': 'NimrodLexer',
+    'nit': 'NitLexer',
+    'nix': 'NixLexer',
+    'nixos': 'NixLexer',
+    'nodejsrepl': 'NodeConsoleLexer',
+    'notmuch': 'NotmuchLexer',
+    'nroff': 'GroffLexer',
+    'nsh': 'NSISLexer',
+    'nsi': 'NSISLexer',
+    'nsis': 'NSISLexer',
+    'nt': 'NestedTextLexer',
+    'numba_ir': 'NumbaIRLexer',
+    'numbair': 'NumbaIRLexer',
+    'numpy': 'NumPyLexer',
+    'nusmv': 'NuSMVLexer',
+    'obj-c': 'ObjectiveCLexer',
+    'obj-c++': 'ObjectiveCppLexer',
+    'obj-j': 'ObjectiveJLexer',
+    'objc': 'ObjectiveCLexer',
+    'objc++': 'ObjectiveCppLexer',
+    'objdump': 'ObjdumpLexer',
+    'objdump-nasm': 'NasmObjdumpLexer',
+    'objective-c': 'ObjectiveCLexer',
+    'objective-c++': 'ObjectiveCppLexer',
+    'objective-j': 'ObjectiveJLexer',
+    'objectivec': 'ObjectiveCLexer',
+    'objectivec++': 'ObjectiveCppLexer',
+    'objectivej': 'ObjectiveJLexer',
+    'objectpascal': 'DelphiLexer',
+    'objj': 'ObjectiveJLexer',
+    'ocaml': 'OcamlLexer',
+    'octave': 'OctaveLexer',
+    'odin': 'OdinLexer',
+    'omg-idl': 'OmgIdlLexer',
+    'oobas': 'VbNetLexer',
+    'ooc': 'OocLexer',
+    'opa': 'OpaLexer',
+    'openbugs': 'BugsLexer',
+    'openedge': 'OpenEdgeLexer',
+    'openrc': 'BashLexer',
+    'openscad': 'OpenScadLexer',
+    'org': 'OrgLexer',
+    'org-mode': 'OrgLexer',
+    'orgmode': 'OrgLexer',
+    'output': 'OutputLexer',
+    'pacmanconf': 'PacmanConfLexer',
+    'pan': 'PanLexer',
+    'parasail': 'ParaSailLexer',
+    'pas': 'DelphiLexer',
+    'pascal': 'DelphiLexer',
+    'pawn': 'PawnLexer',
+    'pcmk': 'CrmshLexer',
+    'pddl': 'PddlLexer',
+    'peg': 'PegLexer',
+    'pem': 'AscLexer',
+    'perl': 'PerlLexer',
+    'perl6': 'Perl6Lexer',
+    'phix': 'PhixLexer',
+    'php': 'PhpLexer',
+    'php3': 'PhpLexer',
+    'php4': 'PhpLexer',
+    'php5': 'PhpLexer',
+    'pig': 'PigLexer',
+    'pike': 'PikeLexer',
+    'pkgconfig': 'PkgConfigLexer',
+    'pl': 'PerlLexer',
+    'pl6': 'Perl6Lexer',
+    'plpgsql': 'PlPgsqlLexer',
+    'po': 'GettextLexer',
+    'pointless': 'PointlessLexer',
+    'pony': 'PonyLexer',
+    'portugol': 'PortugolLexer',
+    'posh': 'PowerShellLexer',
+    'postgres': 'PostgresLexer',
+    'postgres-console': 'PostgresConsoleLexer',
+    'postgres-explain': 'PostgresExplainLexer',
+    'postgresql': 'PostgresLexer',
+    'postgresql-console': 'PostgresConsoleLexer',
+    'postscr': 'PostScriptLexer',
+    'postscript': 'PostScriptLexer',
+    'pot': 'GettextLexer',
+    'pov': 'PovrayLexer',
+    'powershell': 'PowerShellLexer',
+    'praat': 'PraatLexer',
+    'procfile': 'ProcfileLexer',
+    'progress': 'OpenEdgeLexer',
+    'prolog': 'PrologLexer',
+    'promela': 'PromelaLexer',
+    'promql': 'PromQLLexer',
+    'properties': 'PropertiesLexer',
+    'proto': 'ProtoBufLexer',
+    'protobuf': 'ProtoBufLexer',
+    'prql': 'PrqlLexer',
+    'ps1': 'PowerShellLexer',
+    'ps1con': 'PowerShellSessionLexer',
+    'psm1': 'PowerShellLexer',
+    'psql': 'PostgresConsoleLexer',
+    'psysh': 'PsyshConsoleLexer',
+    'ptx': 'PtxLexer',
+    'pug': 'PugLexer',
+    'puppet': 'PuppetLexer',
+    'pwsh': 'PowerShellLexer',
+    'pwsh-session': 'PowerShellSessionLexer',
+    'py': 'PythonLexer',
+    'py+ul4': 'PythonUL4Lexer',
+    'py2': 'Python2Lexer',
+    'py2tb': 'Python2TracebackLexer',
+    'py3': 'PythonLexer',
+    'py3tb': 'PythonTracebackLexer',
+    'pycon': 'PythonConsoleLexer',
+    'pyi': 'PythonLexer',
+    'pypy': 'PyPyLogLexer',
+    'pypylog': 'PyPyLogLexer',
+    'pyrex': 'CythonLexer',
+    'pytb': 'PythonTracebackLexer',
+    'python': 'PythonLexer',
+    'python-console': 'PythonConsoleLexer',
+    'python2': 'Python2Lexer',
+    'python3': 'PythonLexer',
+    'pyx': 'CythonLexer',
+    'q': 'QLexer',
+    'qbasic': 'QBasicLexer',
+    'qbs': 'QmlLexer',
+    'ql': 'CodeQLLexer',
+    'qlik': 'QlikLexer',
+    'qlikscript': 'QlikLexer',
+    'qliksense': 'QlikLexer',
+    'qlikview': 'QlikLexer',
+    'qml': 'QmlLexer',
+    'qvt': 'QVToLexer',
+    'qvto': 'QVToLexer',
+    'r': 'SLexer',
+    'racket': 'RacketLexer',
+    'ragel': 'RagelLexer',
+    'ragel-c': 'RagelCLexer',
+    'ragel-cpp': 'RagelCppLexer',
+    'ragel-d': 'RagelDLexer',
+    'ragel-em': 'RagelEmbeddedLexer',
+    'ragel-java': 'RagelJavaLexer',
+    'ragel-objc': 'RagelObjectiveCLexer',
+    'ragel-rb': 'RagelRubyLexer',
+    'ragel-ruby': 'RagelRubyLexer',
+    'raku': 'Perl6Lexer',
+    'rb': 'RubyLexer',
+    'rbcon': 'RubyConsoleLexer',
+    'rconsole': 'RConsoleLexer',
+    'rd': 'RdLexer',
+    'react': 'JsxLexer',
+    'reason': 'ReasonLexer',
+    'reasonml': 'ReasonLexer',
+    'rebol': 'RebolLexer',
+    'red': 'RedLexer',
+    'red/system': 'RedLexer',
+    'redcode': 'RedcodeLexer',
+    'registry': 'RegeditLexer',
+    'rego': 'RegoLexer',
+    'resource': 'ResourceLexer',
+    'resourcebundle': 'ResourceLexer',
+    'rest': 'RstLexer',
+    'restructuredtext': 'RstLexer',
+    'rexx': 'RexxLexer',
+    'rhtml': 'RhtmlLexer',
+    'ride': 'RideLexer',
+    'rita': 'RitaLexer',
+    'rkt': 'RacketLexer',
+    'rnc': 'RNCCompactLexer',
+    'rng-compact': 'RNCCompactLexer',
+    'roboconf-graph': 'RoboconfGraphLexer',
+    'roboconf-instances': 'RoboconfInstancesLexer',
+    'robotframework': 'RobotFrameworkLexer',
+    'rout': 'RConsoleLexer',
+    'rql': 'RqlLexer',
+    'rs': 'RustLexer',
+    'rsl': 'RslLexer',
+    'rst': 'RstLexer',
+    'rts': 'RtsLexer',
+    'ruby': 'RubyLexer',
+    'rust': 'RustLexer',
+    's': 'SLexer',
+    'sage': 'PythonLexer',
+    'salt': 'YamlJinjaLexer',
+    'sarl': 'SarlLexer',
+    'sas': 'SASLexer',
+    'sass': 'SassLexer',
+    'savi': 'SaviLexer',
+    'sbatch': 'SlurmBashLexer',
+    'sc': 'SuperColliderLexer',
+    'scala': 'ScalaLexer',
+    'scaml': 'ScamlLexer',
+    'scd': 'ScdocLexer',
+    'scdoc': 'ScdocLexer',
+    'scheme': 'SchemeLexer',
+    'scilab': 'ScilabLexer',
+    'scm': 'SchemeLexer',
+    'scss': 'ScssLexer',
+    'sed': 'SedLexer',
+    'sgf': 'SmartGameFormatLexer',
+    'sh': 'BashLexer',
+    'shell': 'BashLexer',
+    'shell-session': 'BashSessionLexer',
+    'shen': 'ShenLexer',
+    'shex': 'ShExCLexer',
+    'shexc': 'ShExCLexer',
+    'sieve': 'SieveLexer',
+    'silver': 'SilverLexer',
+    'singularity': 'SingularityLexer',
+    'slash': 'SlashLexer',
+    'slim': 'SlimLexer',
+    'sls': 'YamlJinjaLexer',
+    'slurm': 'SlurmBashLexer',
+    'smali': 'SmaliLexer',
+    'smalltalk': 'SmalltalkLexer',
+    'smarty': 'SmartyLexer',
+    'smithy': 'SmithyLexer',
+    'sml': 'SMLLexer',
+    'snbt': 'SNBTLexer',
+    'snobol': 'SnobolLexer',
+    'snowball': 'SnowballLexer',
+    'sobas': 'VbNetLexer',
+    'solidity': 'SolidityLexer',
+    'soong': 'SoongLexer',
+    'sophia': 'SophiaLexer',
+    'sources.list': 'SourcesListLexer',
+    'sourceslist': 'SourcesListLexer',
+    'sp': 'SourcePawnLexer',
+    'sparql': 'SparqlLexer',
+    'spec': 'RPMSpecLexer',
+    'spice': 'SpiceLexer',
+    'spicelang': 'SpiceLexer',
+    'spitfire': 'CheetahLexer',
+    'splus': 'SLexer',
+    'sql': 'SqlLexer',
+    'sql+jinja': 'SqlJinjaLexer',
+    'sqlite3': 'SqliteConsoleLexer',
+    'squeak': 'SmalltalkLexer',
+    'squid': 'SquidConfLexer',
+    'squid.conf': 'SquidConfLexer',
+    'squidconf': 'SquidConfLexer',
+    'srcinfo': 'SrcinfoLexer',
+    'ssed': 'SedLexer',
+    'ssp': 'SspLexer',
+    'st': 'SmalltalkLexer',
+    'stan': 'StanLexer',
+    'starlark': 'PythonLexer',
+    'stata': 'StataLexer',
+    'supercollider': 'SuperColliderLexer',
+    'sv': 'SystemVerilogLexer',
+    'swift': 'SwiftLexer',
+    'swig': 'SwigLexer',
+    'systemd': 'SystemdLexer',
+    'systemverilog': 'SystemVerilogLexer',
+    't-sql': 'TransactSqlLexer',
+    'tablegen': 'TableGenLexer',
+    'tact': 'TactLexer',
+    'tads3': 'Tads3Lexer',
+    'tal': 'TalLexer',
+    'tap': 'TAPLexer',
+    'tasm': 'TasmLexer',
+    'tcl': 'TclLexer',
+    'tcsh': 'TcshLexer',
+    'tcshcon': 'TcshSessionLexer',
+    'td': 'TableGenLexer',
+    'tea': 'TeaTemplateLexer',
+    'teal': 'TealLexer',
+    'teraterm': 'TeraTermLexer',
+    'teratermmacro': 'TeraTermLexer',
+    'termcap': 'TermcapLexer',
+    'terminfo': 'TerminfoLexer',
+    'terraform': 'TerraformLexer',
+    'tex': 'TexLexer',
+    'text': 'TextLexer',
+    'tf': 'TerraformLexer',
+    'thingsdb': 'ThingsDBLexer',
+    'thrift': 'ThriftLexer',
+    'ti': 'ThingsDBLexer',
+    'tid': 'TiddlyWiki5Lexer',
+    'tlb': 'TlbLexer',
+    'tls': 'TlsLexer',
+    'tnt': 'TNTLexer',
+    'todotxt': 'TodotxtLexer',
+    'toml': 'TOMLLexer',
+    'trac-wiki': 'MoinWikiLexer',
+    'trafficscript': 'RtsLexer',
+    'treetop': 'TreetopLexer',
+    'ts': 'TypeScriptLexer',
+    'tsql': 'TransactSqlLexer',
+    'tsx': 'TsxLexer',
+    'ttl': 'TeraTermLexer',
+    'turtle': 'TurtleLexer',
+    'twig': 'TwigLexer',
+    'typescript': 'TypeScriptLexer',
+    'typoscript': 'TypoScriptLexer',
+    'typoscriptcssdata': 'TypoScriptCssDataLexer',
+    'typoscripthtmldata': 'TypoScriptHtmlDataLexer',
+    'typst': 'TypstLexer',
+    'ucode': 'UcodeLexer',
+    'udiff': 'DiffLexer',
+    'ul4': 'UL4Lexer',
+    'unicon': 'UniconLexer',
+    'unixconfig': 'UnixConfigLexer',
+    'urbiscript': 'UrbiscriptLexer',
+    'urlencoded': 'UrlEncodedLexer',
+    'usd': 'UsdLexer',
+    'usda': 'UsdLexer',
+    'uxntal': 'TalLexer',
+    'v': 'VerilogLexer',
+    'vala': 'ValaLexer',
+    'vapi': 'ValaLexer',
+    'vb.net': 'VbNetLexer',
+    'vbnet': 'VbNetLexer',
+    'vbscript': 'VBScriptLexer',
+    'vcl': 'VCLLexer',
+    'vclsnippet': 'VCLSnippetLexer',
+    'vclsnippets': 'VCLSnippetLexer',
+    'vctreestatus': 'VCTreeStatusLexer',
+    'velocity': 'VelocityLexer',
+    'verifpal': 'VerifpalLexer',
+    'verilog': 'VerilogLexer',
+    'vfp': 'FoxProLexer',
+    'vgl': 'VGLLexer',
+    'vhdl': 'VhdlLexer',
+    'vim': 'VimLexer',
+    'visual-basic': 'VbNetLexer',
+    'visualbasic': 'VbNetLexer',
+    'visualprolog': 'VisualPrologLexer',
+    'visualprologgrammar': 'VisualPrologGrammarLexer',
+    'vue': 'VueLexer',
+    'vyper': 'VyperLexer',
+    'wast': 'WatLexer',
+    'wat': 'WatLexer',
+    'wdiff': 'WDiffLexer',
+    'webidl': 'WebIDLLexer',
+    'wgsl': 'WgslLexer',
+    'whiley': 'WhileyLexer',
+    'wikitext': 'WikitextLexer',
+    'winbatch': 'BatchLexer',
+    'winbugs': 'BugsLexer',
+    'wowtoc': 'WoWTocLexer',
+    'wren': 'WrenLexer',
+    'x++': 'XppLexer',
+    'x10': 'X10Lexer',
+    'xbase': 'FoxProLexer',
+    'xml': 'XmlLexer',
+    'xml+cheetah': 'CheetahXmlLexer',
+    'xml+django': 'XmlDjangoLexer',
+    'xml+erb': 'XmlErbLexer',
+    'xml+evoque': 'EvoqueXmlLexer',
+    'xml+genshi': 'GenshiLexer',
+    'xml+jinja': 'XmlDjangoLexer',
+    'xml+kid': 'GenshiLexer',
+    'xml+lasso': 'LassoXmlLexer',
+    'xml+mako': 'MakoXmlLexer',
+    'xml+myghty': 'MyghtyXmlLexer',
+    'xml+php': 'XmlPhpLexer',
+    'xml+ruby': 'XmlErbLexer',
+    'xml+smarty': 'XmlSmartyLexer',
+    'xml+spitfire': 'CheetahXmlLexer',
+    'xml+ul4': 'XMLUL4Lexer',
+    'xml+velocity': 'VelocityXmlLexer',
+    'xorg.conf': 'XorgLexer',
+    'xpp': 'XppLexer',
+    'xq': 'XQueryLexer',
+    'xql': 'XQueryLexer',
+    'xqm': 'XQueryLexer',
+    'xquery': 'XQueryLexer',
+    'xqy': 'XQueryLexer',
+    'xslt': 'XsltLexer',
+    'xten': 'X10Lexer',
+    'xtend': 'XtendLexer',
+    'xul+mozpreproc': 'MozPreprocXulLexer',
+    'yaml': 'YamlLexer',
+    'yaml+jinja': 'YamlJinjaLexer',
+    'yang': 'YangLexer',
+    'yar': 'YaraLexer',
+    'yara': 'YaraLexer',
+    'zeek': 'ZeekLexer',
+    'zephir': 'ZephirLexer',
+    'zetasql': 'GoogleSqlLexer',
+    'zig': 'ZigLexer',
+    'zone': 'DnsZoneLexer',
+    'zsh': 'BashLexer',
+    '🔥': 'MojoLexer',
+}
+
+LEXER_MIMETYPES = {
+    'application/atom+xml': 'XmlLexer',
+    'application/javascript': 'JavascriptLexer',
+    'application/jsgf': 'JsgfLexer',
+    'application/json': 'JsonLexer',
+    'application/json-object': 'JsonLexer',
+    'application/json-seq': 'JsonLexer',
+    'application/jsonl': 'JsonLexer',
+    'application/juttle': 'JuttleLexer',
+    'application/kal': 'KalLexer',
+    'application/ld+json': 'JsonLdLexer',
+    'application/mathematica': 'MathematicaLexer',
+    'application/pem-certificate-chain': 'AscLexer',
+    'application/pgp-encrypted': 'AscLexer',
+    'application/pgp-keys': 'AscLexer',
+    'application/pgp-signature': 'AscLexer',
+    'application/postscript': 'PostScriptLexer',
+    'application/prql': 'PrqlLexer',
+    'application/rss+xml': 'XmlLexer',
+    'application/sparql-query': 'SparqlLexer',
+    'application/supercollider': 'SuperColliderLexer',
+    'application/toml': 'TOMLLexer',
+    'application/vnd.wolfram.cdf': 'MathematicaLexer',
+    'application/vnd.wolfram.mathematica': 'MathematicaLexer',
+    'application/vnd.wolfram.mathematica.package': 'MathematicaLexer',
+    'application/x-actionscript': 'ActionScriptLexer',
+    'application/x-actionscript3': 'ActionScript3Lexer',
+    'application/x-awk': 'AwkLexer',
+    'application/x-befunge': 'BefungeLexer',
+    'application/x-berry': 'BerryLexer',
+    'application/x-brainfuck': 'BrainfuckLexer',
+    'application/x-chaiscript': 'ChaiscriptLexer',
+    'application/x-cheetah': 'CheetahLexer',
+    'application/x-clojure': 'ClojureLexer',
+    'application/x-clojurescript': 'ClojureScriptLexer',
+    'application/x-coldfusion': 'ColdfusionHtmlLexer',
+    'application/x-csh': 'TcshLexer',
+    'application/x-cython': 'CythonLexer',
+    'application/x-desktop': 'DesktopLexer',
+    'application/x-django-templating': 'DjangoLexer',
+    'application/x-dos-batch': 'BatchLexer',
+    'application/x-ecl': 'ECLLexer',
+    'application/x-elisp': 'EmacsLispLexer',
+    'application/x-evoque': 'EvoqueLexer',
+    'application/x-fantom': 'FantomLexer',
+    'application/x-fish': 'FishShellLexer',
+    'application/x-forth': 'ForthLexer',
+    'application/x-gdscript': 'GDScriptLexer',
+    'application/x-genshi': 'GenshiLexer',
+    'application/x-genshi-text': 'GenshiTextLexer',
+    'application/x-gettext': 'GettextLexer',
+    'application/x-gooddata-maql': 'MaqlLexer',
+    'application/x-httpd-lasso': 'LassoHtmlLexer',
+    'application/x-httpd-lasso[89]': 'LassoHtmlLexer',
+    'application/x-httpd-php': 'HtmlPhpLexer',
+    'application/x-httpd-php3': 'HtmlPhpLexer',
+    'application/x-httpd-php4': 'HtmlPhpLexer',
+    'application/x-httpd-php5': 'HtmlPhpLexer',
+    'application/x-hy': 'HyLexer',
+    'application/x-hybris': 'HybrisLexer',
+    'application/x-janet': 'JanetLexer',
+    'application/x-javascript': 'JavascriptLexer',
+    'application/x-javascript+cheetah': 'CheetahJavascriptLexer',
+    'application/x-javascript+django': 'JavascriptDjangoLexer',
+    'application/x-javascript+genshi': 'JavascriptGenshiLexer',
+    'application/x-javascript+jinja': 'JavascriptDjangoLexer',
+    'application/x-javascript+lasso': 'LassoJavascriptLexer',
+    'application/x-javascript+mako': 'MakoJavascriptLexer',
+    'application/x-javascript+myghty': 'MyghtyJavascriptLexer',
+    'application/x-javascript+php': 'JavascriptPhpLexer',
+    'application/x-javascript+ruby': 'JavascriptErbLexer',
+    'application/x-javascript+smarty': 'JavascriptSmartyLexer',
+    'application/x-javascript+spitfire': 'CheetahJavascriptLexer',
+    'application/x-jinja': 'DjangoLexer',
+    'application/x-jsgf': 'JsgfLexer',
+    'application/x-jsp': 'JspLexer',
+    'application/x-julia': 'JuliaLexer',
+    'application/x-juttle': 'JuttleLexer',
+    'application/x-kid': 'GenshiLexer',
+    'application/x-lua': 'LuaLexer',
+    'application/x-mako': 'MakoLexer',
+    'application/x-mason': 'MasonLexer',
+    'application/x-miniscript': 'MiniScriptLexer',
+    'application/x-mojo': 'MojoLexer',
+    'application/x-moonscript': 'MoonScriptLexer',
+    'application/x-myghty': 'MyghtyLexer',
+    'application/x-ndjson': 'JsonLexer',
+    'application/x-newlisp': 'NewLispLexer',
+    'application/x-openedge': 'OpenEdgeLexer',
+    'application/x-openscad': 'OpenScadLexer',
+    'application/x-perl': 'PerlLexer',
+    'application/x-perl6': 'Perl6Lexer',
+    'application/x-php': 'HtmlPhpLexer',
+    'application/x-prql': 'PrqlLexer',
+    'application/x-pygments-binary-tokens': 'BinaryTokenLexer',
+    'application/x-pygments-tokens': 'RawTokenLexer',
+    'application/x-pypylog': 'PyPyLogLexer',
+    'application/x-python': 'PythonLexer',
+    'application/x-python2': 'Python2Lexer',
+    'application/x-python3': 'PythonLexer',
+    'application/x-qml': 'QmlLexer',
+    'application/x-qt.qbs+qml': 'QmlLexer',
+    'application/x-racket': 'RacketLexer',
+    'application/x-ruby': 'RubyLexer',
+    'application/x-ruby-templating': 'ErbLexer',
+    'application/x-sas': 'SASLexer',
+    'application/x-scheme': 'SchemeLexer',
+    'application/x-sh': 'BashLexer',
+    'application/x-sh-session': 'BashSessionLexer',
+    'application/x-shell-session': 'BashSessionLexer',
+    'application/x-shellscript': 'BashLexer',
+    'application/x-shen': 'ShenLexer',
+    'application/x-smarty': 'SmartyLexer',
+    'application/x-spitfire': 'CheetahLexer',
+    'application/x-ssp': 'SspLexer',
+    'application/x-standardml': 'SMLLexer',
+    'application/x-stata': 'StataLexer',
+    'application/x-tcl': 'TclLexer',
+    'application/x-terraform': 'TerraformLexer',
+    'application/x-tf': 'TerraformLexer',
+    'application/x-thrift': 'ThriftLexer',
+    'application/x-troff': 'GroffLexer',
+    'application/x-turtle': 'TurtleLexer',
+    'application/x-twig': 'TwigLexer',
+    'application/x-typescript': 'TypeScriptLexer',
+    'application/x-urbiscript': 'UrbiscriptLexer',
+    'application/x-www-form-urlencoded': 'UrlEncodedLexer',
+    'application/xhtml+xml': 'HtmlLexer',
+    'application/xml': 'XmlLexer',
+    'application/xml+cheetah': 'CheetahXmlLexer',
+    'application/xml+django': 'XmlDjangoLexer',
+    'application/xml+evoque': 'EvoqueXmlLexer',
+    'application/xml+jinja': 'XmlDjangoLexer',
+    'application/xml+lasso': 'LassoXmlLexer',
+    'application/xml+mako': 'MakoXmlLexer',
+    'application/xml+myghty': 'MyghtyXmlLexer',
+    'application/xml+php': 'XmlPhpLexer',
+    'application/xml+ruby': 'XmlErbLexer',
+    'application/xml+smarty': 'XmlSmartyLexer',
+    'application/xml+spitfire': 'CheetahXmlLexer',
+    'application/xml+velocity': 'VelocityXmlLexer',
+    'application/xml-dtd': 'DtdLexer',
+    'application/xquery': 'XQueryLexer',
+    'application/xsl+xml': 'XsltLexer',
+    'application/xslt+xml': 'XsltLexer',
+    'application/yang': 'YangLexer',
+    'image/svg+xml': 'XmlLexer',
+    'image/x-xbitmap': 'CLexer',
+    'image/x-xpixmap': 'CLexer',
+    'message/rfc822': 'EmailLexer',
+    'multipart/alternative': 'MIMELexer',
+    'multipart/mixed': 'MIMELexer',
+    'multipart/related': 'MIMELexer',
+    'text/S': 'SLexer',
+    'text/S-plus': 'SLexer',
+    'text/actionscript': 'ActionScriptLexer',
+    'text/actionscript3': 'ActionScript3Lexer',
+    'text/basic': 'QBasicLexer',
+    'text/coffeescript': 'CoffeeScriptLexer',
+    'text/css': 'CssLexer',
+    'text/css+django': 'CssDjangoLexer',
+    'text/css+genshi': 'CssGenshiLexer',
+    'text/css+jinja': 'CssDjangoLexer',
+    'text/css+lasso': 'LassoCssLexer',
+    'text/css+mako': 'MakoCssLexer',
+    'text/css+myghty': 'MyghtyCssLexer',
+    'text/css+php': 'CssPhpLexer',
+    'text/css+ruby': 'CssErbLexer',
+    'text/css+smarty': 'CssSmartyLexer',
+    'text/dns': 'DnsZoneLexer',
+    'text/gettext': 'GettextLexer',
+    'text/haxe': 'HaxeLexer',
+    'text/html': 'HtmlLexer',
+    'text/html+cheetah': 'CheetahHtmlLexer',
+    'text/html+django': 'HtmlDjangoLexer',
+    'text/html+evoque': 'EvoqueHtmlLexer',
+    'text/html+genshi': 'HtmlGenshiLexer',
+    'text/html+handlebars': 'HandlebarsHtmlLexer',
+    'text/html+jinja': 'HtmlDjangoLexer',
+    'text/html+lasso': 'LassoHtmlLexer',
+    'text/html+mako': 'MakoHtmlLexer',
+    'text/html+myghty': 'MyghtyHtmlLexer',
+    'text/html+ruby': 'RhtmlLexer',
+    'text/html+smarty': 'HtmlSmartyLexer',
+    'text/html+spitfire': 'CheetahHtmlLexer',
+    'text/html+twig': 'TwigHtmlLexer',
+    'text/html+velocity': 'VelocityHtmlLexer',
+    'text/idl': 'IDLLexer',
+    'text/inf': 'IniLexer',
+    'text/ipf': 'IgorLexer',
+    'text/javascript': 'JavascriptLexer',
+    'text/javascript+cheetah': 'CheetahJavascriptLexer',
+    'text/javascript+django': 'JavascriptDjangoLexer',
+    'text/javascript+genshi': 'JavascriptGenshiLexer',
+    'text/javascript+jinja': 'JavascriptDjangoLexer',
+    'text/javascript+lasso': 'LassoJavascriptLexer',
+    'text/javascript+mako': 'MakoJavascriptLexer',
+    'text/javascript+mygthy': 'MyghtyJavascriptLexer',
+    'text/javascript+php': 'JavascriptPhpLexer',
+    'text/javascript+ruby': 'JavascriptErbLexer',
+    'text/javascript+smarty': 'JavascriptSmartyLexer',
+    'text/javascript+spitfire': 'CheetahJavascriptLexer',
+    'text/jsgf': 'JsgfLexer',
+    'text/jsx': 'JsxLexer',
+    'text/juttle': 'JuttleLexer',
+    'text/kal': 'KalLexer',
+    'text/limbo': 'LimboLexer',
+    'text/livescript': 'LiveScriptLexer',
+    'text/matlab': 'MatlabLexer',
+    'text/mcfunction': 'MCFunctionLexer',
+    'text/mcschema': 'MCSchemaLexer',
+    'text/ncl': 'NCLLexer',
+    'text/octave': 'OctaveLexer',
+    'text/odin': 'OdinLexer',
+    'text/org': 'OrgLexer',
+    'text/plain': 'TextLexer',
+    'text/prs.fallenstein.rst': 'RstLexer',
+    'text/rita': 'RitaLexer',
+    'text/rsl': 'RslLexer',
+    'text/rust': 'RustLexer',
+    'text/sas': 'SASLexer',
+    'text/scilab': 'ScilabLexer',
+    'text/shex': 'ShExCLexer',
+    'text/smali': 'SmaliLexer',
+    'text/snbt': 'SNBTLexer',
+    'text/stata': 'StataLexer',
+    'text/supercollider': 'SuperColliderLexer',
+    'text/swig': 'SwigLexer',
+    'text/troff': 'GroffLexer',
+    'text/turtle': 'TurtleLexer',
+    'text/typescript-jsx': 'JsxLexer',
+    'text/typescript-tsx': 'TsxLexer',
+    'text/unicon': 'UniconLexer',
+    'text/vnd.graphviz': 'GraphvizLexer',
+    'text/vnd.tiddlywiki': 'TiddlyWiki5Lexer',
+    'text/wgsl': 'WgslLexer',
+    'text/x-R': 'SLexer',
+    'text/x-abap': 'ABAPLexer',
+    'text/x-abnf': 'AbnfLexer',
+    'text/x-actionscript': 'ActionScriptLexer',
+    'text/x-actionscript3': 'ActionScript3Lexer',
+    'text/x-ada': 'AdaLexer',
+    'text/x-agda': 'AgdaLexer',
+    'text/x-alloy': 'AlloyLexer',
+    'text/x-ambienttalk': 'AmbientTalkLexer',
+    'text/x-apacheconf': 'ApacheConfLexer',
+    'text/x-arduino': 'ArduinoLexer',
+    'text/x-aspectj': 'AspectJLexer',
+    'text/x-asymptote': 'AsymptoteLexer',
+    'text/x-autohotkey': 'AutohotkeyLexer',
+    'text/x-autoit': 'AutoItLexer',
+    'text/x-bb': 'BlitzBasicLexer',
+    'text/x-bbcode': 'BBCodeLexer',
+    'text/x-bdd': 'BddLexer',
+    'text/x-berry': 'BerryLexer',
+    'text/x-bibtex': 'BibTeXLexer',
+    'text/x-blueprint': 'BlueprintLexer',
+    'text/x-bmx': 'BlitzMaxLexer',
+    'text/x-bnf': 'BnfLexer',
+    'text/x-boo': 'BooLexer',
+    'text/x-c': 'DevicetreeLexer',
+    'text/x-c++hdr': 'CppLexer',
+    'text/x-c++src': 'CppLexer',
+    'text/x-c-objdump': 'CObjdumpLexer',
+    'text/x-carbon': 'CarbonLexer',
+    'text/x-cddl': 'CddlLexer',
+    'text/x-ceylon': 'CeylonLexer',
+    'text/x-chaiscript': 'ChaiscriptLexer',
+    'text/x-chdr': 'CLexer',
+    'text/x-cirru': 'CirruLexer',
+    'text/x-clay': 'ClayLexer',
+    'text/x-clojure': 'ClojureLexer',
+    'text/x-clojurescript': 'ClojureScriptLexer',
+    'text/x-cmake': 'CMakeLexer',
+    'text/x-cobol': 'CobolLexer',
+    'text/x-common-lisp': 'CommonLispLexer',
+    'text/x-component-pascal': 'ComponentPascalLexer',
+    'text/x-coq': 'CoqLexer',
+    'text/x-cplint': 'CplintLexer',
+    'text/x-cpp-objdump': 'CppObjdumpLexer',
+    'text/x-crocsrc': 'CrocLexer',
+    'text/x-cryptol': 'CryptolLexer',
+    'text/x-crystal': 'CrystalLexer',
+    'text/x-csharp': 'CSharpLexer',
+    'text/x-csrc': 'CLexer',
+    'text/x-cuda': 'CudaLexer',
+    'text/x-cython': 'CythonLexer',
+    'text/x-d-objdump': 'DObjdumpLexer',
+    'text/x-dart': 'DartLexer',
+    'text/x-dasm16': 'Dasm16Lexer',
+    'text/x-dg': 'DgLexer',
+    'text/x-diff': 'DiffLexer',
+    'text/x-dockerfile-config': 'DockerLexer',
+    'text/x-dsrc': 'DLexer',
+    'text/x-duel': 'DuelLexer',
+    'text/x-dylan': 'DylanLexer',
+    'text/x-dylan-console': 'DylanConsoleLexer',
+    'text/x-dylan-lid': 'DylanLidLexer',
+    'text/x-earl-grey': 'EarlGreyLexer',
+    'text/x-easytrieve': 'EasytrieveLexer',
+    'text/x-ebnf': 'EbnfLexer',
+    'text/x-echdr': 'ECLexer',
+    'text/x-ecsrc': 'ECLexer',
+    'text/x-eiffel': 'EiffelLexer',
+    'text/x-elisp': 'EmacsLispLexer',
+    'text/x-elixir': 'ElixirLexer',
+    'text/x-elixir-shellsession': 'ElixirConsoleLexer',
+    'text/x-elm': 'ElmLexer',
+    'text/x-elpi': 'ElpiLexer',
+    'text/x-erl-shellsession': 'ErlangShellLexer',
+    'text/x-erlang': 'ErlangLexer',
+    'text/x-ezhil': 'EzhilLexer',
+    'text/x-factor': 'FactorLexer',
+    'text/x-fancysrc': 'FancyLexer',
+    'text/x-felix': 'FelixLexer',
+    'text/x-flatline': 'FlatlineLexer',
+    'text/x-fortran': 'FortranLexer',
+    'text/x-freefem': 'FreeFemLexer',
+    'text/x-fsharp': 'FSharpLexer',
+    'text/x-fstar': 'FStarLexer',
+    'text/x-futhark': 'FutharkLexer',
+    'text/x-gas': 'GasLexer',
+    'text/x-gdscript': 'GDScriptLexer',
+    'text/x-genshi': 'GenshiTextLexer',
+    'text/x-gettext': 'GettextLexer',
+    'text/x-gherkin': 'GherkinLexer',
+    'text/x-gleam': 'GleamLexer',
+    'text/x-glslsrc': 'GLShaderLexer',
+    'text/x-gnuplot': 'GnuplotLexer',
+    'text/x-gooddata-cl': 'GoodDataCLLexer',
+    'text/x-gooddata-maql': 'MaqlLexer',
+    'text/x-google-sql': 'GoogleSqlLexer',
+    'text/x-google-sql-aux': 'GoogleSqlLexer',
+    'text/x-gosrc': 'GoLexer',
+    'text/x-gosu': 'GosuLexer',
+    'text/x-gosu-template': 'GosuTemplateLexer',
+    'text/x-graphviz': 'GraphvizLexer',
+    'text/x-groovy': 'GroovyLexer',
+    'text/x-haml': 'HamlLexer',
+    'text/x-handlebars-template': 'HandlebarsHtmlLexer',
+    'text/x-hare': 'HareLexer',
+    'text/x-haskell': 'HaskellLexer',
+    'text/x-haxe': 'HaxeLexer',
+    'text/x-hlsl': 'HLSLShaderLexer',
+    'text/x-hsail': 'HsailLexer',
+    'text/x-hx': 'HaxeLexer',
+    'text/x-hy': 'HyLexer',
+    'text/x-hybris': 'HybrisLexer',
+    'text/x-idris': 'IdrisLexer',
+    'text/x-ini': 'IniLexer',
+    'text/x-iokesrc': 'IokeLexer',
+    'text/x-iosrc': 'IoLexer',
+    'text/x-irclog': 'IrcLogsLexer',
+    'text/x-isabelle': 'IsabelleLexer',
+    'text/x-j': 'JLexer',
+    'text/x-jade': 'PugLexer',
+    'text/x-janet': 'JanetLexer',
+    'text/x-java': 'JavaLexer',
+    'text/x-java-properties': 'PropertiesLexer',
+    'text/x-javascript': 'JavascriptLexer',
+    'text/x-javascript+cheetah': 'CheetahJavascriptLexer',
+    'text/x-javascript+django': 'JavascriptDjangoLexer',
+    'text/x-javascript+genshi': 'JavascriptGenshiLexer',
+    'text/x-javascript+jinja': 'JavascriptDjangoLexer',
+    'text/x-javascript+lasso': 'LassoJavascriptLexer',
+    'text/x-javascript+mako': 'MakoJavascriptLexer',
+    'text/x-javascript+myghty': 'MyghtyJavascriptLexer',
+    'text/x-javascript+php': 'JavascriptPhpLexer',
+    'text/x-javascript+ruby': 'JavascriptErbLexer',
+    'text/x-javascript+smarty': 'JavascriptSmartyLexer',
+    'text/x-javascript+spitfire': 'CheetahJavascriptLexer',
+    'text/x-jbst': 'DuelLexer',
+    'text/x-jcl': 'JclLexer',
+    'text/x-jslt': 'JSLTLexer',
+    'text/x-julia': 'JuliaLexer',
+    'text/x-juttle': 'JuttleLexer',
+    'text/x-kconfig': 'KconfigLexer',
+    'text/x-koka': 'KokaLexer',
+    'text/x-kotlin': 'KotlinLexer',
+    'text/x-lasso': 'LassoLexer',
+    'text/x-latex': 'TexLexer',
+    'text/x-ldapconf': 'LdaprcLexer',
+    'text/x-ldif': 'LdifLexer',
+    'text/x-lean': 'Lean3Lexer',
+    'text/x-lean3': 'Lean3Lexer',
+    'text/x-lean4': 'Lean4Lexer',
+    'text/x-less-css': 'LessCssLexer',
+    'text/x-lighttpd-conf': 'LighttpdConfLexer',
+    'text/x-literate-agda': 'LiterateAgdaLexer',
+    'text/x-literate-cryptol': 'LiterateCryptolLexer',
+    'text/x-literate-haskell': 'LiterateHaskellLexer',
+    'text/x-literate-idris': 'LiterateIdrisLexer',
+    'text/x-llvm': 'LlvmLexer',
+    'text/x-logos': 'LogosLexer',
+    'text/x-logtalk': 'LogtalkLexer',
+    'text/x-lsl': 'LSLLexer',
+    'text/x-lua': 'LuaLexer',
+    'text/x-makefile': 'MakefileLexer',
+    'text/x-maple': 'MapleLexer',
+    'text/x-markdown': 'MarkdownLexer',
+    'text/x-mask': 'MaskLexer',
+    'text/x-meson': 'MesonLexer',
+    'text/x-minicript': 'MiniScriptLexer',
+    'text/x-minidsrc': 'MiniDLexer',
+    'text/x-modelica': 'ModelicaLexer',
+    'text/x-modula2': 'Modula2Lexer',
+    'text/x-mojo': 'MojoLexer',
+    'text/x-monkey': 'MonkeyLexer',
+    'text/x-moocode': 'MOOCodeLexer',
+    'text/x-moonscript': 'MoonScriptLexer',
+    'text/x-mql': 'MqlLexer',
+    'text/x-mysql': 'MySqlLexer',
+    'text/x-nasm': 'NasmLexer',
+    'text/x-nasm-objdump': 'NasmObjdumpLexer',
+    'text/x-nemerle': 'NemerleLexer',
+    'text/x-nescsrc': 'NesCLexer',
+    'text/x-newlisp': 'NewLispLexer',
+    'text/x-newspeak': 'NewspeakLexer',
+    'text/x-nginx-conf': 'NginxConfLexer',
+    'text/x-nim': 'NimrodLexer',
+    'text/x-nix': 'NixLexer',
+    'text/x-nodejsrepl': 'NodeConsoleLexer',
+    'text/x-nsis': 'NSISLexer',
+    'text/x-numba_ir': 'NumbaIRLexer',
+    'text/x-numbair': 'NumbaIRLexer',
+    'text/x-objdump': 'ObjdumpLexer',
+    'text/x-objective-c': 'ObjectiveCLexer',
+    'text/x-objective-c++': 'ObjectiveCppLexer',
+    'text/x-objective-j': 'ObjectiveJLexer',
+    'text/x-ocaml': 'OcamlLexer',
+    'text/x-ooc': 'OocLexer',
+    'text/x-opa': 'OpaLexer',
+    'text/x-openedge': 'OpenEdgeLexer',
+    'text/x-parasail': 'ParaSailLexer',
+    'text/x-pascal': 'DelphiLexer',
+    'text/x-patch': 'DiffLexer',
+    'text/x-pawn': 'PawnLexer',
+    'text/x-peg': 'PegLexer',
+    'text/x-perl': 'PerlLexer',
+    'text/x-perl6': 'Perl6Lexer',
+    'text/x-phix': 'PhixLexer',
+    'text/x-php': 'PhpLexer',
+    'text/x-pig': 'PigLexer',
+    'text/x-pike': 'PikeLexer',
+    'text/x-plpgsql': 'PlPgsqlLexer',
+    'text/x-postgresql': 'PostgresLexer',
+    'text/x-postgresql-explain': 'PostgresExplainLexer',
+    'text/x-postgresql-psql': 'PostgresConsoleLexer',
+    'text/x-povray': 'PovrayLexer',
+    'text/x-powershell': 'PowerShellLexer',
+    'text/x-prolog': 'PrologLexer',
+    'text/x-promela': 'PromelaLexer',
+    'text/x-ptx': 'PtxLexer',
+    'text/x-pug': 'PugLexer',
+    'text/x-python': 'PythonLexer',
+    'text/x-python-doctest': 'PythonConsoleLexer',
+    'text/x-python-traceback': 'PythonTracebackLexer',
+    'text/x-python2': 'Python2Lexer',
+    'text/x-python2-traceback': 'Python2TracebackLexer',
+    'text/x-python3': 'PythonLexer',
+    'text/x-python3-traceback': 'PythonTracebackLexer',
+    'text/x-r': 'SLexer',
+    'text/x-r-doc': 'RdLexer',
+    'text/x-r-history': 'SLexer',
+    'text/x-r-profile': 'SLexer',
+    'text/x-r-source': 'SLexer',
+    'text/x-racket': 'RacketLexer',
+    'text/x-reasonml': 'ReasonLexer',
+    'text/x-rebol': 'RebolLexer',
+    'text/x-red': 'RedLexer',
+    'text/x-red-system': 'RedLexer',
+    'text/x-rego': 'RegoLexer',
+    'text/x-rexx': 'RexxLexer',
+    'text/x-ride': 'RideLexer',
+    'text/x-robotframework': 'RobotFrameworkLexer',
+    'text/x-rpm-spec': 'RPMSpecLexer',
+    'text/x-rql': 'RqlLexer',
+    'text/x-rst': 'RstLexer',
+    'text/x-ruby': 'RubyLexer',
+    'text/x-ruby-shellsession': 'RubyConsoleLexer',
+    'text/x-rust': 'RustLexer',
+    'text/x-sarl': 'SarlLexer',
+    'text/x-sas': 'SASLexer',
+    'text/x-sass': 'SassLexer',
+    'text/x-scala': 'ScalaLexer',
+    'text/x-scaml': 'ScamlLexer',
+    'text/x-scheme': 'SchemeLexer',
+    'text/x-script.tcl': 'TclLexer',
+    'text/x-scss': 'ScssLexer',
+    'text/x-sed': 'SedLexer',
+    'text/x-shellscript': 'BashLexer',
+    'text/x-shen': 'ShenLexer',
+    'text/x-slim': 'SlimLexer',
+    'text/x-sls': 'YamlJinjaLexer',
+    'text/x-smalltalk': 'SmalltalkLexer',
+    'text/x-snobol': 'SnobolLexer',
+    'text/x-sourcepawn': 'SourcePawnLexer',
+    'text/x-spice': 'SpiceLexer',
+    'text/x-sql': 'SqlLexer',
+    'text/x-sqlite3-console': 'SqliteConsoleLexer',
+    'text/x-squidconf': 'SquidConfLexer',
+    'text/x-standardml': 'SMLLexer',
+    'text/x-stata': 'StataLexer',
+    'text/x-swift': 'SwiftLexer',
+    'text/x-systemverilog': 'SystemVerilogLexer',
+    'text/x-tasm': 'TasmLexer',
+    'text/x-tcl': 'TclLexer',
+    'text/x-tea': 'TeaTemplateLexer',
+    'text/x-teratermmacro': 'TeraTermLexer',
+    'text/x-tex': 'TexLexer',
+    'text/x-todo': 'TodotxtLexer',
+    'text/x-trac-wiki': 'MoinWikiLexer',
+    'text/x-tsql': 'TransactSqlLexer',
+    'text/x-typescript': 'TypeScriptLexer',
+    'text/x-typoscript': 'TypoScriptLexer',
+    'text/x-typst': 'TypstLexer',
+    'text/x-uxntal': 'TalLexer',
+    'text/x-vala': 'ValaLexer',
+    'text/x-vba': 'VbNetLexer',
+    'text/x-vbnet': 'VbNetLexer',
+    'text/x-vclsnippet': 'VCLSnippetLexer',
+    'text/x-vclsrc': 'VCLLexer',
+    'text/x-verifpal': 'VerifpalLexer',
+    'text/x-verilog': 'VerilogLexer',
+    'text/x-vhdl': 'VhdlLexer',
+    'text/x-vim': 'VimLexer',
+    'text/x-whiley': 'WhileyLexer',
+    'text/x-wiki': 'WikitextLexer',
+    'text/x-windows-registry': 'RegeditLexer',
+    'text/x-x10': 'X10Lexer',
+    'text/x-xtend': 'XtendLexer',
+    'text/x-yaml': 'YamlLexer',
+    'text/x-yaml+jinja': 'YamlJinjaLexer',
+    'text/x-yara': 'YaraLexer',
+    'text/xml': 'XmlLexer',
+    'text/xquery': 'XQueryLexer',
+    'text/zig': 'ZigLexer',
+}
+
+# Lexers by the extension of their ``*.ext`` filename patterns.
+LEXER_SUFFIXES = {
+    '.1p': ('GroffLexer',),
+    '.3pm': ('GroffLexer',),
+    '.6pl': ('Perl6Lexer',),
+    '.6pm': ('Perl6Lexer',),
+    '.ABAP': ('ABAPLexer',),
+    '.ASM': ('NasmLexer', 'TasmLexer'),
+    '.BAS': ('QBasicLexer',),
+    '.C': ('CppLexer',),
+    '.CBL': ('CobolFreeformatLexer',),
+    '.COB': ('CobolLexer',),
+    '.CPP': ('CppLexer',),
+    '.CPY': ('CobolLexer',),
+    '.F': ('FortranFixedLexer',),
+    '.F03': ('FortranLexer',),
+    '.F90': ('FortranLexer',),
+    '.G': ('AntlrActionScriptLexer', 'AntlrCSharpLexer', 'AntlrCppLexer', 'AntlrJavaLexer', 'AntlrObjectiveCLexer', 'AntlrPerlLexer', 'AntlrPythonLexer', 'AntlrRubyLexer'),
+    '.H': ('CppLexer',),
+    '.ICON': ('IconLexer',),
+    '.MIPS': ('MIPSLexer',),
+    '.P': ('CplintLexer',),
+    '.PRG': ('FoxProLexer',),
+    '.R': ('SLexer',),
+    '.Rd': ('RdLexer',),
+    '.Rout': ('RConsoleLexer',),
+    '.S': ('GasLexer', 'SLexer'),
+    '.SAS': ('SASLexer',),
+    '.VBS': ('VBScriptLexer',),
+    '.abap': ('ABAPLexer',),
+    '.abnf': ('AbnfLexer',),
+    '.ada': ('AdaLexer',),
+    '.adb': ('AdaLexer',),
+    '.adl': ('AdlLexer',),
+    '.adlf': ('AdlLexer',),
+    '.adls': ('AdlLexer',),
+    '.adlx': ('AdlLexer',),
+    '.ado': ('StataLexer',),
+    '.ads': ('AdaLexer',),
+    '.aes': ('SophiaLexer',),
+    '.agda': ('AgdaLexer',),
+    '.aheui': ('AheuiLexer',),
+    '.ahk': ('AutohotkeyLexer',),
+    '.ahkl': ('AutohotkeyLexer',),
+    '.aj': ('AspectJLexer',),
+    '.alg': ('PortugolLexer',),
+    '.als': ('AlloyLexer',),
+    '.ans': ('apdlexer',),
+    '.apl': ('APLLexer',),
+    '.aplc': ('APLLexer',),
+    '.aplf': ('APLLexer',),
+    '.apli': ('APLLexer',),
+    '.apln': ('APLLexer',),
+    '.aplo': ('APLLexer',),
+    '.applescript': ('AppleScriptLexer',),
+    '.arexx': ('RexxLexer',),
+    '.art': ('ArturoLexer',),
+    '.arw': ('ArrowLexer',),
+    '.as': ('ActionScript3Lexer', 'ActionScriptLexer'),
+    '.asax': ('CSharpAspxLexer', 'VbNetAspxLexer'),
+    '.asc': ('AscLexer',),
+    '.ascx': ('CSharpAspxLexer', 'VbNetAspxLexer'),
+    '.ashx': ('CSharpAspxLexer', 'VbNetAspxLexer'),
+    '.asm': ('NasmLexer', 'TasmLexer'),
+    '.asmx': ('CSharpAspxLexer', 'VbNetAspxLexer'),
+    '.asn1': ('Asn1Lexer',),
+    '.aspx': ('CSharpAspxLexer', 'VbNetAspxLexer'),
+    '.asy': ('AsymptoteLexer',),
+    '.at': ('AmbientTalkLexer',),
+    '.au3': ('AutoItLexer',),
+    '.aug': ('AugeasLexer',),
+    '.automount': ('SystemdLexer',),
+    '.aux': ('TexLexer',),
+    '.awk': ('AwkLexer',),
+    '.axd': ('CSharpAspxLexer', 'VbNetAspxLexer'),
+    '.b': ('BrainfuckLexer', 'LimboLexer'),
+    '.bare': ('BareLexer',),
+    '.bas': ('CbmBasicV2Lexer', 'QBasicLexer', 'VbNetLexer'),
+    '.bash': ('BashLexer',),
+    '.bat': ('BatchLexer',),
+    '.bb': ('BlitzBasicLexer',),
+    '.bbc': ('BBCBasicLexer',),
+    '.bc': ('BCLexer',),
+    '.be': ('BerryLexer',),
+    '.befunge': ('BefungeLexer',),
+    '.bf': ('BrainfuckLexer',),
+    '.bib': ('BibTeXLexer',),
+    '.blp': ('BlueprintLexer',),
+    '.bmx': ('BlitzMaxLexer',),
+    '.bnf': ('BnfLexer',),
+    '.boa': ('BoaLexer',),
+    '.boo': ('BooLexer',),
+    '.bpl': ('BoogieLexer',),
+    '.bqn': ('BQNLexer',),
+    '.bro': ('ZeekLexer',),
+    '.bst': ('BSTLexer',),
+    '.bug': ('BugsLexer', 'JagsLexer'),
+    '.bzl': ('PythonLexer',),
+    '.c': ('CLexer',),
+    '.c++': ('CppLexer',),
+    '.c++-objdump': ('CppObjdumpLexer',),
+    '.c-objdump': ('CObjdumpLexer',),
+    '.cadl': ('CadlLexer',),
+    '.camkes': ('CAmkESLexer',),
+    '.capnp': ('CapnProtoLexer',),
+    '.carbon': ('CarbonLexer',),
+    '.cbl': ('CobolFreeformatLexer',),
+    '.cc': ('CppLexer',),
+    '.cddl': ('CddlLexer',),
+    '.cdf': ('MathematicaLexer',),
+    '.cdl': ('CapDLLexer',),
+    '.ceylon': ('CeylonLexer',),
+    '.cf': ('Cfengine3Lexer',),
+    '.cfc': ('ColdfusionCFCLexer',),
+    '.cfg': ('IniLexer',),
+    '.cfm': ('ColdfusionHtmlLexer',),
+    '.cfml': ('ColdfusionHtmlLexer',),
+    '.chai': ('ChaiscriptLexer',),
+    '.chpl': ('ChapelLexer',),
+    '.ci': ('CharmciLexer',),
+    '.cirru': ('CirruLexer',),
+    '.cjs': ('JavascriptLexer',),
+    '.cl': ('CommonLispLexer', 'VisualPrologLexer'),
+    '.clay': ('ClayLexer',),
+    '.clj': ('ClojureLexer',),
+    '.cljc': ('ClojureLexer',),
+    '.cljs': ('ClojureScriptLexer',),
+    '.cls': ('OpenEdgeLexer',),
+    '.cmake': ('CMakeLexer',),
+    '.cmd': ('BatchLexer',),
+    '.cml': ('Comal80Lexer',),
+    '.cob': ('CobolLexer',),
+    '.coffee': ('CoffeeScriptLexer',),
+    '.comal': ('Comal80Lexer',),
+    '.cp': ('ComponentPascalLexer', 'CppLexer'),
+    '.cpl': ('CplintLexer',),
+    '.cpp': ('CppLexer',),
+    '.cpp-objdump': ('CppObjdumpLexer',),
+    '.cps': ('ComponentPascalLexer',),
+    '.cpsa': ('CPSALexer',),
+    '.cpy': ('CobolLexer',),
+    '.cr': ('CrystalLexer',),
+    '.crmsh': ('CrmshLexer',),
+    '.croc': ('CrocLexer',),
+    '.cry': ('CryptolLexer',),
+    '.cs': ('CSharpLexer',),
+    '.csd': ('CsoundDocumentLexer',),
+    '.csh': ('TcshLexer',),
+    '.css': ('CssLexer',),
+    '.css.in': ('MozPreprocCssLexer',),
+    '.css.j2': ('CssDjangoLexer',),
+    '.css.jinja2': ('CssDjangoLexer',),
+    '.cssul4': ('CSSUL4Lexer',),
+    '.cu': ('CudaLexer',),
+    '.cuh': ('CudaLexer',),
+    '.cw': ('RedcodeLexer',),
+    '.cxx': ('CppLexer',),
+    '.cxx-objdump': ('CppObjdumpLexer',),
+    '.cyp': ('CypherLexer',),
+    '.cypher': ('CypherLexer',),
+    '.d': ('DLexer',),
+    '.d-objdump': ('DObjdumpLexer',),
+    '.darcspatch': ('DarcsPatchLexer',),
+    '.dart': ('DartLexer',),
+    '.dasm': ('Dasm16Lexer',),
+    '.dasm16': ('Dasm16Lexer',),
+    '.dax': ('DaxLexer',),
+    '.dcl': ('CleanLexer',),
+    '.decls': ('BlitzBasicLexer',),
+    '.def': ('Modula2Lexer', 'SingularityLexer'),
+    '.desktop': ('DesktopLexer',),
+    '.device': ('SystemdLexer',),
+    '.dg': ('DgLexer',),
+    '.di': ('DLexer',),
+    '.diff': ('DiffLexer',),
+    '.dmesg': ('KernelLogLexer',),
+    '.do': ('StataLexer',),
+    '.docker': ('DockerLexer',),
+    '.dot': ('GraphvizLexer',),
+    '.dpatch': ('DarcsPatchLexer',),
+    '.dpr': ('DelphiLexer',),
+    '.dtd': ('DtdLexer',),
+    '.dts': ('DevicetreeLexer',),
+    '.dtsi': ('DevicetreeLexer',),
+    '.duby': ('RubyLexer',),
+    '.duel': ('DuelLexer',),
+    '.dyalog': ('APLLexer',),
+    '.dyl': ('DylanLexer',),
+    '.dylan': ('DylanLexer',),
+    '.dylan-console': ('DylanConsoleLexer',),
+    '.e': ('EiffelLexer',),
+    '.ebnf': ('EbnfLexer',),
+    '.ebuild': ('BashLexer',),
+    '.ec': ('ECLexer',),
+    '.ecl': ('CplintLexer', 'ECLLexer', 'PrologLexer'),
+    '.eclass': ('BashLexer',),
+    '.edp': ('FreeFemLexer',),
+    '.eex': ('ElixirLexer',),
+    '.eg': ('EarlGreyLexer',),
+    '.eh': ('ECLexer',),
+    '.el': ('EmacsLispLexer',),
+    '.elm': ('ElmLexer',),
+    '.elpi': ('ElpiLexer',),
+    '.eml': ('EmailLexer',),
+    '.eps': ('PostScriptLexer',),
+    '.erl': ('ErlangLexer',),
+    '.erl-sh': ('ErlangShellLexer',),
+    '.es': ('ErlangLexer',),
+    '.escript': ('ErlangLexer',),
+    '.evoque': ('EvoqueLexer',),
+    '.ex': ('ElixirLexer',),
+    '.exec': ('ExeclineLexer',),
+    '.exheres-0': ('BashLexer',),
+    '.exlib': ('BashLexer',),
+    '.explain': ('PostgresExplainLexer',),
+    '.exs': ('ElixirLexer',),
+    '.exw': ('PhixLexer',),
+    '.ezt': ('EasytrieveLexer',),
+    '.f': ('FortranFixedLexer',),
+    '.f03': ('FortranLexer',),
+    '.f90': ('FortranLexer',),
+    '.factor': ('FactorLexer',),
+    '.fan': ('FantomLexer',),
+    '.fancypack': ('FancyLexer',),
+    '.fc': ('FuncLexer',),
+    '.feature': ('BddLexer', 'GherkinLexer'),
+    '.fhtml': ('VelocityLexer',),
+    '.fif': ('FiftLexer',),
+    '.fish': ('FishShellLexer',),
+    '.flo': ('FloScriptLexer',),
+    '.flx': ('FelixLexer',),
+    '.flxh': ('FelixLexer',),
+    '.fnl': ('FennelLexer',),
+    '.frag': ('GLShaderLexer',),
+    '.frt': ('ForthLexer',),
+    '.fs': ('FSharpLexer', 'ForthLexer'),
+    '.fsi': ('FSharpLexer',),
+    '.fst': ('FStarLexer',),
+    '.fsti': ('FStarLexer',),
+    '.fsx': ('FSharpLexer',),
+    '.fun': ('SMLLexer',),
+    '.func': ('FuncLexer',),
+    '.fut': ('FutharkLexer',),
+    '.fy': ('FancyLexer',),
+    '.g': ('AntlrActionScriptLexer', 'AntlrCSharpLexer', 'AntlrCppLexer', 'AntlrJavaLexer', 'AntlrObjectiveCLexer', 'AntlrPerlLexer', 'AntlrPythonLexer', 'AntlrRubyLexer', 'GAPLexer'),
+    '.gap': ('GAPLexer',),
+    '.gcode': ('GcodeLexer',),
+    '.gd': ('GAPLexer', 'GDScriptLexer'),
+    '.gdc': ('GoodDataCLLexer',),
+    '.gemspec': ('RubyLexer',),
+    '.geo': ('GLShaderLexer',),
+    '.gi': ('GAPLexer',),
+    '.gleam': ('GleamLexer',),
+    '.go': ('GoLexer',),
+    '.golo': ('GoloLexer',),
+    '.googlesql': ('GoogleSqlLexer',),
+    '.googlesql.sql': ('GoogleSqlLexer',),
+    '.gradle': ('GroovyLexer',),
+    '.graph': ('RoboconfGraphLexer',),
+    '.graphql': ('GraphQLLexer',),
+    '.groovy': ('GroovyLexer',),
+    '.gs': ('GosuLexer',),
+    '.gsp': ('GosuLexer',),
+    '.gsql': ('GSQLLexer',),
+    '.gst': ('GosuTemplateLexer',),
+    '.gsx': ('GosuLexer',),
+    '.gv': ('GraphvizLexer',),
+    '.h': ('CLexer', 'ObjectiveCLexer'),
+    '.h++': ('CppLexer',),
+    '.ha': ('HareLexer',),
+    '.haml': ('HamlLexer',),
+    '.handlebars': ('HandlebarsHtmlLexer',),
+    '.hbs': ('HandlebarsHtmlLexer',),
+    '.hcl': ('TerraformLexer',),
+    '.hdp': ('DylanLidLexer',),
+    '.hh': ('CppLexer', 'ObjectiveCppLexer'),
+    '.hlsl': ('HLSLShaderLexer',),
+    '.hlsli': ('HLSLShaderLexer',),
+    '.hpp': ('CppLexer',),
+    '.hrl': ('ErlangLexer',),
+    '.hs': ('HaskellLexer',),
+    '.hsail': ('HsailLexer',),
+    '.htm': ('HtmlLexer',),
+    '.htm.j2': ('HtmlDjangoLexer',),
+    '.htm.jinja2': ('HtmlDjangoLexer',),
+    '.html': ('HtmlLexer',),
+    '.html.j2': ('HtmlDjangoLexer',),
+    '.html.jinja2': ('HtmlDjangoLexer',),
+    '.htmlul4': ('HTMLUL4Lexer',),
+    '.hx': ('HaxeLexer',),
+    '.hxml': ('HxmlLexer',),
+    '.hxsl': ('HaxeLexer',),
+    '.hxx': ('CppLexer',),
+    '.hy': ('HyLexer',),
+    '.hyb': ('HybrisLexer',),
+    '.i': ('SwigLexer', 'VisualPrologLexer'),
+    '.i6t': ('Inform6TemplateLexer',),
+    '.i7x': ('Inform7Lexer',),
+    '.icl': ('CleanLexer',),
+    '.icn': ('UniconLexer',),
+    '.icon': ('IconLexer',),
+    '.idc': ('CLexer',),
+    '.idl': ('OmgIdlLexer',),
+    '.idl4': ('CAmkESLexer',),
+    '.idr': ('IdrisLexer',),
+    '.ijs': ('JLexer',),
+    '.ik': ('IokeLexer',),
+    '.inc': ('PawnLexer', 'PhpLexer', 'PovrayLexer'),
+    '.inf': ('Inform6Lexer', 'IniLexer'),
+    '.ini': ('IniLexer',),
+    '.ino': ('ArduinoLexer',),
+    '.instances': ('RoboconfInstancesLexer',),
+    '.intr': ('DylanLexer',),
+    '.io': ('IoLexer',),
+    '.ipf': ('IgorLexer',),
+    '.isa': ('AMDGPULexer',),
+    '.j': ('JasminLexer', 'ObjectiveJLexer'),
+    '.jade': ('PugLexer',),
+    '.jag': ('JagsLexer',),
+    '.janet': ('JanetLexer',),
+    '.java': ('JavaLexer',),
+    '.jbst': ('DuelLexer',),
+    '.jcl': ('JclLexer',),
+    '.jdn': ('JanetLexer',),
+    '.jl': ('JuliaLexer',),
+    '.jp': ('JMESPathLexer',),
+    '.js': ('JavascriptLexer',),
+    '.js.in': ('MozPreprocJavascriptLexer',),
+    '.js.j2': ('JavascriptDjangoLexer',),
+    '.js.jinja2': ('JavascriptDjangoLexer',),
+    '.jsgf': ('JsgfLexer',),
+    '.jslt': ('JSLTLexer',),
+    '.jsm': ('JavascriptLexer',),
+    '.json': ('JsonLexer',),
+    '.json5': ('Json5Lexer',),
+    '.jsonl': ('JsonLexer',),
+    '.jsonld': ('JsonLdLexer',),
+    '.jsonnet': ('JsonnetLexer',),
+    '.jsp': ('JspLexer',),
+    '.jsul4': ('JavascriptUL4Lexer',),
+    '.jsx': ('JsxLexer',),
+    '.juttle': ('JuttleLexer',),
+    '.jy': ('PythonLexer',),
+    '.k': ('KLexer',),
+    '.kal': ('KalLexer',),
+    '.kid': ('GenshiLexer',),
+    '.kif': ('NewLispLexer',),
+    '.kk': ('KokaLexer',),
+    '.kki': ('KokaLexer',),
+    '.kmsg': ('KernelLogLexer',),
+    '.kn': ('KuinLexer',),
+    '.kql': ('KustoLexer',),
+    '.ksh': ('BashLexer',),
+    '.kt': ('KotlinLexer',),
+    '.kts': ('KotlinLexer',),
+    '.kusto': ('KustoLexer',),
+    '.lagda': ('LiterateAgdaLexer',),
+    '.lasso': ('LassoLexer',),
+    '.lcry': ('LiterateCryptolLexer',),
+    '.ldif': ('LdifLexer',),
+    '.lean': ('Lean3Lexer', 'Lean4Lexer'),
+    '.leex': ('ElixirLexer',),
+    '.less': ('LessCssLexer',),
+    '.lgt': ('LogtalkLexer',),
+    '.lhs': ('LiterateHaskellLexer',),
+    '.libsonnet': ('JsonnetLexer',),
+    '.lid': ('DylanLidLexer',),
+    '.lidr': ('LiterateIdrisLexer',),
+    '.liquid': ('LiquidLexer',),
+    '.lisp': ('CommonLispLexer',),
+    '.ll': ('LlvmLexer',),
+    '.load': ('FishShellLexer',),
+    '.logtalk': ('LogtalkLexer',),
+    '.lpad': ('CplintLexer',),
+    '.ls': ('LiveScriptLexer',),
+    '.lsl': ('LSLLexer',),
+    '.lsp': ('NewLispLexer',),
+    '.lua': ('LuaLexer',),
+    '.luau': ('LuauLexer',),
+    '.ly': ('LilyPondLexer',),
+    '.m': ('MasonLexer', 'MatlabLexer', 'ObjectiveCLexer', 'OctaveLexer'),
+    '.m2': ('Macaulay2Lexer',),
+    '.ma': ('MathematicaLexer',),
+    '.mac': ('EasytrieveLexer', 'MaximaLexer'),
+    '.mak': ('MakefileLexer',),
+    '.man': ('GroffLexer',),
+    '.mao': ('MakoLexer',),
+    '.maql': ('MaqlLexer',),
+    '.markdown': ('MarkdownLexer',),
+    '.mask': ('MaskLexer',),
+    '.max': ('MaximaLexer',),
+    '.mc': ('MasonLexer',),
+    '.mcfunction': ('MCFunctionLexer',),
+    '.mcschema': ('MCSchemaLexer',),
+    '.md': ('MarkdownLexer',),
+    '.mhtml': ('MasonLexer',),
+    '.mi': ('MapleLexer', 'MasonLexer'),
+    '.mips': ('MIPSLexer',),
+    '.mir': ('LlvmMirLexer',),
+    '.mjs': ('JavascriptLexer',),
+    '.mk': ('MakefileLexer',),
+    '.ml': ('OcamlLexer',),
+    '.mli': ('OcamlLexer',),
+    '.mll': ('OcamlLexer',),
+    '.mly': ('OcamlLexer',),
+    '.mm': ('MapleLexer', 'ObjectiveCppLexer'),
+    '.mo': ('ModelicaLexer',),
+    '.mod': ('Modula2Lexer',),
+    '.mojo': ('MojoLexer',),
+    '.monkey': ('MonkeyLexer',),
+    '.moo': ('MOOCodeLexer',),
+    '.moon': ('MoonScriptLexer',),
+    '.mos': ('MoselLexer',),
+    '.mount': ('SystemdLexer',),
+    '.mpl': ('MapleLexer',),
+    '.mq4': ('MqlLexer',),
+    '.mq5': ('MqlLexer',),
+    '.mqh': ('MqlLexer',),
+    '.ms': ('MiniScriptLexer',),
+    '.msc': ('MscgenLexer',),
+    '.mt': ('MonteLexer',),
+    '.mu': ('MuPADLexer',),
+    '.mxml': ('MxmlLexer',),
+    '.myt': ('MyghtyLexer',),
+    '.n': ('EzhilLexer', 'NemerleLexer'),
+    '.nasm': ('NasmLexer',),
+    '.nb': ('MathematicaLexer',),
+    '.nbp': ('MathematicaLexer',),
+    '.nc': ('NesCLexer',),
+    '.ncl': ('NCLLexer',),
+    '.ndjson': ('JsonLexer',),
+    '.ng2': ('Angular2HtmlLexer',),
+    '.ni': ('Inform7Lexer',),
+    '.nim': ('NimrodLexer',),
+    '.nimrod': ('NimrodLexer',),
+    '.nit': ('NitLexer',),
+    '.nix': ('NixLexer',),
+    '.nl': ('NewLispLexer',),
+    '.nqp': ('Perl6Lexer',),
+    '.ns2': ('NewspeakLexer',),
+    '.nsh': ('NSISLexer',),
+    '.nsi': ('NSISLexer',),
+    '.nt': ('NestedTextLexer',),
+    '.numba_ir': ('NumbaIRLexer',),
+    '.objdump': ('ObjdumpLexer',),
+    '.objdump-intel': ('NasmObjdumpLexer',),
+    '.odin': ('OdinLexer',),
+    '.ooc': ('OocLexer',),
+    '.opa': ('OpaLexer',),
+    '.orc': ('CsoundOrchestraLexer',),
+    '.org': ('OrgLexer',),
+    '.p': ('OpenEdgeLexer', 'PawnLexer'),
+    '.p6': ('Perl6Lexer',),
+    '.p6l': ('Perl6Lexer',),
+    '.p6m': ('Perl6Lexer',),
+    '.pack': ('VisualPrologLexer',),
+    '.pan': ('PanLexer',),
+    '.pas': ('DelphiLexer',),
+    '.patch': ('DiffLexer',),
+    '.path': ('SystemdLexer',),
+    '.pc': ('PkgConfigLexer',),
+    '.pcmk': ('CrmshLexer',),
+    '.pddl': ('PddlLexer',),
+    '.peg': ('PegLexer',),
+    '.pem': ('AscLexer',),
+    '.perl': ('PerlLexer',),
+    '.ph': ('VisualPrologLexer',),
+    '.php': ('PhpLexer',),
+    '.phtml': ('HtmlPhpLexer',),
+    '.pidl': ('OmgIdlLexer',),
+    '.pig': ('PigLexer',),
+    '.pike': ('PikeLexer',),
+    '.pl': ('CplintLexer', 'Perl6Lexer', 'PerlLexer', 'PrologLexer'),
+    '.pl6': ('Perl6Lexer',),
+    '.plot': ('GnuplotLexer',),
+    '.plt': ('GnuplotLexer',),
+    '.pm': ('Perl6Lexer', 'PerlLexer', 'PromelaLexer'),
+    '.pm6': ('Perl6Lexer',),
+    '.pml': ('PromelaLexer',),
+    '.pmod': ('PikeLexer',),
+    '.po': ('GettextLexer',),
+    '.pony': ('PonyLexer',),
+    '.portugol': ('PortugolLexer',),
+    '.pot': ('GettextLexer',),
+    '.pov': ('PovrayLexer',),
+    '.pp': ('PuppetLexer',),
+    '.pr': ('PromelaLexer',),
+    '.praat': ('PraatLexer',),
+    '.prg': ('FoxProLexer',),
+    '.prm': ('PromelaLexer',),
+    '.pro': ('CplintLexer', 'IDLLexer', 'PrologLexer', 'VisualPrologLexer'),
+    '.proc': ('PraatLexer',),
+    '.prolog': ('CplintLexer', 'PrologLexer'),
+    '.prom': ('PromelaLexer',),
+    '.promela': ('PromelaLexer',),
+    '.promql': ('PromQLLexer',),
+    '.properties': ('PropertiesLexer',),
+    '.proto': ('ProtoBufLexer',),
+    '.prql': ('PrqlLexer',),
+    '.ps': ('PostScriptLexer',),
+    '.ps1': ('PowerShellLexer',),
+    '.psc': ('PraatLexer',),
+    '.psi': ('ParaSailLexer',),
+    '.psl': ('ParaSailLexer',),
+    '.psm1': ('PowerShellLexer',),
+    '.ptls': ('PointlessLexer',),
+    '.ptx': ('PtxLexer',),
+    '.pug': ('PugLexer',),
+    '.pwn': ('PawnLexer',),
+    '.pxd': ('CythonLexer',),
+    '.pxi': ('CythonLexer',),
+    '.py': ('PythonLexer',),
+    '.py2tb': ('Python2TracebackLexer',),
+    '.py3tb': ('PythonTracebackLexer',),
+    '.pyi': ('PythonLexer',),
+    '.pypylog': ('PyPyLogLexer',),
+    '.pytb': ('PythonTracebackLexer',),
+    '.pyul4': ('PythonUL4Lexer',),
+    '.pyw': ('PythonLexer',),
+    '.pyx': ('CythonLexer',),
+    '.q': ('QLexer',),
+    '.qbs': ('QmlLexer',),
+    '.ql': ('CodeQLLexer',),
+    '.qll': ('CodeQLLexer',),
+    '.qml': ('QmlLexer',),
+    '.qvs': ('QlikLexer',),
+    '.qvto': ('QVToLexer',),
+    '.qvw': ('QlikLexer',),
+    '.r': ('RebolLexer',),
+    '.r3': ('RebolLexer',),
+    '.rake': ('RubyLexer',),
+    '.raku': ('Perl6Lexer',),
+    '.rakudoc': ('Perl6Lexer',),
+    '.rakumod': ('Perl6Lexer',),
+    '.rakutest': ('Perl6Lexer',),
+    '.rb': ('RubyLexer',),
+    '.rbw': ('RubyLexer',),
+    '.rbx': ('RubyLexer',),
+    '.re': ('ReasonLexer',),
+    '.react': ('JsxLexer',),
+    '.reb': ('RebolLexer',),
+    '.red': ('RedLexer',),
+    '.reds': ('RedLexer',),
+    '.reg': ('RegeditLexer',),
+    '.rego': ('RegoLexer',),
+    '.rei': ('ReasonLexer',),
+    '.resource': ('RobotFrameworkLexer',),
+    '.rest': ('RstLexer',),
+    '.rex': ('RexxLexer',),
+    '.rexx': ('RexxLexer',),
+    '.rhtml': ('RhtmlLexer',),
+    '.ride': ('RideLexer',),
+    '.rita': ('RitaLexer',),
+    '.rkt': ('RacketLexer',),
+    '.rktd': ('RacketLexer',),
+    '.rktl': ('RacketLexer',),
+    '.rl': ('RagelCLexer', 'RagelCppLexer', 'RagelDLexer', 'RagelEmbeddedLexer', 'RagelJavaLexer', 'RagelObjectiveCLexer', 'RagelRubyLexer'),
+    '.rnc': ('RNCCompactLexer',),
+    '.robot': ('RobotFrameworkLexer',),
+    '.rpf': ('VGLLexer',),
+    '.rq': ('SparqlLexer',),
+    '.rql': ('RqlLexer',),
+    '.rs': ('RustLexer',),
+    '.rs.in': ('RustLexer',),
+    '.rsl': ('RslLexer',),
+    '.rss': ('XmlLexer',),
+    '.rst': ('RstLexer',),
+    '.rts': ('RtsLexer',),
+    '.run': ('AmplLexer',),
+    '.rvt': ('TclLexer',),
+    '.rx': ('RexxLexer',),
+    '.s': ('Ca65Lexer', 'GasLexer'),
+    '.sage': ('PythonLexer',),
+    '.sarl': ('SarlLexer',),
+    '.sas': ('SASLexer',),
+    '.sass': ('SassLexer',),
+    '.savi': ('SaviLexer',),
+    '.sbl': ('SnowballLexer',),
+    '.sc': ('PythonLexer', 'SuperColliderLexer'),
+    '.scad': ('OpenScadLexer',),
+    '.scala': ('ScalaLexer',),
+    '.scaml': ('ScamlLexer',),
+    '.scd': ('ScdocLexer', 'SuperColliderLexer'),
+    '.scdoc': ('ScdocLexer',),
+    '.sce': ('ScilabLexer',),
+    '.sci': ('ScilabLexer',),
+    '.scm': ('SchemeLexer',),
+    '.sco': ('CsoundScoreLexer',),
+    '.scope': ('SystemdLexer',),
+    '.scss': ('ScssLexer',),
+    '.sed': ('SedLexer',),
+    '.service': ('SystemdLexer',),
+    '.sgf': ('SmartGameFormatLexer',),
+    '.sh': ('BashLexer',),
+    '.sh-session': ('BashSessionLexer',),
+    '.shell-session': ('BashSessionLexer',),
+    '.shen': ('ShenLexer',),
+    '.shex': ('ShExCLexer',),
+    '.sieve': ('SieveLexer',),
+    '.sig': ('SMLLexer',),
+    '.sil': ('SilverLexer',),
+    '.siv': ('SieveLexer',),
+    '.sl': ('SlurmBashLexer',),
+    '.sla': ('SlashLexer',),
+    '.slice': ('SystemdLexer',),
+    '.slim': ('SlimLexer',),
+    '.sls': ('YamlJinjaLexer',),
+    '.smali': ('SmaliLexer',),
+    '.smithy': ('SmithyLexer',),
+    '.sml': ('SMLLexer',),
+    '.smv': ('NuSMVLexer',),
+    '.snbt': ('SNBTLexer',),
+    '.snobol': ('SnobolLexer',),
+    '.socket': ('SystemdLexer',),
+    '.sol': ('SolidityLexer',),
+    '.sources': ('DebianSourcesLexer',),
+    '.sp': ('SourcePawnLexer',),
+    '.sparql': ('SparqlLexer',),
+    '.spec': ('RPMSpecLexer',),
+    '.spice': ('SpiceLexer',),
+    '.spt': ('CheetahLexer',),
+    '.sql': ('SqlJinjaLexer', 'SqlLexer', 'TransactSqlLexer'),
+    '.sql.j2': ('SqlJinjaLexer',),
+    '.sql.jinja2': ('SqlJinjaLexer',),
+    '.sqlite3-console': ('SqliteConsoleLexer',),
+    '.ss': ('SchemeLexer',),
+    '.ssp': ('SspLexer',),
+    '.st': ('SmalltalkLexer',),
+    '.stan': ('StanLexer',),
+    '.sv': ('SystemVerilogLexer',),
+    '.svh': ('SystemVerilogLexer',),
+    '.swap': ('SystemdLexer',),
+    '.swg': ('SwigLexer',),
+    '.swift': ('SwiftLexer',),
+    '.t': ('Perl6Lexer', 'PerlLexer', 'Tads3Lexer'),
+    '.tac': ('PythonLexer',),
+    '.tact': ('TactLexer',),
+    '.tal': ('TalLexer',),
+    '.tap': ('TAPLexer',),
+    '.target': ('SystemdLexer',),
+    '.tasm': ('TasmLexer',),
+    '.tcl': ('TclLexer',),
+    '.tcsh': ('TcshLexer',),
+    '.td': ('TableGenLexer',),
+    '.tea': ('TeaTemplateLexer',),
+    '.teal': ('TealLexer',),
+    '.tex': ('TexLexer',),
+    '.tf': ('TerraformLexer',),
+    '.thrift': ('ThriftLexer',),
+    '.thy': ('IsabelleLexer',),
+    '.ti': ('ThingsDBLexer',),
+    '.tid': ('TiddlyWiki5Lexer',),
+    '.timer': ('SystemdLexer',),
+    '.tlb': ('TlbLexer',),
+    '.tmpl': ('CheetahLexer',),
+    '.tnt': ('TNTLexer',),
+    '.toc': ('TexLexer', 'WoWTocLexer'),
+    '.todotxt': ('TodotxtLexer',),
+    '.toml': ('TOMLLexer',),
+    '.tpl': ('SmartyLexer',),
+    '.tpp': ('CppLexer',),
+    '.treetop': ('TreetopLexer',),
+    '.ts': ('TypeScriptLexer',),
+    '.tst': ('GAPConsoleLexer', 'ScilabLexer'),
+    '.tsx': ('TsxLexer',),
+    '.tt': ('TreetopLexer',),
+    '.ttl': ('TeraTermLexer', 'TurtleLexer'),
+    '.twig': ('TwigHtmlLexer',),
+    '.txt': ('TextLexer',),
+    '.typ': ('TypstLexer',),
+    '.typoscript': ('TypoScriptLexer',),
+    '.u': ('UcodeLexer', 'UrbiscriptLexer'),
+    '.u1': ('UcodeLexer',),
+    '.u2': ('UcodeLexer',),
+    '.udo': ('CsoundOrchestraLexer',),
+    '.ul4': ('UL4Lexer',),
+    '.usd': ('UsdLexer',),
+    '.usda': ('UsdLexer',),
+    '.v': ('CoqLexer', 'VerilogLexer'),
+    '.vala': ('ValaLexer',),
+    '.vapi': ('ValaLexer',),
+    '.vark': ('GosuLexer',),
+    '.vb': ('VbNetLexer',),
+    '.vbs': ('VBScriptLexer',),
+    '.vcl': ('VCLLexer',),
+    '.vert': ('GLShaderLexer',),
+    '.vhd': ('VhdlLexer',),
+    '.vhdl': ('VhdlLexer',),
+    '.vim': ('VimLexer',),
+    '.vipgrm': ('VisualPrologGrammarLexer',),
+    '.vm': ('VelocityLexer',),
+    '.vp': ('VerifpalLexer',),
+    '.vpr': ('SilverLexer',),
+    '.vue': ('VueLexer',),
+    '.vy': ('VyperLexer',),
+    '.wast': ('WatLexer',),
+    '.wat': ('WatLexer',),
+    '.wdiff': ('WDiffLexer',),
+    '.webidl': ('WebIDLLexer',),
+    '.weechatlog': ('IrcLogsLexer',),
+    '.wgsl': ('WgslLexer',),
+    '.whiley': ('WhileyLexer',),
+    '.wlua': ('LuaLexer',),
+    '.wren': ('WrenLexer',),
+    '.wsdl': ('XmlLexer',),
+    '.wsf': ('XmlLexer',),
+    '.x': ('LogosLexer',),
+    '.x10': ('X10Lexer',),
+    '.xhtml': ('HtmlLexer',),
+    '.xhtml.j2': ('HtmlDjangoLexer',),
+    '.xhtml.jinja2': ('HtmlDjangoLexer',),
+    '.xi': ('LogosLexer',),
+    '.xm': ('LogosLexer',),
+    '.xmi': ('LogosLexer',),
+    '.xml': ('XmlLexer',),
+    '.xml.j2': ('XmlDjangoLexer',),
+    '.xml.jinja2': ('XmlDjangoLexer',),
+    '.xmlul4': ('XMLUL4Lexer',),
+    '.xpl': ('XsltLexer',),
+    '.xpp': ('XppLexer',),
+    '.xq': ('XQueryLexer',),
+    '.xql': ('XQueryLexer',),
+    '.xqm': ('XQueryLexer',),
+    '.xquery': ('XQueryLexer',),
+    '.xqy': ('XQueryLexer',),
+    '.xsd': ('XmlLexer',),
+    '.xsl': ('XmlLexer', 'XsltLexer'),
+    '.xslt': ('HtmlLexer', 'XmlLexer', 'XsltLexer'),
+    '.xtend': ('XtendLexer',),
+    '.xtm': ('XtlangLexer',),
+    '.xul.in': ('MozPreprocXulLexer',),
+    '.yaml': ('YamlLexer',),
+    '.yaml.j2': ('YamlJinjaLexer',),
+    '.yaml.jinja2': ('YamlJinjaLexer',),
+    '.yang': ('YangLexer',),
+    '.yar': ('YaraLexer',),
+    '.yml': ('YamlLexer',),
+    '.yml.j2': ('YamlJinjaLexer',),
+    '.yml.jinja2': ('YamlJinjaLexer',),
+    '.zeek': ('ZeekLexer',),
+    '.zep': ('ZephirLexer',),
+    '.zig': ('ZigLexer',),
+    '.zone': ('DnsZoneLexer',),
+    '.zsh': ('BashLexer',),
+    '.🔥': ('MojoLexer',),
+}
+
+# All other filename patterns, with the lexer they belong to.
+LEXER_PATTERNS = (
+    ('.htaccess', 'ApacheConfLexer'),
+    ('apache.conf', 'ApacheConfLexer'),
+    ('apache2.conf', 'ApacheConfLexer'),
+    ('id_dsa', 'AscLexer'),
+    ('id_ecdsa', 'AscLexer'),
+    ('id_ecdsa_sk', 'AscLexer'),
+    ('id_ed25519', 'AscLexer'),
+    ('id_ed25519_sk', 'AscLexer'),
+    ('id_rsa', 'AscLexer'),
+    ('.bashrc', 'BashLexer'),
+    ('bashrc', 'BashLexer'),
+    ('.bash_*', 'BashLexer'),
+    ('bash_*', 'BashLexer'),
+    ('zshrc', 'BashLexer'),
+    ('.zshrc', 'BashLexer'),
+    ('.kshrc', 'BashLexer'),
+    ('kshrc', 'BashLexer'),
+    ('PKGBUILD', 'BashLexer'),
+    ('*.x[bp]m', 'CLexer'),
+    ('CMakeLists.txt', 'CMakeLexer'),
+    ('control', 'DebianControlLexer'),
+    ('Dockerfile', 'DockerLexer'),
+    ('*.[1-9]', 'GroffLexer'),
+    ('*Spec.hs', 'HspecLexer'),
+    ('.editorconfig', 'IniLexer'),
+    ('Pipfile.lock', 'JsonLexer'),
+    ('Kconfig*', 'KconfigLexer'),
+    ('*Config.in*', 'KconfigLexer'),
+    ('external.in*', 'KconfigLexer'),
+    ('standard-modules.in', 'KconfigLexer'),
+    ('.csl', 'KustoLexer'),
+    ('*.lasso[89]', 'LassoLexer'),
+    ('.ldaprc', 'LdaprcLexer'),
+    ('ldaprc', 'LdaprcLexer'),
+    ('ldap.conf', 'LdaprcLexer'),
+    ('lighttpd.conf', 'LighttpdConfLexer'),
+    ('Makefile', 'MakefileLexer'),
+    ('makefile', 'MakefileLexer'),
+    ('Makefile.*', 'MakefileLexer'),
+    ('GNUmakefile', 'MakefileLexer'),
+    ('autohandler', 'MasonLexer'),
+    ('dhandler', 'MasonLexer'),
+    ('meson.build', 'MesonLexer'),
+    ('meson_options.txt', 'MesonLexer'),
+    ('autodelegate', 'MyghtyLexer'),
+    ('nginx.conf', 'NginxConfLexer'),
+    ('pacman.conf', 'PacmanConfLexer'),
+    ('*.php[345]', 'PhpLexer'),
+    ('Procfile', 'ProcfileLexer'),
+    ('SConstruct', 'PythonLexer'),
+    ('SConscript', 'PythonLexer'),
+    ('BUCK', 'PythonLexer'),
+    ('BUILD', 'PythonLexer'),
+    ('BUILD.bazel', 'PythonLexer'),
+    ('WORKSPACE', 'PythonLexer'),
+    ('Rakefile', 'RubyLexer'),
+    ('Gemfile', 'RubyLexer'),
+    ('Vagrantfile', 'RubyLexer'),
+    ('.Rhistory', 'SLexer'),
+    ('.Rprofile', 'SLexer'),
+    ('.Renviron', 'SLexer'),
+    ('*.[gs]sed', 'SedLexer'),
+    ('Singularity', 'SingularityLexer'),
+    ('Android.bp', 'SoongLexer'),
+    ('sources.list', 'SourcesListLexer'),
+    ('squid.conf', 'SquidConfLexer'),
+    ('.SRCINFO', 'SrcinfoLexer'),
+    ('Pipfile', 'TOMLLexer'),
+    ('poetry.lock', 'TOMLLexer'),
+    ('termcap', 'TermcapLexer'),
+    ('termcap.src', 'TermcapLexer'),
+    ('terminfo', 'TerminfoLexer'),
+    ('terminfo.src', 'TerminfoLexer'),
+    ('todo.txt', 'TodotxtLexer'),
+    ('.vimrc', 'VimLexer'),
+    ('.exrc', 'VimLexer'),
+    ('.gvimrc', 'VimLexer'),
+    ('_vimrc', 'VimLexer'),
+    ('_exrc', 'VimLexer'),
+    ('_gvimrc', 'VimLexer'),
+    ('vimrc', 'VimLexer'),
+    ('gvimrc', 'VimLexer'),
+    ('xorg.conf', 'XorgLexer'),
+)
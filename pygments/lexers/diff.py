@@ -28,6 +28,7 @@ class DiffLexer(RegexLexer):
     mimetypes = ['text/x-diff', 'text/x-patch']
     url = 'https://en.wikipedia.org/wiki/Diff'
     version_added = ''
+    linewise = True
 
     tokens = {
         'root': [
@@ -9,13 +9,14 @@
 """
 
 import ast
+import mmap
 
 from pygments.lexer import Lexer, line_re
 from pygments.token import Token, Error, Text, Generic
 from pygments.util import get_choice_opt
 
 
-__all__ = ['TextLexer', 'OutputLexer', 'RawTokenLexer']
+__all__ = ['TextLexer', 'OutputLexer', 'RawTokenLexer', 'BinaryTokenLexer']
 
 
 class TextLexer(Lexer):
@@ -120,3 +121,149 @@ class RawTokenLexer(Lexer):
                 ttype = Error
             yield length, ttype, val
             length += len(val)
+
+
+# must match pygments.formatters.other.BINARY_TOKENS_MAGIC
+_binary_tokens_magic = b'\x89PYGTOK\x01'
+
+
+def _read_varint(data, pos):
+    """Read an unsigned LEB128 number from `data` at `pos`.
+
+    Return the number and the position after it.
+    """
+    byte = data[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+    value = byte & 0x7f
+    shift = 7
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class BinaryTokenLexer(Lexer):
+    """
+    Recreate a token stream formatted with the `BinaryTokenFormatter`.
+
+    The input must be the formatter's output as a bytes-like object; any
+    compression is detected automatically.  Tokens are decoded lazily, so
+    an uncompressed token file can be memory-mapped and processed without
+    reading it into memory completely, see `get_tokens_from_file`.
+
+    .. versionadded:: 2.20
+    """
+    name = 'Binary token data'
+    aliases = []
+    filenames = []
+    mimetypes = ['application/x-pygments-binary-tokens']
+    url = 'https://pygments.org/docs/formatters/#BinaryTokenFormatter'
+    version_added = '2.20'
+
+    def get_tokens(self, text):
+        if isinstance(text, str):
+            raw = text.encode('latin1', 'replace')
+        else:
+            raw = text
+        data = memoryview(raw)
+        try:
+            data = self._decompress(data)
+            tokens = self._iter_tokens(data)
+        except (ValueError, IndexError, OSError, EOFError):
+            # not a binary token stream; do not lose any data
+            data.release()
+            if not isinstance(text, str):
+                text = bytes(text).decode('latin1')
+            yield Error, text
+            return
+        try:
+            yield from tokens
+        finally:
+            # release the buffer so that a memory map can be closed
+            tokens.close()
+            data.release()
+
+    def get_tokens_unprocessed(self, text):
+        length = 0
+        for ttype, value in self.get_tokens(text):
+            yield length, ttype, value
+            length += len(value)
+
+    def get_tokens_from_file(self, filename):
+        """
+        Yield the tokens stored in the file `filename`.  Uncompressed files
+        are memory-mapped, so memory use does not depend on the file size.
+        """
+        with open(filename, 'rb') as fp:
+            try:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty file
+                data = b''
+            try:
+                yield from self.get_tokens(data)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+    def _decompress(self, data):
+        header = len(_binary_tokens_magic)
+        if data[:header] != _binary_tokens_magic:
+            raise ValueError('not a binary token stream')
+        compression = data[header]
+        data = data[header + 1:]
+        if compression == 0:
+            return data
+        elif compression == 1:
+            import gzip
+            return memoryview(gzip.decompress(data))
+        elif compression == 2:
+            import bz2
+            return memoryview(bz2.decompress(data))
+        elif compression == 3:
+            try:
+                from compression import zstd
+            except ImportError as e:
+                raise ImportError('zstd compression of binary tokens '
+                                  'requires Python 3.14 or later') from e
+            return memoryview(zstd.decompress(data))
+        raise ValueError('unknown compression')
+
+    def _iter_tokens(self, data):
+        # the header is parsed eagerly so that malformed input is detected
+        # before the first token is yielded
+        ntypes, pos = _read_varint(data, 0)
+        ttypes = []
+        for _ in range(ntypes):
+            size, pos = _read_varint(data, pos)
+            name = bytes(data[pos:pos + size]).decode('utf-8')
+            pos += size
+            ttype = Token
+            for part in name.split('.') if name else ():
+                if not part[:1].isupper():
+                    raise ValueError('malformed token name')
+                ttype = getattr(ttype, part)
+            ttypes.append(ttype)
+        ntokens, pos = _read_varint(data, pos)
+        size, pos = _read_varint(data, pos)
+        text_pos = pos + size
+        if text_pos > len(data):
+            raise ValueError('truncated binary token stream')
+        return self._iter_records(data, pos, text_pos, ntokens, ttypes)
+
+    def _iter_records(self, data, pos, text_pos, ntokens, ttypes):
+        read_varint = _read_varint
+        for _ in range(ntokens):
+            type_id, pos = read_varint(data, pos)
+            size, pos = read_varint(data, pos)
+            end = text_pos + size
+            if end > len(data):
+                raise ValueError('truncated binary token stream')
+            yield ttypes[type_id], str(data[text_pos:end], 'utf-8',
+                                       'surrogatepass')
+            text_pos = end
@@ -43,7 +43,8 @@
 import collections
 import re
 
-from pygments.lexer import Lexer, RegexLexer, do_insertions, bygroups, words
+from pygments.lexer import Lexer, RegexLexer, do_insertions, bygroups, words, \
+    wordset
 from pygments.lexers import _googlesql_builtins
 from pygments.lexers import _mysql_builtins
 from pygments.lexers import _postgres_builtins
@@ -173,7 +174,7 @@ class PostgresLexer(PostgresBase, RegexLexer):
                              for s in _postgres_builtins.DATATYPES +
                              _postgres_builtins.PSEUDO_TYPES) + r')\b',
              Name.Builtin),
-            (words(_postgres_builtins.KEYWORDS, suffix=r'\b'), Keyword),
+            (wordset(_postgres_builtins.KEYWORDS, suffix=r'\b'), Keyword),
             (r'[+*/<>=~!@#%^&|`?-]+', Operator),
             (r'::', Operator),  # cast
             (r'\$\d+', Name.Variable),
@@ -770,9 +771,9 @@ class MySqlLexer(RegexLexer):
              Name.Constant),
             (words(_mysql_builtins.MYSQL_DATATYPES, prefix=r'\b', suffix=r'\b'),
              Keyword.Type),
-            (words(_mysql_builtins.MYSQL_KEYWORDS, prefix=r'\b', suffix=r'\b'),
+            (wordset(_mysql_builtins.MYSQL_KEYWORDS, prefix=r'\b', suffix=r'\b'),
              Keyword),
-            (words(_mysql_builtins.MYSQL_FUNCTIONS, prefix=r'\b', suffix=r'\b(\s*)(\()'),
+            (wordset(_mysql_builtins.MYSQL_FUNCTIONS, prefix=r'\b', suffix=r'\b(\s*)(\()'),
              bygroups(Name.Function, Whitespace, Punctuation)),
 
             # Schema object names
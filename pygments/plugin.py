@@ -32,15 +32,20 @@
     :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
     :license: BSD, see LICENSE for details.
 """
-from importlib.metadata import entry_points
-
 LEXER_ENTRY_POINT = 'pygments.lexers'
 FORMATTER_ENTRY_POINT = 'pygments.formatters'
 STYLE_ENTRY_POINT = 'pygments.styles'
 FILTER_ENTRY_POINT = 'pygments.filters'
 
+# Scanning the installed distributions for entry points is slow, so it is
+# only done once per group; the plugins are loaded when they are first used.
+_entry_point_cache = {}
+_plugin_cache = {}
+
 
 def iter_entry_points(group_name):
+    # importlib.metadata is slow to import, so only do it when needed
+    from importlib.metadata import entry_points
     groups = entry_points()
     if hasattr(groups, 'select'):
         # New interface in Python 3.10 and newer versions of the
@@ -52,21 +57,39 @@ def iter_entry_points(group_name):
         return groups.get(group_name, [])
 
 
+def _iter_plugins(group_name):
+    """Yield ``(name, plugin)`` for the entry points in `group_name`."""
+    if group_name not in _entry_point_cache:
+        _entry_point_cache[group_name] = list(iter_entry_points(group_name))
+    for entrypoint in _entry_point_cache[group_name]:
+        if entrypoint not in _plugin_cache:
+            _plugin_cache[entrypoint] = entrypoint.load()
+        yield entrypoint.name, _plugin_cache[entrypoint]
+
+
+def clear_plugin_cache():
+    """
+    Forget the plugins found so far, so that plugins installed since are
+    picked up by the next lookup.
+
+    .. versionadded:: 2.20
+    """
+    _entry_point_cache.clear()
+    _plugin_cache.clear()
+
+
 def find_plugin_lexers():
-    for entrypoint in iter_entry_points(LEXER_ENTRY_POINT):
-        yield entrypoint.load()
+    for _, lexer in _iter_plugins(LEXER_ENTRY_POINT):
+        yield lexer
 
 
 def find_plugin_formatters():
-    for entrypoint in iter_entry_points(FORMATTER_ENTRY_POINT):
-        yield entrypoint.name, entrypoint.load()
+    yield from _iter_plugins(FORMATTER_ENTRY_POINT)
 
 
 def find_plugin_styles():
-    for entrypoint in iter_entry_points(STYLE_ENTRY_POINT):
-        yield entrypoint.name, entrypoint.load()
+    yield from _iter_plugins(STYLE_ENTRY_POINT)
 
 
 def find_plugin_filters():
-    for entrypoint in iter_entry_points(FILTER_ENTRY_POINT):
-        yield entrypoint.name, entrypoint.load()
+    yield from _iter_plugins(FILTER_ENTRY_POINT)
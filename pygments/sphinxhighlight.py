@@ -0,0 +1,244 @@
+"""
+    pygments.sphinxhighlight
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Sphinx extension that highlights the code blocks of HTML builds in a
+    pool of worker processes, and keeps the output between builds.
+
+    Sphinx highlights each code block when it writes the document that
+    contains it.  With this extension, the code blocks are collected while
+    the documents are read (also in parallel reads), and the ones whose
+    output is not cached yet are highlighted in a process pool before
+    writing starts.  Code blocks are identified by a hash of their content
+    and highlighting arguments, so the cache stays valid in incremental
+    builds.  Whatever was not highlighted in advance, e.g. blocks that
+    produce warnings, is highlighted by Sphinx as usual.
+
+    Enable it with ``extensions = ['pygments.sphinxhighlight']``.
+
+    .. versionadded:: 2.20
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+
+from docutils import nodes
+from sphinx import __version__ as sphinx_version
+from sphinx import addnodes
+from sphinx.transforms.post_transforms.code import \
+    HighlightLanguageTransform, TrimDoctestFlagsTransform
+from sphinx.util.logging import getLogger, suppress_logging
+
+from pygments import __version__
+
+CACHE_FILE = 'pygments_highlight.pickle'
+
+# Below this number of code blocks, starting worker processes costs more
+# than it saves.
+MIN_PARALLEL_BLOCKS = 100
+
+logger = getLogger(__name__)
+
+# the highlighter of the builder, inherited by the worker processes
+_highlighter = None
+
+
+def block_key(source, lang, opts, force, kwargs):
+    """
+    Return the hash of the arguments of a ``highlight_block()`` call that
+    determine its output.
+    """
+    data = repr((source, lang, sorted((opts or {}).items()), force,
+                 sorted(kwargs.items())))
+    return hashlib.sha256(data.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class CachingHighlighter:
+    """
+    Wrapper of the builder's highlighter that returns the output of code
+    blocks highlighted in advance, and highlights the others itself.
+    """
+
+    def __init__(self, highlighter, cache):
+        self.highlighter = highlighter
+        self.cache = cache
+
+    def highlight_block(self, source, lang, opts=None, force=False,
+                        location=None, **kwargs):
+        output = self.cache.get(block_key(source, lang, opts, force, kwargs))
+        if output is None:
+            output = self.highlighter.highlight_block(
+                source, lang, opts, force, location, **kwargs)
+        return output
+
+    def __getattr__(self, name):
+        return getattr(self.highlighter, name)
+
+
+def _is_enabled(app):
+    return (app.config.pygments_highlight_parallel and
+            app.builder.format == 'html' and
+            hasattr(app.builder, 'highlighter'))
+
+
+def _highlight(block):
+    """
+    Highlight one code block, given as ``(key, source, lang, opts, force,
+    kwargs)``.  Return the key and the output, or None as output if
+    highlighting it fails or logs a warning: that is left to Sphinx, which
+    reports it with the location of the block.
+    """
+    key, source, lang, opts, force, kwargs = block
+    try:
+        with suppress_logging() as memhandler:
+            output = _highlighter.highlight_block(source, lang, opts, force,
+                                                  **kwargs)
+    except Exception:
+        return key, None
+    if any(record.levelno >= logging.WARNING
+           for record in memhandler.buffer):
+        output = None
+    return key, output
+
+
+def _highlighted_blocks(blocks, workers):
+    if (workers > 1 and len(blocks) >= MIN_PARALLEL_BLOCKS and
+            'fork' in multiprocessing.get_all_start_methods()):
+        from concurrent.futures import ProcessPoolExecutor
+        # the workers are forked, so that they inherit the highlighter
+        context = multiprocessing.get_context('fork')
+        chunksize = max(1, len(blocks) // (4 * workers))
+        with ProcessPoolExecutor(workers, mp_context=context) as executor:
+            yield from executor.map(_highlight, blocks, chunksize=chunksize)
+    else:
+        yield from map(_highlight, blocks)
+
+
+def collect_blocks(app, doctree):
+    """
+    Record the arguments with which the HTML writer will highlight the code
+    blocks of a document that was read.
+    """
+    if not _is_enabled(app):
+        return
+    # Sphinx assigns languages and trims doctest flags in post-transforms,
+    # which run when the document is written; apply them to a copy of the
+    # code blocks to see their final content.
+    document = doctree.copy()
+    for node in doctree.findall(lambda node: isinstance(
+            node, (addnodes.highlightlang, nodes.literal_block,
+                   nodes.doctest_block))):
+        if (isinstance(node, addnodes.highlightlang) or
+                node.rawsource == node.astext()):
+            document += node.deepcopy()
+    HighlightLanguageTransform(document).apply()
+    TrimDoctestFlagsTransform(document).apply()
+
+    config = app.config
+    blocks = []
+    for node in document.children:
+        # the same arguments as in HTML5Translator.visit_literal_block()
+        lang = node.get('language', 'default')
+        linenos = node.get('linenos', False)
+        if linenos and config.html_codeblock_linenos_style:
+            linenos = config.html_codeblock_linenos_style
+        kwargs = dict(node.get('highlight_args', {}), linenos=linenos)
+        kwargs.pop('force', None)
+        blocks.append((node.rawsource, lang,
+                       config.highlight_options.get(lang, {}),
+                       node.get('force', False), kwargs))
+    app.env.pygments_highlight_blocks[app.env.docname] = blocks
+
+
+def init_env(app, env, docnames):
+    if not hasattr(env, 'pygments_highlight_blocks'):
+        env.pygments_highlight_blocks = {}
+
+
+def purge_blocks(app, env, docname):
+    env.pygments_highlight_blocks.pop(docname, None)
+
+
+def merge_blocks(app, env, docnames, other):
+    for docname in docnames:
+        if docname in other.pygments_highlight_blocks:
+            env.pygments_highlight_blocks[docname] = \
+                other.pygments_highlight_blocks[docname]
+
+
+def highlight_blocks(app, env):
+    """
+    Highlight the code blocks of all documents that are not in the cache,
+    and make the builder use the cache.
+    """
+    global _highlighter
+    if not _is_enabled(app):
+        return
+    highlighter = app.builder.highlighter
+    style = highlighter.formatter_args.get('style')
+    salt = (__version__, sphinx_version, highlighter.dest,
+            f'{style.__module__}.{style.__qualname__}')
+
+    cache_file = os.path.join(app.doctreedir, CACHE_FILE)
+    old_cache = {}
+    try:
+        with open(cache_file, 'rb') as f:
+            old_salt, old_cache = pickle.load(f)
+        if old_salt != salt:
+            old_cache = {}
+    except Exception:
+        pass
+
+    # only keep the output of code blocks that still exist
+    cache, todo = {}, {}
+    for blocks in env.pygments_highlight_blocks.values():
+        for source, lang, opts, force, kwargs in blocks:
+            key = block_key(source, lang, opts, force, kwargs)
+            if key in old_cache:
+                cache[key] = old_cache[key]
+            elif key not in cache:
+                todo[key] = (key, source, lang, opts, force, kwargs)
+
+    if todo:
+        workers = app.config.pygments_highlight_workers or os.cpu_count() or 1
+        logger.info('highlighting %d code blocks... ', len(todo), nonl=True)
+        _highlighter = highlighter
+        try:
+            # blocks that Sphinx has to highlight itself are kept as None,
+            # so that they aren't tried again in the next build
+            for key, output in _highlighted_blocks(list(todo.values()),
+                                                   workers):
+                cache[key] = output
+        finally:
+            _highlighter = None
+        logger.info('done')
+
+    if todo or len(cache) != len(old_cache):
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump((salt, cache), f, pickle.HIGHEST_PROTOCOL)
+        except OSError as err:
+            logger.warning('cannot write highlighting cache: %s', err)
+    app.builder.highlighter = CachingHighlighter(highlighter, cache)
+
+
+def setup(app):
+    app.add_config_value('pygments_highlight_parallel', True, 'env')
+    app.add_config_value('pygments_highlight_workers', 0, '')
+    app.connect('env-before-read-docs', init_env)
+    app.connect('doctree-read', collect_blocks)
+    app.connect('env-purge-doc', purge_blocks)
+    app.connect('env-merge-info', merge_blocks)
+    app.connect('env-updated', highlight_blocks)
+    return {
+        'version': __version__,
+        'env_version': 1,
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
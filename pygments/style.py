@@ -8,6 +8,8 @@
     :license: BSD, see LICENSE for details.
 """
 
+from types import MappingProxyType
+
 from pygments.token import Token, STANDARD_TYPES
 
 # Default mapping of ansixxx to RGB colors.
@@ -55,6 +57,74 @@ _deprecated_ansicolors = {
 ansicolors = set(_ansimap)
 
 
+def _colorformat(text):
+    if text in ansicolors:
+        return text
+    if text[0:1] == '#':
+        col = text[1:]
+        if len(col) == 6:
+            return col
+        elif len(col) == 3:
+            return col[0] * 2 + col[1] * 2 + col[2] * 2
+    elif text == '':
+        return ''
+    elif text.startswith('var') or text.startswith('calc'):
+        return text
+    assert False, f"wrong color format {text!r}"
+
+
+def _parse_styles(styles):
+    """
+    Return a dict mapping each token type in `styles`, and their parents,
+    to a list with the parsed style definition, inheriting from the parent
+    token types.
+    """
+    _styles = {}
+
+    for ttype in styles:
+        for token in ttype.split():
+            if token in _styles:
+                continue
+            ndef = _styles.get(token.parent, None)
+            styledefs = styles.get(token, '').split()
+            if not ndef or token is None:
+                ndef = ['', 0, 0, 0, '', '', 0, 0, 0]
+            elif 'noinherit' in styledefs and token is not Token:
+                ndef = _styles[Token][:]
+            else:
+                ndef = ndef[:]
+            _styles[token] = ndef
+            for styledef in styles.get(token, '').split():
+                if styledef == 'noinherit':
+                    pass
+                elif styledef == 'bold':
+                    ndef[1] = 1
+                elif styledef == 'nobold':
+                    ndef[1] = 0
+                elif styledef == 'italic':
+                    ndef[2] = 1
+                elif styledef == 'noitalic':
+                    ndef[2] = 0
+                elif styledef == 'underline':
+                    ndef[3] = 1
+                elif styledef == 'nounderline':
+                    ndef[3] = 0
+                elif styledef[:3] == 'bg:':
+                    ndef[4] = _colorformat(styledef[3:])
+                elif styledef[:7] == 'border:':
+                    ndef[5] = _colorformat(styledef[7:])
+                elif styledef == 'roman':
+                    ndef[6] = 1
+                elif styledef == 'sans':
+                    ndef[7] = 1
+                elif styledef == 'mono':
+                    ndef[8] = 1
+                else:
+                    ndef[0] = _colorformat(styledef)
+
+    return _styles
+
+
 class StyleMeta(type):
 
     def __new__(mcs, name, bases, dct):
@@ -62,68 +132,27 @@ class StyleMeta(type):
         for token in STANDARD_TYPES:
             if token not in obj.styles:
                 obj.styles[token] = ''
-
-        def colorformat(text):
-            if text in ansicolors:
-                return text
-            if text[0:1] == '#':
-                col = text[1:]
-                if len(col) == 6:
-                    return col
-                elif len(col) == 3:
-                    return col[0] * 2 + col[1] * 2 + col[2] * 2
-            elif text == '':
-                return ''
-            elif text.startswith('var') or text.startswith('calc'):
-                return text
-            assert False, f"wrong color format {text!r}"
-
-        _styles = obj._styles = {}
-
-        for ttype in obj.styles:
-            for token in ttype.split():
-                if token in _styles:
-                    continue
-                ndef = _styles.get(token.parent, None)
-                styledefs = obj.styles.get(token, '').split()
-                if not ndef or token is None:
-                    ndef = ['', 0, 0, 0, '', '', 0, 0, 0]
-                elif 'noinherit' in styledefs and token is not Token:
-                    ndef = _styles[Token][:]
-                else:
-                    ndef = ndef[:]
-                _styles[token] = ndef
-                for styledef in obj.styles.get(token, '').split():
-                    if styledef == 'noinherit':
-                        pass
-                    elif styledef == 'bold':
-                        ndef[1] = 1
-                    elif styledef == 'nobold':
-                        ndef[1] = 0
-                    elif styledef == 'italic':
-                        ndef[2] = 1
-                    elif styledef == 'noitalic':
-                        ndef[2] = 0
-                    elif styledef == 'underline':
-                        ndef[3] = 1
-                    elif styledef == 'nounderline':
-                        ndef[3] = 0
-                    elif styledef[:3] == 'bg:':
-                        ndef[4] = colorformat(styledef[3:])
-                    elif styledef[:7] == 'border:':
-                        ndef[5] = colorformat(styledef[7:])
-                    elif styledef == 'roman':
-                        ndef[6] = 1
-                    elif styledef == 'sans':
-                        ndef[7] = 1
-                    elif styledef == 'mono':
-                        ndef[8] = 1
-                    else:
-                        ndef[0] = colorformat(styledef)
-
+        # the style definitions are only parsed on first use, see _styles
+        obj._parsed_styles = None
+        obj._token_styles = {}
         return obj
 
+    @property
+    def _styles(cls):
+        # every class has its own _parsed_styles, set in __new__
+        if cls._parsed_styles is None:
+            cls._parsed_styles = _parse_styles(cls.styles)
+        return cls._parsed_styles
+
     def style_for_token(cls, token):
+        """
+        Return a read-only mapping with the style of `token`.  The mappings
+        are cached, so the same one is returned for every call.
+        """
+        try:
+            return cls._token_styles[token]
+        except KeyError:
+            pass
         t = cls._styles[token]
         ansicolor = bgansicolor = None
         color = t[0]
@@ -139,7 +168,7 @@ class StyleMeta(type):
             bgansicolor = bgcolor
             bgcolor = _ansimap[bgcolor]
 
-        return {
+        style = cls._token_styles[token] = MappingProxyType({
             'color':        color or None,
             'bold':         bool(t[1]),
             'italic':       bool(t[2]),
@@ -151,7 +180,8 @@ class StyleMeta(type):
             'mono':         bool(t[8]) or None,
             'ansicolor':    ansicolor,
             'bgansicolor':  bgansicolor,
-        }
+        })
+        return style
 
     def list_styles(cls):
         return list(cls)
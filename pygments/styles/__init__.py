@@ -10,15 +10,29 @@
 
 from pygments.plugin import find_plugin_styles
 from pygments.util import ClassNotFound
-from pygments.styles._mapping import STYLES
 
 #: A dictionary of built-in styles, mapping style names to
 #: ``'submodule::classname'`` strings.
 #: This list is deprecated. Use `pygments.styles.STYLES` instead
-STYLE_MAP = {v[1]: v[0].split('.')[-1] + '::' + k for k, v in STYLES.items()}
+#: It is computed on first access.
+STYLE_MAP: dict
 
-#: Internal reverse mapping to make `get_style_by_name` more efficient
-_STYLE_NAME_TO_MODULE_MAP = {v[1]: (v[0], k) for k, v in STYLES.items()}
+
+def __getattr__(name):
+    # the mapping of builtin styles is only loaded when it is needed
+    if name == 'STYLES':
+        from pygments.styles._mapping import STYLES
+        return STYLES
+    if name == 'STYLE_MAP':
+        from pygments.styles._mapping import STYLES
+        value = {v[1]: v[0].split('.')[-1] + '::' + k
+                 for k, v in STYLES.items()}
+        globals()[name] = value
+        return value
+    if name == '_STYLE_NAME_TO_MODULE_MAP':
+        from pygments.styles._mapping import STYLE_NAMES
+        return STYLE_NAMES
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def get_style_by_name(name):
@@ -29,8 +43,9 @@ def get_style_by_name(name):
     Will raise :exc:`pygments.util.ClassNotFound` if no style of that name is
     found.
     """
-    if name in _STYLE_NAME_TO_MODULE_MAP:
-        mod, cls = _STYLE_NAME_TO_MODULE_MAP[name]
+    from pygments.styles._mapping import STYLE_NAMES
+    if name in STYLE_NAMES:
+        mod, cls = STYLE_NAMES[name]
         builtin = "yes"
     else:
         for found_name, style in find_plugin_styles():
@@ -55,6 +70,7 @@ def get_style_by_name(name):
 
 def get_all_styles():
     """Return a generator for all styles by name, both builtin and plugin."""
+    from pygments.styles._mapping import STYLES
     for v in STYLES.values():
         yield v[1]
     for name, _ in find_plugin_styles():
@@ -52,3 +52,57 @@ STYLES = {
     'XcodeStyle': ('pygments.styles.xcode', 'xcode', ()),
     'ZenburnStyle': ('pygments.styles.zenburn', 'zenburn', ()),
 }
+
+# Lookup index, generated from STYLES.
+
+STYLE_NAMES = {
+    'abap': ('pygments.styles.abap', 'AbapStyle'),
+    'algol': ('pygments.styles.algol', 'AlgolStyle'),
+    'algol_nu': ('pygments.styles.algol_nu', 'Algol_NuStyle'),
+    'arduino': ('pygments.styles.arduino', 'ArduinoStyle'),
+    'autumn': ('pygments.styles.autumn', 'AutumnStyle'),
+    'borland': ('pygments.styles.borland', 'BorlandStyle'),
+    'bw': ('pygments.styles.bw', 'BlackWhiteStyle'),
+    'coffee': ('pygments.styles.coffee', 'CoffeeStyle'),
+    'colorful': ('pygments.styles.colorful', 'ColorfulStyle'),
+    'default': ('pygments.styles.default', 'DefaultStyle'),
+    'dracula': ('pygments.styles.dracula', 'DraculaStyle'),
+    'emacs': ('pygments.styles.emacs', 'EmacsStyle'),
+    'friendly': ('pygments.styles.friendly', 'FriendlyStyle'),
+    'friendly_grayscale': ('pygments.styles.friendly_grayscale', 'FriendlyGrayscaleStyle'),
+    'fruity': ('pygments.styles.fruity', 'FruityStyle'),
+    'github-dark': ('pygments.styles.gh_dark', 'GhDarkStyle'),
+    'gruvbox-dark': ('pygments.styles.gruvbox', 'GruvboxDarkStyle'),
+    'gruvbox-light': ('pygments.styles.gruvbox', 'GruvboxLightStyle'),
+    'igor': ('pygments.styles.igor', 'IgorStyle'),
+    'inkpot': ('pygments.styles.inkpot', 'InkPotStyle'),
+    'lightbulb': ('pygments.styles.lightbulb', 'LightbulbStyle'),
+    'lilypond': ('pygments.styles.lilypond', 'LilyPondStyle'),
+    'lovelace': ('pygments.styles.lovelace', 'LovelaceStyle'),
+    'manni': ('pygments.styles.manni', 'ManniStyle'),
+    'material': ('pygments.styles.material', 'MaterialStyle'),
+    'monokai': ('pygments.styles.monokai', 'MonokaiStyle'),
+    'murphy': ('pygments.styles.murphy', 'MurphyStyle'),
+    'native': ('pygments.styles.native', 'NativeStyle'),
+    'nord': ('pygments.styles.nord', 'NordStyle'),
+    'nord-darker': ('pygments.styles.nord', 'NordDarkerStyle'),
+    'one-dark': ('pygments.styles.onedark', 'OneDarkStyle'),
+    'paraiso-dark': ('pygments.styles.paraiso_dark', 'ParaisoDarkStyle'),
+    'paraiso-light': ('pygments.styles.paraiso_light', 'ParaisoLightStyle'),
+    'pastie': ('pygments.styles.pastie', 'PastieStyle'),
+    'perldoc': ('pygments.styles.perldoc', 'PerldocStyle'),
+    'rainbow_dash': ('pygments.styles.rainbow_dash', 'RainbowDashStyle'),
+    'rrt': ('pygments.styles.rrt', 'RrtStyle'),
+    'sas': ('pygments.styles.sas', 'SasStyle'),
+    'solarized-dark': ('pygments.styles.solarized', 'SolarizedDarkStyle'),
+    'solarized-light': ('pygments.styles.solarized', 'SolarizedLightStyle'),
+    'staroffice': ('pygments.styles.staroffice', 'StarofficeStyle'),
+    'stata-dark': ('pygments.styles.stata_dark', 'StataDarkStyle'),
+    'stata-light': ('pygments.styles.stata_light', 'StataLightStyle'),
+    'tango': ('pygments.styles.tango', 'TangoStyle'),
+    'trac': ('pygments.styles.trac', 'TracStyle'),
+    'vim': ('pygments.styles.vim', 'VimStyle'),
+    'vs': ('pygments.styles.vs', 'VisualStudioStyle'),
+    'xcode': ('pygments.styles.xcode', 'XcodeStyle'),
+    'zenburn': ('pygments.styles.zenburn', 'ZenburnStyle'),
+}
@@ -24,11 +24,15 @@ class _TokenType(tuple):
     def __init__(self, *args):
         # no need to call super.__init__
         self.subtypes = set()
+        # all prefixes of the type, including itself; they compare and hash
+        # equal to the token types they denote, so that ``ttype in other``
+        # is a single set lookup
+        self._ancestors = frozenset(self[:i] for i in range(len(self) + 1))
 
     def __contains__(self, val):
         return self is val or (
             type(val) is self.__class__ and
-            val[:len(self)] == self
+            self in val._ancestors
         )
 
     def __getattr__(self, val):
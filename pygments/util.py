@@ -9,6 +9,7 @@
 """
 
 import re
+import codecs
 from io import TextIOWrapper
 
 
@@ -107,6 +108,45 @@ def get_list_opt(options, optname, default=None):
                           'must give a list value')
 
 
+def options_fingerprint(options):
+    """
+    Return a stable, hashable representation of the dictionary `options`.
+
+    The result only contains strings, numbers and tuples, so its ``repr()``
+    is the same across processes.  Classes are represented by their
+    qualified names, lists and sets are converted to (sorted) tuples.
+    If a value can't be represented like this, e.g. an instance of another
+    class, whose ``repr()`` may contain its address, return ``None``.
+    """
+    try:
+        return _fingerprint_options(options)
+    except TypeError:
+        return None
+
+
+def _fingerprint_options(options):
+    return tuple(sorted((str(key), _fingerprint_value(value))
+                        for key, value in options.items()))
+
+
+def _fingerprint_value(value):
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, type):
+        return f'{value.__module__}.{value.__qualname__}'
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_fingerprint_value(item)) for item in value))
+    if isinstance(value, dict):
+        return _fingerprint_options(value)
+    options = getattr(value, 'options', None)
+    if isinstance(options, dict):
+        # lexer, filter or formatter instances
+        return (_fingerprint_value(type(value)), _fingerprint_options(options))
+    raise TypeError(f'cannot fingerprint {value!r}')
+
+
 def docstring_headline(obj):
     if not obj.__doc__:
         return ''
@@ -293,6 +333,27 @@ def guess_decode(text):
             return text, 'latin1'
 
 
+def guess_encoding(fp, chunksize=1 << 20):
+    """Return the encoding :func:`guess_decode` would use for the data read
+    from the binary file object *fp*.
+
+    The data is read and decoded in chunks of *chunksize* bytes, so this
+    works for files that don't fit into memory.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        while True:
+            chunk = fp.read(chunksize)
+            if not chunk:
+                break
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        # guess_decode() effectively falls back to latin-1 from here
+        return 'latin1'
+    return 'utf-8'
+
+
 def guess_decode_from_terminal(text, term):
     """Decode *text* coming from terminal *term*.
 
@@ -18,9 +18,93 @@ sys.path.insert(0, str(pygments_package.parent.resolve()))
 
 from pygments.util import docstring_headline # noqa: E402
 
+def format_dict(name, items):
+    """Return the source of a dict literal, sorted to make diffs minimal."""
+    lines = sorted(f'    {key!r}: {value!r},' for key, value in items)
+    return '{} = {{\n{}\n}}\n'.format(name, '\n'.join(lines))
+
+
+def is_suffix_pattern(pattern):
+    """Return whether `pattern` is ``*`` followed by a literal extension."""
+    return (pattern.startswith('*.') and
+            not any(char in pattern[1:] for char in '*?['))
+
+
+def lexer_indices(lexers):
+    """
+    Return the source of the lookup indices for `lexers`, in the order in
+    which `pygments.lexers` used to search them linearly: where several
+    lexers have the same key, the first one wins.
+    """
+    names, aliases, mimetypes, suffixes, patterns = {}, {}, {}, {}, []
+    for key, (_, name, lexer_aliases, filenames, lexer_mimetypes) in lexers:
+        names.setdefault(name, key)
+        for alias in lexer_aliases:
+            aliases.setdefault(alias, key)
+        for mimetype in lexer_mimetypes:
+            mimetypes.setdefault(mimetype, key)
+        for pattern in filenames:
+            if is_suffix_pattern(pattern):
+                suffixes[pattern[1:]] = suffixes.get(pattern[1:], ()) + (key,)
+            else:
+                patterns.append((pattern, key))
+    lines = '\n'.join(f'    {item!r},' for item in patterns)
+    return f'''
+# Lookup indices, generated from LEXERS.  Where several lexers share a key,
+# the first one in LEXERS is used.
+
+{format_dict('LEXER_NAMES', names.items())}
+{format_dict('LEXER_ALIASES', aliases.items())}
+{format_dict('LEXER_MIMETYPES', mimetypes.items())}
+# Lexers by the extension of their ``*.ext`` filename patterns.
+{format_dict('LEXER_SUFFIXES', suffixes.items())}
+# All other filename patterns, with the lexer they belong to.
+LEXER_PATTERNS = (
+{lines}
+)
+'''
+
+
+def formatter_indices(formatters):
+    """
+    Return the source of the lookup indices for `formatters`.  As for the
+    lexers, the first formatter in FORMATTERS wins where several share a key.
+    """
+    aliases, suffixes, patterns = {}, {}, []
+    for key, (_, _, formatter_aliases, filenames, _) in formatters:
+        for alias in formatter_aliases:
+            aliases.setdefault(alias, key)
+        for pattern in filenames:
+            if is_suffix_pattern(pattern):
+                suffixes.setdefault(pattern[1:], key)
+            else:
+                patterns.append((pattern, key))
+    lines = ''.join(f'\n    {item!r},' for item in patterns)
+    return f'''
+# Lookup indices, generated from FORMATTERS.  Where several formatters share
+# a key, the first one in FORMATTERS is used.
+
+{format_dict('FORMATTER_ALIASES', aliases.items())}
+# Formatters by the extension of their ``*.ext`` filename patterns.
+{format_dict('FORMATTER_SUFFIXES', suffixes.items())}
+# All other filename patterns, with the formatter they belong to.
+FORMATTER_PATTERNS = ({lines}
+)
+'''
+
+
+def style_indices(styles):
+    """Return the source of the lookup index for `styles`."""
+    names = {desc[1]: (desc[0], key) for key, desc in styles}
+    return f'''
+# Lookup index, generated from STYLES.
+
+{format_dict('STYLE_NAMES', names.items())}'''
+
+
 def main():
     for key in ['lexers', 'formatters', 'styles']:
-        lines = []
+        entries = {}
         for file in (pygments_package / key).glob('[!_]*.py'):
             module_name = '.'.join(file.relative_to(pygments_package.parent).with_suffix('').parts)
             print(module_name)
@@ -36,19 +120,22 @@ def main():
                     pass
                 else:
                     assert False
-                lines.append(f'    {obj_name!r}: {desc!r},')
-        # Sort to make diffs minimal.
-        lines.sort()
-        new_dict = '\n'.join(lines)
+                entries[obj_name] = desc
+        # Sort to make diffs minimal; this is also the order of the dict.
+        entries = sorted(entries.items(),
+                         key=lambda item: f'    {item[0]!r}: {item[1]!r},')
         content = f'''# Automatically generated by scripts/gen_mapfiles.py.
 # DO NOT EDIT BY HAND; run `tox -e mapfiles` instead.
 
-{key.upper()} = {{
-{new_dict}
-}}
-'''
+{format_dict(key.upper(), entries)}'''
+        if key == 'lexers':
+            content += lexer_indices(entries)
+        elif key == 'formatters':
+            content += formatter_indices(entries)
+        elif key == 'styles':
+            content += style_indices(entries)
         (pygments_package / key / '_mapping.py').write_text(content, encoding='utf8')
-        print(f'=== {len(lines)} {key} processed.')
+        print(f'=== {len(entries)} {key} processed.')
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,99 @@
+"""
+    Asyncio API tests
+    ~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from pygments import highlight
+from pygments.aio import highlight_async, highlight_stream
+from pygments.formatters import HtmlFormatter, NullFormatter
+from pygments.lexer import Lexer
+from pygments.lexers import PythonLexer
+from pygments.token import Text
+
+CODE = 'def func(args):\n    return 42\n' * 200
+
+
+class SlowLexer(Lexer):
+    """Yields one token per line, slowly, and records how far it got."""
+
+    def __init__(self, **options):
+        Lexer.__init__(self, **options)
+        self.lexed = 0
+
+    def get_tokens_unprocessed(self, text):
+        for i, line in enumerate(text.splitlines(True)):
+            time.sleep(0.001)
+            self.lexed += 1
+            yield i, Text, line
+
+
+def test_highlight_async():
+    async def main():
+        return await highlight_async(CODE, PythonLexer(), HtmlFormatter())
+    assert asyncio.run(main()) == highlight(CODE, PythonLexer(),
+                                            HtmlFormatter())
+
+    async def main_encoded():
+        return await highlight_async(CODE, PythonLexer(),
+                                     HtmlFormatter(encoding='utf-8'))
+    assert asyncio.run(main_encoded()) == \
+        highlight(CODE, PythonLexer(), HtmlFormatter(encoding='utf-8'))
+
+
+def test_highlight_async_timeout():
+    lexer = SlowLexer()
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await highlight_async('x\n' * 100000, lexer, NullFormatter(),
+                                  timeout=0.05)
+    # asyncio.run() waits for the worker thread to finish
+    asyncio.run(main())
+    assert lexer.lexed < 1000
+
+
+def test_highlight_stream():
+    async def main(formatter):
+        return [chunk async for chunk in
+                highlight_stream(CODE, PythonLexer(), formatter,
+                                 chunk_tokens=50)]
+
+    chunks = asyncio.run(main(NullFormatter()))
+    assert len(chunks) > 1
+    assert ''.join(chunks) == CODE
+    chunks = asyncio.run(main(HtmlFormatter(encoding='utf-8')))
+    assert b''.join(chunks) == highlight(CODE, PythonLexer(),
+                                         HtmlFormatter(encoding='utf-8'))
+
+
+def test_highlight_stream_early_exit():
+    lexer = SlowLexer()
+
+    async def main():
+        async for _ in highlight_stream('x\n' * 100000, lexer,
+                                        NullFormatter(), chunk_tokens=10,
+                                        max_pending=1):
+            break
+    asyncio.run(main())
+    assert lexer.lexed < 100000
+
+
+def test_highlight_stream_error():
+    class BrokenLexer(Lexer):
+        def get_tokens_unprocessed(self, text):
+            yield 0, Text, text
+            raise RuntimeError('broken')
+
+    async def main():
+        async for _ in highlight_stream(CODE, BrokenLexer(), NullFormatter()):
+            pass
+    with pytest.raises(RuntimeError, match='broken'):
+        asyncio.run(main())
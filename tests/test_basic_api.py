@@ -7,19 +7,23 @@
 """
 
 import inspect
+import itertools
 import pathlib
 import random
 from io import StringIO, BytesIO
 from os import path
 import re
+import time
 
 import pytest
 
 from pygments import lexers, formatters, lex, format, __version__
-from pygments.token import _TokenType, Text
+from pygments.token import _TokenType, Comment, Error, Name, Text
 from pygments.lexer import RegexLexer
 import pygments
+from pygments.filter import SplitFilter
 from pygments.formatter import Formatter
+from pygments.filters import get_filter_by_name
 from pygments.formatters.img import FontNotFound
 from pygments.lexers import LEXERS
 from pygments.util import ClassNotFound
@@ -137,8 +141,8 @@ def test_random_input(cls):
 
 @pytest.mark.parametrize('cls', lexers._iter_lexerclasses(plugins=False))
 def test_lexer_options(cls):
-    if cls.__name__ == 'RawTokenLexer':
-        # this one is special
+    if cls.__name__ in ('RawTokenLexer', 'BinaryTokenLexer'):
+        # these are special
         return
 
     # test that the basic options work
@@ -163,6 +167,60 @@ def test_lexer_options(cls):
         ensure(inst.get_tokens('a\nb\n\n'), 'a\nb')
 
 
+def test_preprocess_lexer_input_no_copy():
+    lexer = lexers.TextLexer()
+    text = 'a\tb\nc\n'
+    assert lexer._preprocess_lexer_input(text) is text
+    assert lexers.TextLexer(stripall=True)._preprocess_lexer_input(text) is text
+    for text in ['a\r\nb\n', 'a\n\n', '\na\n', 'a', '']:
+        assert lexer._preprocess_lexer_input(text) is not text
+    text = 'a \n'
+    assert lexer._preprocess_lexer_input(text) is text
+    assert lexers.TextLexer(stripall=True)._preprocess_lexer_input(text) == 'a\n'
+    assert lexers.TextLexer(tabsize=4)._preprocess_lexer_input('a\tb\n') == 'a   b\n'
+
+
+class _ChunkRecorder(RegexLexer):
+    linewise = True
+    tokens = {'root': [(r'.*\n', Text), (r'.+', Text)]}
+
+
+@pytest.mark.parametrize('chunksize', [1, 3, 1 << 20])
+@pytest.mark.parametrize('options', [{}, {'stripall': True}, {'stripnl': False},
+                                     {'ensurenl': False}, {'tabsize': 4},
+                                     {'stripall': True, 'tabsize': 3},
+                                     {'encoding': 'utf-16'},
+                                     {'encoding': 'chardet'}])
+def test_get_tokens_from_file(tmp_path, options, chunksize):
+    if options.get('encoding') == 'chardet':
+        pytest.importorskip('chardet')
+    encoding = options.get('encoding', 'utf-8')
+    if encoding == 'chardet':
+        encoding = 'utf-8-sig'
+    path = tmp_path / 'input'
+    for text in ['', '\n\n', '\ufeffa\n\n', ' \n\tä\tb \r\nc\rd\r\r\n\n  \n\n',
+                 '\t\tfoo\tbar\n\t\n', 'x\r']:
+        data = text.encode(encoding)
+        path.write_bytes(data)
+        lexer = _ChunkRecorder(**options)
+        expected = ''.join(v for _, v in lexer.get_tokens(data))
+        tokens = list(lexer.get_tokens_from_file(path, chunksize=chunksize))
+        assert ''.join(v for _, v in tokens) == expected
+        # pieces always end at line boundaries
+        assert all(v.endswith('\n') for _, v in tokens[:-1])
+
+
+def test_get_tokens_from_file_linewise_lexers(tmp_path):
+    path = tmp_path / 'input.diff'
+    for fn in ['normal.txt', 'unified.txt']:
+        text = (pathlib.Path(TESTDIR) / 'snippets' / 'diff' / fn).read_bytes()
+        path.write_bytes(text * 10)
+        lexer = lexers.DiffLexer()
+        assert lexer.linewise
+        expected = list(lexer.get_tokens(text * 10))
+        assert list(lexer.get_tokens_from_file(path, chunksize=7)) == expected
+
+
 def test_get_lexers():
     # test that the lexers functions work
     for func, args in [(lexers.get_lexer_by_name, ("python",)),
@@ -244,6 +302,65 @@ def test_formatter_encodings():
     assert "ä".encode() in format(tokens, fmt)
 
 
+def test_formatter_encoding_chunks(monkeypatch):
+    from pygments import formatter
+
+    class Output(BytesIO):
+        writes = 0
+
+        def write(self, data):
+            self.writes += 1
+            return super().write(data)
+
+    monkeypatch.setattr(formatter, 'ENCODE_CHUNK_TOKENS', 3)
+    tokens = [(Text, "ä")] * 10
+    for tokensource in iter(tokens), tokens, tuple(tokens):
+        out = Output()
+        formatters.NullFormatter(encoding='utf-16').format(tokensource, out)
+        # the text is written in chunks, with a single BOM
+        assert out.getvalue().decode('utf-16') == "ä" * 10
+        assert out.writes == 4
+
+    # HtmlFormatter counts the lines of token lists in advance
+    out = Output()
+    formatters.HtmlFormatter(encoding='utf-8', linenos=True).format(
+        [(Text, "ä\n")] * 10, out)
+    assert '<span class="normal">10</span>' in out.getvalue().decode()
+    assert out.writes > 1
+
+
+def test_formatter_encoding_error():
+    class FailingFormatter(formatters.NullFormatter):
+        def format_unencoded(self, tokensource, outfile):
+            for _, value in tokensource:
+                outfile.write(value)
+            raise RuntimeError('formatting failed')
+
+    for tokensource in [(Text, "ä")] * 5, iter([(Text, "ä")] * 5):
+        out = BytesIO()
+        with pytest.raises(RuntimeError):
+            FailingFormatter(encoding='utf-8').format(tokensource, out)
+        # the text formatted before the error is written
+        assert out.getvalue().decode() == "ä" * 5
+
+
+def test_escape_cache():
+    from pygments.formatter import EscapeCache
+
+    cache = EscapeCache(str.upper, max_length=3, max_size=2)
+    assert [cache[v] for v in ['a', 'a', 'long', 'long', 'b', 'c', 'c']] == \
+        ['A', 'A', 'LONG', 'LONG', 'B', 'C', 'C']
+    assert dict(cache) == {'a': 'A', 'b': 'B'}
+    assert cache.misses == 6
+
+    tokens = [(Text, 'x'), (Text, '\n'), (Text, 'x'), (Text, '\n'), (Text, '<')]
+    for fmt in [formatters.HtmlFormatter(), formatters.LatexFormatter(),
+                formatters.SvgFormatter(), formatters.PangoMarkupFormatter()]:
+        format(tokens, fmt)
+        assert fmt.escape_cache.lookups > fmt.escape_cache.misses > 0
+        assert 0 < fmt.escape_cache.hit_rate < 1
+
+
 @pytest.mark.parametrize('cls', [getattr(formatters, name)
                                  for name in formatters.FORMATTERS])
 def test_formatter_unicode_handling(cls):
@@ -283,6 +400,94 @@ def test_get_formatters():
     assert isinstance(x, formatters.HtmlFormatter)
     assert x.options["opt"] == "val"
 
+    # the indices agree with the filename patterns and aliases
+    for name in formatters.FORMATTERS:
+        cls = getattr(formatters, name)
+        for alias in cls.aliases:
+            assert formatters.find_formatter_class(alias) is cls
+        for pattern in cls.filenames:
+            fn = pattern.replace('*', 'a.b')
+            assert formatters._find_builtin_filename_match(fn) == name
+    assert formatters.find_formatter_class('HTML') is None
+    assert formatters._find_builtin_filename_match('a.html.in') is None
+    with pytest.raises(ClassNotFound):
+        formatters.get_formatter_for_filename('dir/a.html.in')
+
+
+def test_plugin_cache(monkeypatch):
+    class Plugin(formatters.HtmlFormatter):
+        name = 'Plugin'
+        aliases = ['plugin']
+        filenames = ['*.plugin']
+
+    class EntryPoint:
+        name = 'plugin'
+        loads = 0
+
+        def load(self):
+            self.loads += 1
+            return Plugin
+
+    scans = []
+    entrypoint = EntryPoint()
+
+    def iter_entry_points(group_name):
+        scans.append(group_name)
+        return [entrypoint] if group_name == 'pygments.formatters' else []
+
+    monkeypatch.setattr(pygments.plugin, 'iter_entry_points', iter_entry_points)
+    pygments.plugin.clear_plugin_cache()
+    try:
+        for _ in range(3):
+            assert formatters.find_formatter_class('plugin') is Plugin
+            fmt = formatters.get_formatter_for_filename('a.plugin')
+            assert type(fmt) is Plugin
+            assert formatters.find_formatter_class('nonexisting') is None
+        assert scans == ['pygments.formatters']
+        assert entrypoint.loads == 1
+    finally:
+        pygments.plugin.clear_plugin_cache()
+
+
+@pytest.mark.parametrize('alias,options,attr', [
+    ('html', {'classprefix': 'x-'}, 'ttype2class'),
+    ('latex', {'commandprefix': 'X'}, 'cmd2def'),
+    ('rtf', {'linenos': True}, 'color_mapping'),
+    ('groff', {'monospaced': False}, 'styles'),
+    ('bbcode', None, 'styles'),
+    ('terminal256', {'nobold': True}, 'style_string'),
+    ('terminal16m', {'nobold': True}, 'style_string'),
+])
+def test_formatter_shared_style_tables(alias, options, attr):
+    fmt1 = formatters.get_formatter_by_name(alias, style='friendly')
+    fmt2 = formatters.get_formatter_by_name(alias, style='friendly')
+    # compiled style tables are shared, and read-only
+    assert getattr(fmt1, attr) is getattr(fmt2, attr)
+    with pytest.raises(TypeError):
+        getattr(fmt1, attr)[Text] = 'x'
+    other = formatters.get_formatter_by_name(alias, style='monokai')
+    assert getattr(other, attr) is not getattr(fmt1, attr)
+    if options:
+        other = formatters.get_formatter_by_name(alias, style='friendly',
+                                                 **options)
+        assert getattr(other, attr) is not getattr(fmt1, attr)
+        assert getattr(other, attr) != getattr(fmt1, attr)
+
+
+def test_precompile_styles():
+    from pygments.formatter import _compiled_styles
+    from pygments.styles import get_style_by_name
+    formatters.precompile_styles(['html', 'latex'], ['vim', 'zenburn'],
+                                 classprefix='pre-')
+    keys = {key[:2] for key in _compiled_styles}
+    for cls in formatters.HtmlFormatter, formatters.LatexFormatter:
+        for style in 'vim', 'zenburn':
+            assert (cls, get_style_by_name(style)) in keys
+    fmt = formatters.HtmlFormatter(style='vim', classprefix='pre-')
+    assert 'pre-k' in fmt.class2style
+    with pytest.raises(ClassNotFound):
+        formatters.precompile_styles(['nonexisting'])
+
 
 def test_styles():
     # minimal style test
@@ -290,6 +495,32 @@ def test_styles():
     HtmlFormatter(style="pastie")
 
 
+def test_style_tables():
+    from pygments.style import Style
+    from pygments.token import Comment, Keyword, Name
+
+    class BaseStyle(Style):
+        styles = {Keyword: 'bold #f00', Comment: 'italic'}
+
+    class DerivedStyle(BaseStyle):
+        styles = {Keyword: 'noinherit #00f', Name: 'bg:#eee'}
+
+    # the definitions are only parsed on first use
+    assert BaseStyle._parsed_styles is None
+    style = BaseStyle.style_for_token(Keyword.Constant)
+    assert style['color'] == 'ff0000' and style['bold']
+    assert style is BaseStyle.style_for_token(Keyword.Constant)
+    with pytest.raises(TypeError):
+        style['color'] = '000000'
+    assert DerivedStyle._parsed_styles is None
+
+    style = DerivedStyle.style_for_token(Keyword)
+    assert style['color'] == '0000ff' and not style['bold']
+    assert DerivedStyle.style_for_token(Name)['bgcolor'] == 'eeeeee'
+    assert BaseStyle.style_for_token(Name)['bgcolor'] is None
+    assert dict(DerivedStyle)[Keyword] is style
+
+
 def test_bare_class_handler():
     from pygments.formatters import HtmlFormatter
     from pygments.lexers import PythonLexer
@@ -396,6 +627,75 @@ class TestFilters:
         tokens = list(lx.get_tokens(text))
         assert '# DEBUG: text' == tokens[0][1]
 
+    @pytest.mark.parametrize('filters', [
+        [('codetagify', {}), ('whitespace', {'spaces': True, 'tabs': True})],
+        [('whitespace', {'newlines': True}), ('codetagify', {'codetags': 'XXX'})],
+        [('whitespace', {}), ('codetagify', {'codetags': ['TODO XXX']})],
+        [('codetagify', {'codetags': ''}), ('whitespace', {'spaces': '_'})],
+    ])
+    def test_merged_split_filters(self, filters):
+        text = '# XXX TODO\tFIXME x\n# TODO XXX\n  x = 1\n'
+        lx = lexers.PythonLexer()
+        expected = lx.get_tokens(text)
+        for name, options in filters:
+            filter_ = get_filter_by_name(name, **options)
+            lx.add_filter(filter_)
+            # applied on its own, not merged with the other filters
+            expected = filter_.filter(lx, expected)
+        assert list(lx.get_tokens(text)) == list(expected)
+
+    def test_merged_split_filters_context(self):
+        # the word boundary of the second filter depends on the text that
+        # the first one splits off
+        class XFilter(SplitFilter):
+            regex = re.compile('x')
+
+            def replace(self, ttype, text):
+                return Name, text
+
+        class TodoFilter(SplitFilter):
+            regex = re.compile(r'\bTODO')
+
+            def replace(self, ttype, text):
+                return Comment.Special, text
+
+        text = '# xTODO\n'
+        lx = lexers.PythonLexer()
+        expected = lx.get_tokens(text)
+        for filter_ in XFilter(), TodoFilter():
+            lx.add_filter(filter_)
+            expected = filter_.filter(lx, expected)
+        expected = list(expected)
+        assert (Comment.Special, 'TODO') in expected
+        assert list(lx.get_tokens(text)) == expected
+
+    def test_tokenmerge(self):
+        tokens = [(Text, 'a'), (Text, 'b'), (Error, 'c'), (Text, 'd'),
+                  (Text, 'e'), (Text, 'f')]
+        assert list(get_filter_by_name('tokenmerge').filter(None, tokens)) == \
+            [(Text, 'ab'), (Error, 'c'), (Text, 'def')]
+
+    def test_gobble(self):
+        tokens = [(Text, ' '), (Text, ' a'), (Text, 'b\n  '), (Text, '\n'),
+                  (Text, '   c\n'), (Text, ' '), (Text, 'de')]
+        assert list(get_filter_by_name('gobble', n=2).filter(None, tokens)) == \
+            [(Text, 'a'), (Text, 'b\n'), (Text, '\n'), (Text, ' c\n'),
+             (Text, 'e')]
+
+    @pytest.mark.parametrize('name, options, tokens, expected', [
+        ('tokenmerge', {}, itertools.repeat((Error, 'x'), 10**7), 1),
+        ('gobble', {'n': 4}, itertools.repeat((Error, 'x' * 10), 10**6), 10**6),
+        ('gobble', {'n': 4}, [(Text, '    x\n' * (10**7 // 6))], 1),
+    ])
+    def test_filter_scaling(self, name, options, tokens, expected):
+        # 10 MB of pathological input must be filtered in linear time; the
+        # limit is generous so that starved test runs don't fail
+        filter_ = get_filter_by_name(name, **options)
+        start = time.time()
+        result = list(filter_.filter(None, tokens))
+        assert time.time() - start < 10
+        assert len(result) == expected
+
     def test_symbols(self):
         lx = lexers.IsabelleLexer()
         lx.add_filter('symbols')
@@ -0,0 +1,75 @@
+"""
+    Binary token format tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from pygments import format, highlight
+from pygments.formatters import BinaryTokenFormatter, HtmlFormatter, \
+    RawTokenFormatter
+from pygments.lexers import BinaryTokenLexer, PythonLexer, get_lexer_by_name
+from pygments.token import Error, Token
+
+# lexing this one takes over a minute, which doesn't add anything here
+SLOW_EXAMPLEFILES = {'2.19-regression-2.lua'}
+
+EXAMPLEFILES = sorted(
+    path for path in (Path(__file__).parent / 'examplefiles').glob('*/*')
+    if not path.name.endswith('.output') and
+    path.name not in SLOW_EXAMPLEFILES)
+
+
+@pytest.mark.parametrize('path', EXAMPLEFILES,
+                         ids=lambda path: f'{path.parent.name}/{path.name}')
+def test_examplefile_roundtrip(path):
+    lexer = get_lexer_by_name(path.parent.name)
+    tokens = list(lexer.get_tokens(path.read_bytes()))
+    data = format(tokens, BinaryTokenFormatter())
+    assert list(BinaryTokenLexer().get_tokens(data)) == tokens
+
+
+@pytest.mark.parametrize('compress', ['', 'gz', 'bz2'])
+def test_compression(compress):
+    code = "def f():\n    return 'α' + \"\\ud800\"\n"
+    tokens = list(PythonLexer().get_tokens(code))
+    data = format(tokens, BinaryTokenFormatter(compress=compress))
+    assert list(BinaryTokenLexer().get_tokens(data)) == tokens
+    html = highlight(code, PythonLexer(), HtmlFormatter())
+    assert highlight(data, BinaryTokenLexer(), HtmlFormatter()) == html
+
+
+def test_smaller_than_raw():
+    code = (Path(__file__).parent / 'test_basic_api.py').read_text()
+    tokens = list(PythonLexer().get_tokens(code))
+    assert len(format(tokens, BinaryTokenFormatter())) < \
+        len(format(tokens, RawTokenFormatter()))
+
+
+def test_memory_mapped_file(tmp_path):
+    tokens = [(Token.Name, 'x' * 300), (Token.Operator, '='),
+              (Token.Text, '\n'), (Token, '')]
+    path = tmp_path / 'tokens.ptok'
+    with open(path, 'wb') as fp:
+        BinaryTokenFormatter().format(tokens, fp)
+    lexer = BinaryTokenLexer()
+    assert list(lexer.get_tokens_from_file(path)) == tokens
+    # stopping early releases the memory map
+    stream = lexer.get_tokens_from_file(path)
+    assert next(stream) == tokens[0]
+    stream.close()
+
+
+def test_invalid_input():
+    assert list(BinaryTokenLexer().get_tokens('Tolkien')) == \
+        [(Error, 'Tolkien')]
+    assert list(BinaryTokenLexer().get_tokens(b'\x89PYGTOK\x01\x09')) == \
+        [(Error, '\x89PYGTOK\x01\x09')]
+    data = format([(Token.Text, 'abc')], BinaryTokenFormatter())
+    with pytest.raises(ValueError):
+        list(BinaryTokenLexer().get_tokens(data[:-1]))
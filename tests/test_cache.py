@@ -0,0 +1,116 @@
+"""
+    Pygments output cache tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+from io import BytesIO
+
+import pytest
+
+from pygments import highlight
+from pygments.cache import HighlightCache
+from pygments.formatters import HtmlFormatter, NullFormatter
+from pygments.lexers import PythonLexer
+
+CODE = 'def func(args):\n    return 42\n'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HighlightCache(str(tmp_path))
+
+
+def test_roundtrip(cache):
+    lexer = PythonLexer()
+    formatter = HtmlFormatter(linenos='table')
+    expected = highlight(CODE, lexer, formatter)
+    assert cache.highlight(CODE, lexer, formatter) == expected
+    key = cache.get_key(CODE, lexer, formatter)
+    assert cache.get(key) == expected.encode('utf-8')
+    # second call is served from the cache
+    assert cache.highlight(CODE, lexer, formatter) == expected
+
+
+def test_encoded_output(cache):
+    lexer = PythonLexer()
+    formatter = HtmlFormatter(encoding='utf-8')
+    expected = highlight(CODE, lexer, formatter)
+    for _ in range(2):
+        out = BytesIO()
+        cache.highlight(CODE, lexer, formatter, out)
+        assert out.getvalue() == expected
+
+
+def test_key_depends_on_options(cache):
+    lexer = PythonLexer()
+    key = cache.get_key(CODE, lexer, HtmlFormatter())
+    assert key == cache.get_key(CODE, PythonLexer(), HtmlFormatter())
+    assert key != cache.get_key(CODE + '\n', lexer, HtmlFormatter())
+    assert key != cache.get_key(CODE, PythonLexer(stripall=True),
+                                HtmlFormatter())
+    assert key != cache.get_key(CODE, lexer, NullFormatter())
+    assert key != cache.get_key(CODE, lexer, HtmlFormatter(style='emacs'))
+    assert key != cache.get_key(CODE, lexer, HtmlFormatter(hl_lines=[1]))
+    assert key != cache.get_key(CODE, lexer, HtmlFormatter(cssclass='code'))
+    assert key != cache.get_key(CODE, lexer, HtmlFormatter(encoding='utf-8'))
+
+    filtered = PythonLexer()
+    filtered.add_filter('keywordcase', case='upper')
+    assert key != cache.get_key(CODE, filtered, HtmlFormatter())
+
+
+def test_equivalent_options_share_key(cache):
+    lexer = PythonLexer()
+    assert cache.get_key(CODE, lexer, HtmlFormatter(hl_lines='2 1')) == \
+        cache.get_key(CODE, lexer, HtmlFormatter(hl_lines=[1, 2]))
+    assert cache.get_key(CODE, lexer, HtmlFormatter(linenos=True)) == \
+        cache.get_key(CODE, lexer, HtmlFormatter(linenos='table'))
+
+
+def test_uncacheable(cache, tmp_path):
+    formatter = HtmlFormatter(full=True, cssfile=str(tmp_path / 'style.css'))
+    assert cache.get_key(CODE, PythonLexer(), formatter) is None
+    assert cache.highlight(CODE, PythonLexer(), formatter) == \
+        highlight(CODE, PythonLexer(), formatter)
+
+
+def test_uncacheable_option(cache, tmp_path):
+    # the repr() of such values isn't stable across processes
+    class Value:
+        pass
+
+    lexer = PythonLexer()
+    formatter = HtmlFormatter(value=Value())
+    assert cache.get_key(CODE, lexer, formatter) is None
+    assert cache.get_key(CODE, PythonLexer(value=Value()),
+                         HtmlFormatter()) is None
+    filtered = PythonLexer()
+    filtered.add_filter('keywordcase', value=Value())
+    assert cache.get_key(CODE, filtered, HtmlFormatter()) is None
+    assert cache.highlight(CODE, lexer, formatter) == \
+        highlight(CODE, lexer, formatter)
+    assert os.listdir(tmp_path) == []
+
+
+def test_lru_eviction(tmp_path):
+    cache = HighlightCache(str(tmp_path), max_size=250)
+    cache.set('a', b'a' * 100)
+    cache.set('b', b'b' * 100)
+    # make "a" older than "b", then use it again
+    os.utime(cache._path('a'), (0, 0))
+    os.utime(cache._path('b'), (1, 1))
+    assert cache.get('a') is not None
+    cache.set('c', b'c' * 100)
+    assert cache.get('b') is None
+    assert cache.get('a') == b'a' * 100
+    assert cache.get('c') == b'c' * 100
+
+
+def test_clear(cache):
+    cache.set('a', b'data')
+    cache.clear()
+    assert cache.get('a') is None
@@ -7,8 +7,10 @@
 """
 
 import io
+import json
 import os
 import re
+import subprocess
 import sys
 import tempfile
 from io import BytesIO
@@ -18,6 +20,8 @@ import pytest
 from pytest import raises
 
 from pygments import cmdline, highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import DiffLexer
 
 TESTDIR = path.dirname(path.abspath(__file__))
 TESTFILE = path.join(TESTDIR, 'test_cmdline.py')
@@ -119,6 +123,34 @@ def test_outfile():
             os.unlink(name)
 
 
+def test_cache_dir(tmp_path):
+    cachedir = str(tmp_path / 'cache')
+    expected = check_success('-lpython', '-fhtml', TESTFILE)
+    assert check_success('--cache-dir', cachedir, '-lpython', '-fhtml',
+                         TESTFILE) == expected
+    assert len(os.listdir(cachedir)) == 1
+    # served from the cache
+    assert check_success('--cache-dir', cachedir, '-lpython', '-fhtml',
+                         TESTFILE) == expected
+    assert len(os.listdir(cachedir)) == 1
+    check_success('--cache-dir', cachedir, '-lpython', '-fhtml',
+                  '-Olinenos=1', TESTFILE)
+    assert len(os.listdir(cachedir)) == 2
+
+
+def test_linewise_lexer(tmp_path):
+    infn = tmp_path / 'in.diff'
+    code = '--- a\r\n+++ b\r\n@@ -1 +1 @@\r\n-\xe4\r\n+\xf6\r\n'
+    infn.write_bytes(code.encode('latin1'))
+    o = check_success('-ldiff', '-fhtml', str(infn))
+    assert o == highlight(code, DiffLexer(), HtmlFormatter())
+    infn.write_bytes(code.encode('utf-8'))
+    o = check_success('-ldiff', '-fhtml', '-Oencoding=utf-8', str(infn))
+    assert o == highlight(code, DiffLexer(), HtmlFormatter())
+
+    check_failure('-ldiff', str(tmp_path / 'missing.diff'))
+
+
 def test_load_from_file():
     lexer_file = os.path.join(TESTDIR, 'support', 'python_lexer.py')
     formatter_file = os.path.join(TESTDIR, 'support', 'html_formatter.py')
@@ -322,3 +354,34 @@ def test_exception():
 def test_parse_opts():
     assert cmdline._parse_options(['  ', 'keyonly,key = value ']) == \
         {'keyonly': True, 'key': 'value'}
+
+
+def test_startup_imports(tmp_path):
+    # a typical run must only import the lexer, formatter and style it uses
+    infile = tmp_path / 'test.py'
+    infile.write_text(TESTCODE, encoding='utf-8')
+    code = (
+        'import json, sys\n'
+        'from pygments import cmdline\n'
+        f'cmdline.main(["pygmentize", "-l", "python", "-f", "html", '
+        f'"-o", {str(tmp_path / "out.html")!r}, {str(infile)!r}])\n'
+        'print(json.dumps(sorted(sys.modules)))\n'
+    )
+    run = subprocess.run([sys.executable, '-c', code],
+                         cwd=path.dirname(TESTDIR), capture_output=True,
+                         text=True, check=True)
+    modules = set(json.loads(run.stdout))
+    startup = subprocess.run([sys.executable, '-c',
+                              'import json, sys; print(json.dumps(list(sys.modules)))'],
+                             capture_output=True, text=True, check=True)
+    modules -= set(json.loads(startup.stdout))
+
+    assert 'importlib.metadata' not in modules
+    assert 'pygments.filters' not in modules
+    assert 'pygments.modeline' not in modules
+    for package, needed in [('lexers', {'_mapping', 'python'}),
+                            ('formatters', {'_mapping', 'html'}),
+                            ('styles', {'_mapping', 'default'})]:
+        loaded = {name.split('.')[2] for name in modules
+                  if name.startswith(f'pygments.{package}.')}
+        assert loaded == needed
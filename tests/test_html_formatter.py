@@ -93,6 +93,59 @@ def test_all_options():
                     check(optdict)
 
 
+@pytest.mark.parametrize('linenos', ['table', 'inline'])
+@pytest.mark.parametrize('code', ['x = 1\n', 'x = 1\n\n', 'x = 1\ny', '\n\n'])
+def test_linenos_token_list(linenos, code):
+    # with a list of tokens, the lines are counted up front instead of
+    # collecting the formatted lines, which must not change the output
+    tokens = [(ttype, value) for ttype, value in PythonLexer().get_tokens(code)]
+    if code.endswith('y'):
+        # a last line without newline
+        tokens[-1:] = [(tokens[-1][0], 'y')]
+    options = dict(linenos=linenos, linenostep=2, hl_lines=[2])
+    expected = StringIO()
+    HtmlFormatter(**options).format(iter(tokens), expected)
+    outfile = StringIO()
+    HtmlFormatter(**options).format(tokens, outfile)
+    assert outfile.getvalue() == expected.getvalue()
+
+
+def test_tablelinenos_wrap_override():
+    # lines that wrap() adds are numbered as well
+    class HeaderFormatter(HtmlFormatter):
+        def wrap(self, source):
+            yield 1, '<span>header line</span>\n'
+            yield from super().wrap(source)
+
+    tokens = list(PythonLexer().get_tokens('x = 1\ny = 2\n'))
+    expected = StringIO()
+    HeaderFormatter(linenos='table').format(iter(tokens), expected)
+    assert '<span class="normal">3</span>' in expected.getvalue()
+    outfile = StringIO()
+    HeaderFormatter(linenos='table').format(tokens, outfile)
+    assert outfile.getvalue() == expected.getvalue()
+
+
+def test_tablelinenos_streaming():
+    # the line numbers are written before the code lines are consumed
+    fmt = HtmlFormatter(linenos='table')
+    consumed = []
+
+    def inner():
+        for i in range(3):
+            consumed.append(i)
+            yield 1, f'line {i}\n'
+
+    output = fmt._wrap_tablelinenos(inner(), lncount=3)
+    pieces = []
+    for _, piece in output:
+        pieces.append(piece)
+        if piece == '<div>':
+            break
+    assert not consumed
+    assert '3</span></pre>' in ''.join(pieces)
+
+
 def test_linespans():
     outfile = StringIO()
     fmt = HtmlFormatter(linespans='L', anchorlinenos=True, linenos="inline")
@@ -269,3 +322,66 @@ def test_debug_token_types():
     fmt_debug_token_types.format(tokensource, outfile_debug_token_types)
     html_debug_token_types = outfile_debug_token_types.getvalue()
     assert '<span class="n" title="Name">TESTDIR</span>' in html_debug_token_types
+
+
+CHANGE_OLD = '''\
+x = 1
+s = "a"
+y = 2
+'''
+
+
+@pytest.mark.parametrize('options', [
+    {}, {'linespans': 'L'}, {'lineanchors': 'A', 'linenos': 'inline'},
+    {'nowrap': True, 'hl_lines': [2]}, {'linespans': 'L', 'linenostart': 5},
+])
+@pytest.mark.parametrize('new', [
+    CHANGE_OLD.replace('"a"', '"b"'),
+    CHANGE_OLD.replace('s = ', 's = \\\n    '),
+    CHANGE_OLD.replace('"a"', '"""a'),
+    CHANGE_OLD.replace('"a"', '"""a\nb"""'),
+    '"""\n' + CHANGE_OLD + '"""\n',
+    CHANGE_OLD + '\n' * 8,
+    CHANGE_OLD[:6],
+    '',
+])
+def test_changed_fragments(options, new):
+    fmt = HtmlFormatter(**options)
+    old_tokens = list(PythonLexer().get_tokens(CHANGE_OLD))
+    new_tokens = list(PythonLexer().get_tokens(new))
+    old_fragments = fmt.get_line_fragments(old_tokens)
+    new_fragments = fmt.get_line_fragments(new_tokens)
+    outfile = StringIO()
+    fmt.format(new_tokens, outfile)
+    assert ''.join(new_fragments) in outfile.getvalue()
+
+    for renumber in (True, False):
+        start, stop, fragments = fmt.get_changed_fragments(
+            old_tokens, new_tokens, renumber)
+        start -= fmt.linenostart
+        stop -= fmt.linenostart
+        patched = old_fragments[:start] + fragments + old_fragments[stop:]
+        if renumber:
+            assert patched == new_fragments
+        else:
+            assert len(patched) == len(new_fragments)
+        assert len(fragments) <= len(new_fragments)
+
+
+def test_changed_fragments_minimal():
+    fmt = HtmlFormatter(linespans='L')
+    old_tokens = list(PythonLexer().get_tokens(CHANGE_OLD))
+    new_tokens = list(PythonLexer().get_tokens(CHANGE_OLD.replace('"a"', '"b"')))
+    start, stop, fragments = fmt.get_changed_fragments(old_tokens, new_tokens)
+    assert (start, stop) == (2, 3)
+    assert fragments == ['<span id="L-2"><span class="n">s</span> '
+                         '<span class="o">=</span> '
+                         '<span class="s2">&quot;b&quot;</span>\n</span>']
+
+    # a new line shifts the ids of all following lines
+    new_tokens = list(PythonLexer().get_tokens('w = 0\n' + CHANGE_OLD))
+    start, stop, fragments = fmt.get_changed_fragments(old_tokens, new_tokens)
+    assert (start, stop, len(fragments)) == (1, 4, 4)
+    start, stop, fragments = fmt.get_changed_fragments(old_tokens, new_tokens,
+                                                       renumber=False)
+    assert (start, stop, len(fragments)) == (1, 1, 1)
@@ -0,0 +1,153 @@
+"""
+    Pygments image formatter tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+from io import BytesIO
+
+import pytest
+
+from pygments import lex
+from pygments.lexers import PythonLexer
+from pygments.style import Style
+from pygments.token import Keyword, Name, Text
+
+pytest.importorskip('PIL')
+
+from pygments.formatters import img  # noqa: E402
+
+CODE = '''\
+def f(x):
+    """Docstring."""
+    return x * 2  # comment
+'''
+
+
+@pytest.fixture
+def fake_fonts(monkeypatch, tmp_path):
+    calls = []
+
+    def query(self, name, style):
+        calls.append((name, style))
+        return '/fonts/mono.ttf' if style in ('Regular', 'Bold') else None
+
+    monkeypatch.setattr(img.FontManager, '_query_fc_list', query)
+    monkeypatch.setattr(img.ImageFont, 'truetype', lambda path, size: (path, size))
+    monkeypatch.setattr(img.sys, 'platform', 'linux')
+    fc_cache = tmp_path / 'fontconfig'
+    fc_cache.mkdir()
+    monkeypatch.setattr(img, 'FONTCONFIG_CACHE_DIRS', [str(fc_cache)])
+    monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+    img.clear_font_cache()
+    yield calls
+    img.clear_font_cache()
+
+
+def make_formatter(**options):
+    try:
+        return img.ImageFormatter(**options)
+    except (img.FontNotFound, OSError) as e:
+        pytest.skip(str(e))
+
+
+def test_merged_drawables():
+    fmt = make_formatter(line_numbers=False)
+    fmt._create_drawables([(Name, 'a'), (Text, ' '), (Name.Other, 'b'),
+                           (Keyword, 'if'), (Text, '\n'), (Name, 'c')])
+    texts = [drawable[1] for drawable in fmt.drawables]
+    # Name and Name.Other have the same style in the default style
+    assert texts == ['a b', 'if', 'c']
+    assert fmt.maxlineno == 1
+
+
+def red_pixels(tokens, **options):
+    class RedStyle(Style):
+        styles = {Name: 'bg:#ff0000'}
+
+    out = BytesIO()
+    make_formatter(style=RedStyle, line_numbers=False,
+                   **options).format(tokens, out)
+    out.seek(0)
+    im = img.Image.open(out).convert('RGB')
+    return {(x, y) for x in range(im.width) for y in range(im.height)
+            if im.getpixel((x, y)) == (255, 0, 0)}
+
+
+def test_whitespace_after_background():
+    # the spaces are merged into a drawable only if it has no background
+    expected = red_pixels([(Name, 'ab'), (Text, '\n')])
+    assert expected
+    assert red_pixels([(Name, 'ab'), (Text, '    \n')]) == expected
+    assert red_pixels([(Name, 'ab'), (Text, '    '), (Name, 'c'),
+                       (Text, '\n')]) > expected
+
+
+@pytest.mark.parametrize('font_file', ['DejaVuSansMono-Oblique.ttf',
+                                       'DejaVuSansMono-BoldOblique.ttf'])
+@pytest.mark.parametrize('size', [14, 48, 96])
+@pytest.mark.parametrize('text', ['W', 'j_', 'f(x)'])
+def test_text_mask_overhang(font_file, size, text):
+    try:
+        font = img.ImageFont.truetype(font_file, size)
+    except OSError as e:
+        pytest.skip(str(e))
+    fmt = make_formatter(line_numbers=False)
+    fmt._fixed_width = font.getlength('M')
+    # the mask computed from the glyph bounds must contain all of the text
+    mask, left, top = fmt._render_text_mask(font, text)
+    expected = img.Image.new('L', (8 * size, 4 * size))
+    img.ImageDraw.Draw(expected).text((size, size), text, font=font, fill=255)
+    out = img.Image.new('L', expected.size)
+    out.paste(mask, (size + left, size + top))
+    assert out.tobytes() == expected.tobytes()
+
+
+def test_tiles(monkeypatch):
+    tokens = list(lex(CODE * 10, PythonLexer()))
+    expected = BytesIO()
+    make_formatter(image_format='bmp', hl_lines=[3, 4]).format(tokens, expected)
+
+    monkeypatch.setattr(img, 'TILE_LINES', 7)
+    out = BytesIO()
+    make_formatter(image_format='bmp', hl_lines=[3, 4],
+                   render_threads=3).format(tokens, out)
+    assert out.getvalue() == expected.getvalue()
+
+
+def test_font_cache(fake_fonts, tmp_path):
+    fonts = img.FontManager('Mono', 12)
+    assert fonts.fonts['NORMAL'] == fonts.fonts['BOLDITALIC'] == ('/fonts/mono.ttf', 12)
+    lookups = len(fake_fonts)
+    assert lookups > 0
+
+    # fonts are shared and fc-list isn't run again
+    assert img.FontManager('Mono', 12).fonts['BOLD'] is fonts.fonts['BOLD']
+    assert len(fake_fonts) == lookups
+    assert img.FontManager('Mono', 16).fonts['BOLD'] == ('/fonts/mono.ttf', 16)
+    assert len(fake_fonts) == lookups
+
+    # changes of the fontconfig cache invalidate the cache
+    os.utime(tmp_path / 'fontconfig', ns=(0, 0))
+    img.FontManager('Mono', 12)
+    assert len(fake_fonts) == 2 * lookups
+
+
+def test_font_cache_file(fake_fonts, tmp_path):
+    cache_file = str(tmp_path / 'fonts.json')
+    img.FontManager('Mono', 12, cache_file)
+    lookups = len(fake_fonts)
+
+    img.clear_font_cache()
+    fonts = img.FontManager('Mono', 12, cache_file)
+    assert fonts.fonts['ITALIC'] == ('/fonts/mono.ttf', 12)
+    assert len(fake_fonts) == lookups
+
+    # the file is ignored once the fontconfig cache changes
+    img.clear_font_cache()
+    os.utime(tmp_path / 'fontconfig', ns=(0, 0))
+    img.FontManager('Mono', 12, cache_file)
+    assert len(fake_fonts) == 2 * lookups
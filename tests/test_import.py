@@ -0,0 +1,54 @@
+"""
+    Pygments import cost tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# modules that are slow to import and only loaded on first use
+LAZY_MODULES = [
+    'pygments.lexers._mapping',
+    'pygments.formatters._mapping',
+    'pygments.styles._mapping',
+    'importlib.metadata',
+]
+
+
+def get_import_times(code):
+    """
+    Run `code` in a new interpreter with ``-X importtime`` and return the
+    cumulative import time in microseconds for each imported module.
+    """
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, capture_output=True, text=True,
+                            check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize('module', ['pygments', 'pygments.lexers',
+                                    'pygments.formatters', 'pygments.styles'])
+def test_import_cost(module):
+    startup = get_import_times('pass')
+    times = get_import_times(f'import {module}')
+    for lazy in LAZY_MODULES:
+        assert lazy not in times or lazy in startup, \
+            f'importing {module} imports {lazy}'
+    # The limit is generous so that starved test runs don't fail; importing
+    # the mappings and plugin support alone used to take about that long.
+    assert times[module] < 100_000
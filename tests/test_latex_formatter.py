@@ -105,3 +105,27 @@ def test_embedded_lexer():
         (Token.Escape, '$1 + z^2$'),
         (Token.Generic.Output, '\n'),
     ]
+
+
+@pytest.mark.parametrize('options,comment', [
+    ({}, r'\PYZsh{} \PYZdl{}x\PYZus{}1\PYZdl{} \PYZob{}\PYZcb{} |\PYZbs{}a|'),
+    ({'texcomments': True}, r'\PYZsh{} $x_1$ {} |\a|'),
+    ({'mathescape': True}, r'\PYZsh{} $x_1$ \PYZob{}\PYZcb{} |\PYZbs{}a|'),
+    ({'escapeinside': '||'}, r'\PYZsh{} \PYZdl{}x\PYZus{}1\PYZdl{} \PYZob{}\PYZcb{} \a'),
+])
+def test_escaping(options, comment):
+    tokens = [
+        (Token.Comment.Single, r'# $x_1$ {} |\a|'),
+        (Token.Text, '\n'),
+        (Token.Name.Custom, 'a-b'),
+        (Token.Escape, '$z^2$'),
+        (Token.String, '"~\'\n&<>%"'),
+        (Token.Text, '\n'),
+    ]
+    out = StringIO()
+    LatexFormatter(nowrap=True, **options).format(tokens, out)
+    assert out.getvalue() == (
+        r'\PY{c+c1}{' + comment + '}\n'
+        r'\PY{n+nCustom}{a\PYZhy{}b}\PY{esc}{$z^2$}'
+        r'\PY{l+s}{\PYZdq{}\PYZti{}\PYZsq{}}' '\n'
+        r'\PY{l+s}{\PYZam{}\PYZlt{}\PYZgt{}\PYZpc{}\PYZdq{}}' '\n')
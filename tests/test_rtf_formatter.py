@@ -170,7 +170,23 @@ def test_linenos_python():
                 r'}' + '\n'
                 r'\f0\sa0' + '\n'
                 r'\dntblnsbdb' + '\n'
-                r'{\cf1 1  }{\cf3 s} = {\cf2 "}{\cf2 line1}{\cf2 \\n}{\cf2 line2}{\cf2 "}\par' + '\n'
+                r'{\cf1 1  }{\cf3 s} = {\cf2 "line1\\nline2"}\par' + '\n'
+                r'}' + '\n')
+    msg = _build_message(t=t, result=result, expected=expected)
+    assert result.endswith(expected), msg
+
+
+def test_style_runs():
+    class TestStyle(Style):
+        name = 'rtf_formatter_test'
+        styles = {Token: '', String: 'bold #00ff00', Name: 'bold #00ff00'}
+
+    # consecutive tokens with the same style are put into one group, which
+    # is closed at the end of each line
+    t = 'x = "a"\n"b" y\n'
+    result = format_rtf(t, {'style': TestStyle}, PythonLexer)
+    expected = (r'{\cf1\b x} = {\cf1\b "a"}\par' + '\n'
+                r'{\cf1\b "b"} {\cf1\b y}\par' + '\n'
                 r'}' + '\n')
     msg = _build_message(t=t, result=result, expected=expected)
     assert result.endswith(expected), msg
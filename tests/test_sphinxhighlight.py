@@ -0,0 +1,204 @@
+"""
+    Pygments Sphinx highlighting extension tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import re
+from io import StringIO
+
+import pytest
+
+pytest.importorskip('sphinx')
+
+from sphinx.highlighting import PygmentsBridge  # noqa: E402
+from sphinx.testing.util import SphinxTestApp  # noqa: E402
+
+from pygments import sphinxhighlight  # noqa: E402
+
+INDEX = '''\
+Index
+=====
+
+.. toctree::
+
+{toctree}
+
+.. highlight:: c
+
+::
+
+   int main(void) {{ return 0; }}
+
+.. code-block:: python
+   :linenos:
+   :emphasize-lines: 2
+
+   def f(x):
+       return x * 2
+
+>>> print(1)  # doctest: +SKIP
+1
+
+.. code-block:: nosuchlanguage
+
+   some code
+'''
+
+DOC = '''\
+Document {n}
+==========
+
+.. code-block:: python
+
+   x = {n}
+
+.. code-block:: json
+
+   {{"key": {n}}}
+
+::
+
+   plain literal block {n}
+'''
+
+DOCS = 8
+
+
+@pytest.fixture
+def srcdir(tmp_path):
+    srcdir = tmp_path / 'src'
+    srcdir.mkdir()
+    (srcdir / 'conf.py').write_text('', encoding='utf-8')
+    names = [f'doc{n}' for n in range(DOCS)]
+    toctree = '\n'.join(f'   {name}' for name in names)
+    (srcdir / 'index.rst').write_text(INDEX.format(toctree=toctree),
+                                      encoding='utf-8')
+    for n, name in enumerate(names):
+        (srcdir / f'{name}.rst').write_text(DOC.format(n=n), encoding='utf-8')
+    return srcdir
+
+
+def build(srcdir, builddir, extension=True, parallel=0, force_all=False,
+          **confoverrides):
+    """
+    Build the project in `srcdir` into `builddir` and return the app and
+    the warnings.
+    """
+    if extension:
+        confoverrides['extensions'] = ['pygments.sphinxhighlight']
+    warnings = StringIO()
+    app = SphinxTestApp(srcdir=srcdir, builddir=builddir, status=StringIO(),
+                        warning=warnings, parallel=parallel,
+                        confoverrides=confoverrides)
+    try:
+        app.build(force_all=force_all)
+    finally:
+        app.cleanup()
+    return app, warnings.getvalue()
+
+
+def html_files(app):
+    return {path.relative_to(app.outdir): path.read_bytes()
+            for path in sorted(app.outdir.glob('*.html'))}
+
+
+def warning_messages(warnings):
+    # without colors and in a fixed order, parallel builds may reorder them
+    return sorted(re.sub(r'\x1b\[[0-9;]*m', '', warnings).splitlines())
+
+
+@pytest.fixture
+def count_highlighting(monkeypatch):
+    """
+    Count the code blocks highlighted in advance by the extension and by
+    Sphinx while writing.
+    """
+    calls = {'extension': 0, 'sphinx': []}
+    highlight = sphinxhighlight._highlight
+    highlight_block = PygmentsBridge.highlight_block
+
+    def counting_highlight(block):
+        calls['extension'] += 1
+        return highlight(block)
+
+    def counting_highlight_block(self, source, *args, **kwargs):
+        calls['sphinx'].append(source)
+        return highlight_block(self, source, *args, **kwargs)
+
+    monkeypatch.setattr(sphinxhighlight, '_highlight', counting_highlight)
+    monkeypatch.setattr(PygmentsBridge, 'highlight_block',
+                        counting_highlight_block)
+    return calls
+
+
+def test_same_output(srcdir, tmp_path):
+    plain, plain_warnings = build(srcdir, tmp_path / 'plain', extension=False)
+    app, warnings = build(srcdir, tmp_path / 'ext')
+    assert html_files(app) == html_files(plain)
+    assert warning_messages(warnings) == warning_messages(plain_warnings)
+
+
+def test_rebuild_highlights_nothing(srcdir, tmp_path, count_highlighting):
+    builddir = tmp_path / 'build'
+    app, _ = build(srcdir, builddir)
+    expected = html_files(app)
+    assert count_highlighting['extension'] > 0
+
+    count_highlighting['extension'] = 0
+    count_highlighting['sphinx'].clear()
+    # write all documents again without reading any of them
+    app, _ = build(srcdir, builddir, force_all=True)
+    assert count_highlighting['extension'] == 0
+    # only the block with the warning is left to Sphinx
+    assert count_highlighting['sphinx'] == ['some code']
+    assert html_files(app) == expected
+    assert (app.doctreedir / sphinxhighlight.CACHE_FILE).is_file()
+
+
+def test_warning_falls_back_to_sphinx(srcdir, tmp_path):
+    _, warnings = build(srcdir, tmp_path / 'build')
+    # reported once, by Sphinx, with the location of the block
+    warnings = [line for line in warning_messages(warnings)
+                if 'nosuchlanguage' in line]
+    assert len(warnings) == 1
+    assert re.search(r'index\.rst:\d+: WARNING: Pygments lexer name '
+                     r"'nosuchlanguage' is not known", warnings[0])
+
+
+def test_parallel_read(srcdir, tmp_path, monkeypatch):
+    monkeypatch.setattr(sphinxhighlight, 'MIN_PARALLEL_BLOCKS', 1)
+    merged = []
+    merge_blocks = sphinxhighlight.merge_blocks
+
+    def counting_merge_blocks(app, env, docnames, other):
+        merged.extend(docnames)
+        merge_blocks(app, env, docnames, other)
+
+    monkeypatch.setattr(sphinxhighlight, 'merge_blocks',
+                        counting_merge_blocks)
+    plain, _ = build(srcdir, tmp_path / 'plain', extension=False)
+    builddir = tmp_path / 'build'
+    app, _ = build(srcdir, builddir, parallel=2,
+                   pygments_highlight_workers=2)
+    assert html_files(app) == html_files(plain)
+    # the code blocks of the documents read in other processes are merged
+    assert merged
+    blocks = app.env.pygments_highlight_blocks
+    assert sorted(blocks) == sorted(['index'] +
+                                    [f'doc{n}' for n in range(DOCS)])
+    assert [block[:2] for block in blocks['doc3']] == [
+        ('x = 3', 'python'), ('{"key": 3}', 'json'),
+        ('plain literal block 3', 'default')]
+
+    # the blocks of changed and removed documents are replaced
+    (srcdir / 'doc3.rst').write_text('Document 3\n==========\n\n'
+                                     '::\n\n   changed\n', encoding='utf-8')
+    (srcdir / 'doc5.rst').unlink()
+    app, _ = build(srcdir, builddir, parallel=2,
+                   pygments_highlight_workers=2)
+    blocks = app.env.pygments_highlight_blocks
+    assert 'doc5' not in blocks
+    assert [block[:2] for block in blocks['doc3']] == [('changed', 'default')]
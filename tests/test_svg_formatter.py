@@ -0,0 +1,52 @@
+"""
+    Pygments SVG formatter tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+from pygments import format
+from pygments.formatters import SvgFormatter
+from pygments.token import Comment, Keyword, Name, Text
+
+TOKENS = [(Keyword, 'if'), (Text, ' '), (Keyword.Constant, 'True'),
+          (Text, ' '), (Name, 'x'), (Text, ' '), (Comment, '# a\n'),
+          (Name, 'y'), (Text, '\n')]
+
+
+def test_runs():
+    out = format(TOKENS, SvgFormatter(nowrap=True, spacehack=False))
+    assert out == (
+        '<text x="0" y="14" xml:space="preserve">'
+        '<tspan fill="#008000" font-weight="bold">if</tspan> '
+        '<tspan fill="#008000" font-weight="bold">True</tspan> x '
+        '<tspan fill="#3D7B7B" font-style="italic"># a</tspan></text>\n'
+        '<text x="0" y="33" xml:space="preserve">y</text>\n'
+        '<text x="0" y="52" xml:space="preserve"></text>'
+    )
+
+
+def test_run_merging():
+    tokens = [(Name.Builtin, 'len'), (Text, ' '), (Name.Builtin, 'str'),
+              (Keyword, 'is'), (Keyword.Constant, 'None')]
+    out = format(tokens, SvgFormatter(nowrap=True))
+    assert out == ('<text x="0" y="14" xml:space="preserve">'
+                   '<tspan fill="#008000">len&#160;str</tspan>'
+                   '<tspan fill="#008000" font-weight="bold">isNone</tspan>'
+                   '</text>')
+
+
+def test_classes():
+    fmt = SvgFormatter(classes=True, classprefix='p-')
+    out = format(TOKENS, fmt)
+    assert '<style type="text/css">\n' + fmt.get_style_defs() + '\n</style>' in out
+    assert '<tspan class="p-k">if</tspan>&#160;<tspan class="p-kc">True</tspan>' in out
+    assert '<tspan class="p-c">#&#160;a</tspan>' in out
+    assert '.p-k { fill: #008000; font-weight: bold }' in fmt.get_style_defs()
+    assert fmt.get_style_defs('svg').startswith('svg .p-')
+
+
+def test_classes_linenos():
+    out = format(TOKENS, SvgFormatter(nowrap=True, classes=True, linenos=True))
+    assert 'class="c" text-anchor="end">1</text>' in out
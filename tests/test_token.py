@@ -49,3 +49,19 @@ def test_copying():
     t = token.String
     assert t is copy.copy(t)
     assert t is copy.deepcopy(t)
+
+
+def test_contains():
+    assert token.String.Doc in token.String
+    assert token.String in token.String
+    assert token.String in token.Token
+    assert token.String not in token.String.Doc
+    assert token.Name not in token.String
+    assert 'String' not in token.String
+    assert ('Literal', 'String') not in token.String
+    # subtypes created on the fly know their ancestors as well
+    new = token.Comment.Foo.Bar
+    assert new in token.Comment.Foo
+    assert new in token.Comment
+    assert new not in token.Comment.Bar
+    assert token.Comment.Foo not in new
@@ -6,7 +6,12 @@
     :license: BSD, see LICENSE for details.
 """
 
-from pygments.lexer import RegexLexer, words
+import random
+import re
+
+import pytest
+
+from pygments.lexer import RegexLexer, bygroups, words, wordset
 from pygments.token import Token
 
 
@@ -363,3 +368,63 @@ def test_bracket_escape():
         (Token.Name, "x"),
         (Token.Text.Whitespace, "\n"),
     ]
+
+
+WORDS = ["in", "int", "into", "interval", "for", "format", "x1", "a_b"]
+
+
+def make_words_lexer(cls, flags=0):
+    class WordsLexer(RegexLexer):
+        tokens = {
+            "root": [
+                (cls(WORDS, prefix=r"\b", suffix=r"\b(\s*)(\()"),
+                 bygroups(Token.Name.Function, Token.Text, Token.Punctuation)),
+                (cls(WORDS, suffix=r"\b"), Token.Keyword),
+                (r"[a-z]+", Token.Name),
+                (r".", Token.Text),
+            ],
+        }
+    WordsLexer.flags = flags
+    return WordsLexer()
+
+
+@pytest.mark.parametrize("flags", [0, re.IGNORECASE])
+def test_wordset(flags):
+    # wordset() matches the same as words() where the words are identifiers
+    rng = random.Random(0)
+    fragments = WORDS + ["IN", "Int", "inter", "formats", "1", "_", " ", "(",
+                         " (", ".", "\n", "\u00e9"]
+    text = "".join(rng.choice(fragments) for _ in range(5000))
+    expected = list(make_words_lexer(words, flags).get_tokens(text))
+    assert list(make_words_lexer(wordset, flags).get_tokens(text)) == expected
+    assert (Token.Name.Function, "into") in expected
+    assert (Token.Keyword, "format") in expected
+
+
+def test_wordset_pattern():
+    class DashLexer(RegexLexer):
+        tokens = {
+            "root": [
+                (wordset(["a-word", "word"], pattern=r"[\w-]+",
+                         suffix=r"(?![\w-])"), Token.Keyword),
+                (r"[\w-]+", Token.Name),
+                (r"\s+", Token.Text),
+            ],
+        }
+
+    assert list(DashLexer().get_tokens("a-word a-words word")) == [
+        (Token.Keyword, "a-word"),
+        (Token.Text, " "),
+        (Token.Name, "a-words"),
+        (Token.Text, " "),
+        (Token.Keyword, "word"),
+        (Token.Text, "\n"),
+    ]
+
+
+def test_wordset_invalid_word():
+    class InvalidLexer(RegexLexer):
+        tokens = {"root": [(wordset(["a-word"]), Token.Keyword)]}
+
+    with pytest.raises(ValueError, match="'a-word' is not matched"):
+        InvalidLexer()